@@ -0,0 +1,113 @@
+import argparse
+import time
+from package.communications.decoder import TelemetryDecoder
+from package.models.telemetry import (
+    GPS,
+    Mode,
+    PrincipalAxesCoordinate,
+    State,
+    Telemetry,
+)
+
+FRAME = (
+    b"3171, 12:34:56, 1234, F, DESCENT, 512.3, 24.8, 95.42, 7.9, "
+    b"1.25, -0.75, 12.5, 0.02, -0.13, 9.81, 0.312, -0.044, 0.501, "
+    b"1450.0, 12:34:55, 530.1, 32.2401, -98.2012, 8, CXON, , 5.12, 274"
+)
+
+
+# Receiver.__parse_data before the schema-compiled decoder, kept verbatim as
+# the baseline (minus logging) so the speed-up stays measurable.
+def legacy_parse(data: str) -> Telemetry | None:
+    fields = [field.strip() for field in data.split(",")]
+
+    if len(fields) != TelemetryDecoder.FIELD_COUNT:
+        return None
+
+    team_id = int(fields[0])
+    mission_time = fields[1]
+    packet_count = int(fields[2])
+    mode = Mode(fields[3])
+    state = State(fields[4])
+    altitude = float(fields[5])
+    temperature = float(fields[6])
+    pressure = float(fields[7])
+    voltage = float(fields[8])
+    gyro_r, gyro_p, gyro_y = map(float, fields[9:12])
+    accel_r, accel_p, accel_y = map(float, fields[12:15])
+    mag_r, mag_p, mag_y = map(float, fields[15:18])
+    auto_gyro_rotation_rate = float(fields[18])
+    gps_time = fields[19]
+    gps_altitude = float(fields[20])
+    gps_latitude = float(fields[21])
+    gps_longitude = float(fields[22])
+    gps_sats = int(fields[23])
+    cmd_echo = fields[24]
+    descent_rate = float(fields[26])
+    geographic_heading = int(fields[27])
+
+    return Telemetry(
+        team_id=team_id,
+        mission_time=mission_time,
+        packet_count=packet_count,
+        mode=mode,
+        state=state,
+        altitude=altitude,
+        temperature=temperature,
+        pressure=pressure,
+        voltage=voltage,
+        gyro=PrincipalAxesCoordinate(roll=gyro_r, pitch=gyro_p, yaw=gyro_y),
+        acceleration=PrincipalAxesCoordinate(
+            roll=accel_r, pitch=accel_p, yaw=accel_y
+        ),
+        magnetometer=PrincipalAxesCoordinate(
+            roll=mag_r, pitch=mag_p, yaw=mag_y
+        ),
+        auto_gyro_rotation_rate=auto_gyro_rotation_rate,
+        gps=GPS(
+            time=gps_time,
+            altitude=gps_altitude,
+            latitude=gps_latitude,
+            longitude=gps_longitude,
+            sats=gps_sats,
+        ),
+        cmd_echo=cmd_echo,
+        descent_rate=descent_rate,
+        geographic_heading=geographic_heading,
+    )
+
+
+def packets_per_second(parse, frame, packets: int) -> float:
+    start = time.perf_counter()
+    for _ in range(packets):
+        parse(frame)
+    return packets / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare the legacy and schema-compiled decoders."
+    )
+    parser.add_argument(
+        "--packets",
+        type=int,
+        default=200_000,
+        help="Number of packets to decode per run.",
+    )
+    args = parser.parse_args()
+
+    decoder = TelemetryDecoder()
+    assert decoder.decode(FRAME) == legacy_parse(FRAME.decode())
+
+    before = packets_per_second(
+        lambda frame: legacy_parse(frame.decode()), FRAME, args.packets
+    )
+    after = packets_per_second(decoder.decode, FRAME, args.packets)
+
+    print(f"legacy  (str):   {before:>12,.0f} packets/s")
+    print(f"decoder (bytes): {after:>12,.0f} packets/s")
+    print(f"speed-up:        {after / before:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
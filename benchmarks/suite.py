@@ -0,0 +1,418 @@
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from digi.xbee.models.address import XBee64BitAddress
+from digi.xbee.models.message import XBeeMessage
+from PyQt6.QtWidgets import QApplication
+from benchmarks.decoder_benchmark import FRAME
+from package.communications.decoder import TelemetryDecoder
+from package.communications.plotter import Plotter
+from package.communications.receiver import Receiver
+from package.communications.sender import Sender
+from package.communications.store import Store
+from package.communications.telemetry_buffer import TelemetryBuffer
+from package.communications.virtual_device import VirtualRemoteDevice
+from package.config import OverflowPolicy
+from package.constants import TelemetryFieldsCSVHeadings
+from package.models.telemetry import Telemetry
+from package.ui.log.log import Log
+from package.ui.telemetry.graph import Graph
+from package.ui.telemetry.telemetry_display import TelemetryDisplay
+
+RESULTS_DIR = "benchmarks/results"
+BASELINE = "benchmarks/baseline.json"
+SIZES = (1_000, 100_000, 1_000_000)
+TIME_BUDGET = 10.0
+THRESHOLD = 0.2
+CHECK_EVERY = 64
+TELEMETRY_POOL = 1_000
+RECEIVE_CHUNK = 1_000
+
+
+@dataclass
+class BenchmarkResult:
+    case: str
+    size: int
+    operations: int
+    seconds: float
+    truncated: bool
+
+    def seconds_per_packet(self) -> float:
+        return self.seconds / self.operations if self.operations else 0.0
+
+    def packets_per_second(self) -> float:
+        return self.operations / self.seconds if self.seconds else 0.0
+
+
+class NullLog:
+    def log(self, message: str) -> None:
+        pass
+
+
+class BenchmarkDevice:
+    def __init__(self) -> None:
+        self.callbacks = []
+        self.remote_device = VirtualRemoteDevice(
+            "BENCHMARK", XBee64BitAddress.from_hex_string("0013A20041C0FFEE")
+        )
+
+    def is_open(self) -> bool:
+        return True
+
+    def add_data_received_callback(self, callback) -> None:
+        self.callbacks.append(callback)
+
+    def send_data(self, remote_device: VirtualRemoteDevice, data: str) -> None:
+        pass
+
+
+def frame(packet_count: int) -> bytes:
+    fields = FRAME.split(b",")
+    fields[2] = b" %d" % packet_count
+    return b",".join(fields)
+
+
+def telemetries(count: int) -> list[Telemetry]:
+    decoder = TelemetryDecoder()
+    return [decoder.decode(frame(i)) for i in range(count)]
+
+
+def measure(
+    step: Callable[[int], None], operations: int, budget: float
+) -> tuple[int, float, bool]:
+    start = time.perf_counter()
+    deadline = start + budget
+    for i in range(operations):
+        step(i)
+        if i % CHECK_EVERY == 0 and time.perf_counter() > deadline:
+            return i + 1, time.perf_counter() - start, True
+    return operations, time.perf_counter() - start, False
+
+
+def bench_receiver_parse(size: int, budget: float) -> tuple[int, float, bool]:
+    device = BenchmarkDevice()
+    receiver = Receiver(device, RECEIVE_CHUNK, OverflowPolicy.BLOCK)
+    receiver.set_logger(NullLog())
+    callback = device.callbacks[0]
+    messages = [
+        XBeeMessage(bytearray(b"<" + frame(i) + b">"), device.remote_device, 0)
+        for i in range(RECEIVE_CHUNK)
+    ]
+
+    def step(i: int) -> None:
+        callback(messages[i % RECEIVE_CHUNK])
+        if i % RECEIVE_CHUNK == RECEIVE_CHUNK - 1:
+            receiver.receive_batch()
+
+    return measure(step, size, budget)
+
+
+def bench_store_write(size: int, budget: float) -> tuple[int, float, bool]:
+    pool = telemetries(TELEMETRY_POOL)
+    with tempfile.TemporaryDirectory() as directory, contextlib.chdir(
+        directory
+    ):
+        store = Store()
+        try:
+            operations, seconds, truncated = measure(
+                lambda i: store.write(pool[i % TELEMETRY_POOL]), size, budget
+            )
+            # Rows are only queued by write(); draining them to disk on
+            # close is part of the cost
+            start = time.perf_counter()
+        finally:
+            store.close(None)
+        return operations, seconds + time.perf_counter() - start, truncated
+
+
+def bench_graph_update(size: int, budget: float) -> tuple[int, float, bool]:
+    pool = telemetries(TELEMETRY_POOL)
+    buffer = TelemetryBuffer()
+    graph = Graph(
+        "Benchmark",
+        ["Roll", "Pitch", "Yaw"],
+        [
+            TelemetryFieldsCSVHeadings.GYRO_R.value,
+            TelemetryFieldsCSVHeadings.GYRO_P.value,
+            TelemetryFieldsCSVHeadings.GYRO_Y.value,
+        ],
+        buffer,
+    )
+    for start in range(0, size, TELEMETRY_POOL):
+        buffer.append(pool[: min(TELEMETRY_POOL, size - start)])
+    graph.refresh()
+
+    def step(i: int) -> None:
+        buffer.append([pool[i % TELEMETRY_POOL]])
+        graph.refresh()
+
+    return measure(step, size, budget)
+
+
+def bench_telemetry_display_update(
+    size: int, budget: float
+) -> tuple[int, float, bool]:
+    pool = telemetries(TELEMETRY_POOL)
+    buffer = TelemetryBuffer()
+    display = TelemetryDisplay(buffer)
+
+    def step(i: int) -> None:
+        buffer.append([pool[i % TELEMETRY_POOL]])
+        display.update()
+
+    return measure(step, size, budget)
+
+
+def bench_log_log(size: int, budget: float) -> tuple[int, float, bool]:
+    log = Log()
+    return measure(lambda i: log.log(f"Benchmark message {i}"), size, budget)
+
+
+def bench_sender_send_next_simulated_pressure(
+    size: int, budget: float
+) -> tuple[int, float, bool]:
+    device = BenchmarkDevice()
+    sender = Sender(device, device.remote_device)
+    sender.set_logger(NullLog())
+    sender.set_simulated_pressure_commands(
+        [f"SIMP, {101325 - i % 1000}" for i in range(size)]
+    )
+    return measure(
+        lambda i: sender.send_next_simulated_pressure(), size, budget
+    )
+
+
+def bench_plotter_generate_plots(
+    size: int, budget: float
+) -> tuple[int, float, bool]:
+    pool = telemetries(TELEMETRY_POOL)
+    with tempfile.TemporaryDirectory() as directory, contextlib.chdir(
+        directory
+    ):
+        store = Store()
+        for i in range(size):
+            store.write(pool[i % TELEMETRY_POOL])
+        store.close(None)
+
+        plotter = Plotter(store.start_time, store.file_path)
+        start = time.perf_counter()
+        plotter.generate_plots(time.strftime(Plotter.TIME_FORMAT))
+        return size, time.perf_counter() - start, False
+
+
+CASES: dict[str, Callable[[int, float], tuple[int, float, bool]]] = {
+    "Receiver.__parse_data": bench_receiver_parse,
+    "Store.write": bench_store_write,
+    "Graph.update": bench_graph_update,
+    "TelemetryDisplay.update": bench_telemetry_display_update,
+    "Log.log": bench_log_log,
+    "Sender.send_next_simulated_pressure": bench_sender_send_next_simulated_pressure,
+    "Plotter.generate_plots": bench_plotter_generate_plots,
+}
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(
+    cases: list[str], sizes: list[int], budget: float
+) -> list[BenchmarkResult]:
+    results = []
+    for case in cases:
+        for size in sizes:
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(
+                devnull
+            ):
+                operations, seconds, truncated = CASES[case](size, budget)
+
+            result = BenchmarkResult(
+                case, size, operations, seconds, truncated
+            )
+            results.append(result)
+            print(
+                f"{case:<40} {size:>10,} "
+                f"{result.seconds_per_packet() * 1e6:>12.3f} us/packet "
+                f"{result.packets_per_second():>14,.0f} packets/s"
+                f"{' (time budget reached)' if truncated else ''}"
+            )
+    return results
+
+
+def save(results: list[BenchmarkResult], path: str) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(
+            {
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "commit": git_commit(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": [
+                    asdict(result)
+                    | {
+                        "seconds_per_packet": result.seconds_per_packet(),
+                        "packets_per_second": result.packets_per_second(),
+                    }
+                    for result in results
+                ],
+            },
+            file,
+            indent=2,
+        )
+    print(f"Results saved to {path}")
+
+
+def load(path: str) -> dict[tuple[str, int], float]:
+    with open(path) as file:
+        return {
+            (result["case"], result["size"]): result["seconds_per_packet"]
+            for result in json.load(file)["results"]
+        }
+
+
+def compare(baseline_path: str, current_path: str, threshold: float) -> bool:
+    baseline = load(baseline_path)
+    current = load(current_path)
+
+    regressed = False
+    for key in sorted(baseline.keys() & current.keys()):
+        before, after = baseline[key], current[key]
+        if not before:
+            continue
+
+        change = after / before - 1
+        if change > threshold:
+            status = "REGRESSION"
+            regressed = True
+        elif change < -threshold:
+            status = "improved"
+        else:
+            status = "ok"
+
+        case, size = key
+        print(
+            f"{case:<40} {size:>10,} "
+            f"{before * 1e6:>12.3f} -> {after * 1e6:>12.3f} us/packet "
+            f"{change:>+8.1%}  {status}"
+        )
+
+    for case, size in sorted(baseline.keys() - current.keys()):
+        print(f"{case:<40} {size:>10,} missing from {current_path}")
+
+    return not regressed
+
+
+def latest_result() -> str:
+    results = sorted(
+        os.path.join(RESULTS_DIR, name)
+        for name in os.listdir(RESULTS_DIR)
+        if name.endswith(".json")
+    )
+    if not results:
+        raise FileNotFoundError(f"No benchmark results in {RESULTS_DIR}")
+    return results[-1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the ground station hot paths."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmark suite.")
+    run_parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(SIZES),
+        help="Packet counts to benchmark each case at.",
+    )
+    run_parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=list(CASES),
+        default=list(CASES),
+        help="Cases to run (default: all).",
+    )
+    run_parser.add_argument(
+        "--budget",
+        type=float,
+        default=TIME_BUDGET,
+        help="Seconds each case may spend at each size before it is cut short.",
+    )
+    run_parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Path to save the JSON results to.",
+    )
+    run_parser.add_argument(
+        "--baseline",
+        action="store_true",
+        help=f"Also store the results as the baseline ({BASELINE}).",
+    )
+
+    compare_parser = commands.add_parser(
+        "compare", help="Flag regressions against the stored baseline."
+    )
+    compare_parser.add_argument(
+        "current",
+        type=str,
+        nargs="?",
+        default=None,
+        help="Results to check (default: the latest run).",
+    )
+    compare_parser.add_argument("--baseline", type=str, default=BASELINE)
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help="Relative slow-down per packet that counts as a regression.",
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        if not os.path.exists(args.baseline):
+            parser.error(
+                f"No baseline at {args.baseline}; create one with 'run --baseline'"
+            )
+        current = args.current or latest_result()
+        if not compare(args.baseline, current, args.threshold):
+            sys.exit(1)
+        return
+
+    app = QApplication(sys.argv)
+    results = run(args.cases, args.sizes, args.budget)
+    save(
+        results,
+        args.output
+        or os.path.join(RESULTS_DIR, f"{time.strftime('%Y%m%d_%H%M%S')}.json"),
+    )
+    if args.baseline:
+        save(results, BASELINE)
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
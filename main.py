@@ -1,7 +1,10 @@
+import os
 import sys
 import argparse
 from package.app import App
-from package.config import DevMode
+from package.communications.synthetic_device import SyntheticXBeeDevice
+from package.ui.telemetry.graph import Graph
+from package.config import DevMode, OverflowPolicy, Settings, StoreBackend
 
 
 def main() -> int:
@@ -14,13 +17,233 @@ def main() -> int:
         required=True,
         help="Specify the development mode: 'laptop' or 'monitor'.",
     )
+    parser.add_argument(
+        "--queue_capacity",
+        type=int,
+        default=Settings.queue_capacity,
+        help="Maximum number of received frames waiting to be decoded.",
+    )
+    parser.add_argument(
+        "--queue_policy",
+        choices=[policy.value for policy in OverflowPolicy],
+        default=None,
+        help="What to do with new frames when the receive queue is full "
+        "(default: drop-oldest, or block when replaying).",
+    )
+    parser.add_argument(
+        "--replay",
+        help="Replay a recorded flight CSV or raw .journal file instead of "
+        "connecting to an XBee.",
+    )
+    parser.add_argument(
+        "--speed",
+        default="1",
+        help="Replay speed multiplier, or 'max' to replay as fast as possible.",
+    )
+    parser.add_argument(
+        "--synthetic_rate",
+        type=float,
+        help="Generate synthetic telemetry at this rate in Hz (1 to 1000) "
+        "instead of connecting to an XBee.",
+    )
+    parser.add_argument(
+        "--loss",
+        type=float,
+        default=0.0,
+        help="Probability of dropping each synthetic packet.",
+    )
+    parser.add_argument(
+        "--duplication",
+        type=float,
+        default=0.0,
+        help="Probability of sending each synthetic packet twice.",
+    )
+    parser.add_argument(
+        "--corruption",
+        type=float,
+        default=0.0,
+        help="Probability of corrupting each synthetic packet.",
+    )
+    parser.add_argument(
+        "--binary",
+        action="store_true",
+        help="Send synthetic telemetry as packed binary frames.",
+    )
+    parser.add_argument(
+        "--flush_rows",
+        type=int,
+        default=Settings.csv_flush_rows,
+        help="Write buffered CSV rows to disk once this many are pending.",
+    )
+    parser.add_argument(
+        "--flush_interval",
+        type=float,
+        default=Settings.csv_flush_interval,
+        help="Maximum seconds CSV rows may wait before being written.",
+    )
+    parser.add_argument(
+        "--fsync_interval",
+        type=float,
+        default=Settings.csv_fsync_interval,
+        help="Also fsync the flight CSV at most every this many seconds "
+        "(default: never, leave it to the OS).",
+    )
+    parser.add_argument(
+        "--wal_sync_interval",
+        type=float,
+        default=Settings.wal_sync_interval,
+        help="Fsync the write-ahead log at most every this many seconds "
+        "(0 fsyncs every batch).",
+    )
+    parser.add_argument(
+        "--segment_size",
+        type=float,
+        help="Start a new flight CSV segment after this many MiB.",
+    )
+    parser.add_argument(
+        "--segment_interval",
+        type=float,
+        help="Start a new flight CSV segment after this many seconds.",
+    )
+    parser.add_argument(
+        "--no_compress",
+        action="store_true",
+        help="Keep closed flight CSV segments uncompressed.",
+    )
+    parser.add_argument(
+        "--store_backend",
+        choices=[backend.value for backend in StoreBackend],
+        default=Settings.store_backend.value,
+        help="Where to store telemetry during the flight. 'sqlite' writes to "
+        "logs/telemetry.sqlite3 and exports the CSV when the flight ends.",
+    )
+    parser.add_argument(
+        "--graph_capacity",
+        type=int,
+        default=Settings.graph_capacity,
+        help="Number of recent packets kept in memory for the live graphs "
+        "and telemetry display.",
+    )
+    parser.add_argument(
+        "--graph_fps",
+        type=float,
+        default=Settings.graph_fps,
+        help="How many times per second the graphs are redrawn.",
+    )
+    parser.add_argument(
+        "--no_recover",
+        action="store_true",
+        help="Start a new flight even if the last one did not close cleanly.",
+    )
     args = parser.parse_args()
 
     if args.dev_mode not in ["laptop", "monitor"]:
         print("Invalid dev_mode. Use 'laptop' or 'monitor'.")
         return 1
 
-    app = App(sys.argv, DevMode(args.dev_mode))
+    if args.queue_capacity < 1:
+        print("Invalid queue_capacity. Use a positive number of frames.")
+        return 1
+
+    if args.replay and not os.path.isfile(args.replay):
+        print(f"Replay file not found: {args.replay}")
+        return 1
+
+    if args.replay and args.synthetic_rate:
+        print("Use either --replay or --synthetic_rate, not both.")
+        return 1
+
+    if args.synthetic_rate is not None and not (
+        SyntheticXBeeDevice.MIN_RATE
+        <= args.synthetic_rate
+        <= SyntheticXBeeDevice.MAX_RATE
+    ):
+        print("Invalid synthetic_rate. Use a rate between 1 and 1000 Hz.")
+        return 1
+
+    if not all(
+        0.0 <= probability <= 1.0
+        for probability in (args.loss, args.duplication, args.corruption)
+    ):
+        print("Invalid probability. Use values between 0 and 1.")
+        return 1
+
+    if args.flush_rows < 1 or args.flush_interval <= 0:
+        print("Invalid CSV flush policy. Use positive values.")
+        return 1
+
+    if args.fsync_interval is not None and args.fsync_interval < 0:
+        print("Invalid fsync_interval. Use a non-negative number.")
+        return 1
+
+    if args.wal_sync_interval < 0:
+        print("Invalid wal_sync_interval. Use a non-negative number.")
+        return 1
+
+    if any(
+        limit is not None and limit <= 0
+        for limit in (args.segment_size, args.segment_interval)
+    ):
+        print("Invalid segment limit. Use positive values.")
+        return 1
+
+    if args.graph_capacity < Graph.TIME_VIEW:
+        print(
+            f"Invalid graph_capacity. Use at least {Graph.TIME_VIEW} packets."
+        )
+        return 1
+
+    if args.graph_fps <= 0:
+        print("Invalid graph_fps. Use a positive value.")
+        return 1
+
+    if args.binary and not args.synthetic_rate:
+        print("--binary requires --synthetic_rate.")
+        return 1
+
+    try:
+        replay_speed = None if args.speed == "max" else float(args.speed)
+    except ValueError:
+        print("Invalid speed. Use a positive number or 'max'.")
+        return 1
+    if replay_speed is not None and replay_speed <= 0:
+        print("Invalid speed. Use a positive number or 'max'.")
+        return 1
+
+    if args.queue_policy:
+        queue_policy = OverflowPolicy(args.queue_policy)
+    elif args.replay:
+        queue_policy = OverflowPolicy.BLOCK
+    else:
+        queue_policy = Settings.queue_policy
+
+    settings = Settings(
+        queue_capacity=args.queue_capacity,
+        queue_policy=queue_policy,
+        replay=args.replay,
+        replay_speed=replay_speed,
+        synthetic_rate=args.synthetic_rate,
+        synthetic_loss=args.loss,
+        synthetic_duplication=args.duplication,
+        synthetic_corruption=args.corruption,
+        synthetic_binary=args.binary,
+        store_backend=StoreBackend(args.store_backend),
+        csv_flush_rows=args.flush_rows,
+        csv_flush_interval=args.flush_interval,
+        csv_fsync_interval=args.fsync_interval,
+        wal_sync_interval=args.wal_sync_interval,
+        csv_segment_bytes=(
+            round(args.segment_size * 1024 * 1024)
+            if args.segment_size
+            else None
+        ),
+        csv_segment_interval=args.segment_interval,
+        csv_compress_segments=not args.no_compress,
+        recover=not args.no_recover,
+        graph_capacity=args.graph_capacity,
+        graph_fps=args.graph_fps,
+    )
+    app = App(sys.argv, DevMode(args.dev_mode), settings)
 
     try:
         return app.run()
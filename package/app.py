@@ -1,7 +1,10 @@
 import atexit
+import time
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import Qt, QTimer
 from package.communications.communication import Communication
+from package.communications.ingest_worker import IngestWorker
+from package.communications.pipeline_stats import PipelineStats
 from package.constants import APP_INFO, GEOMETRY
 from package.models.telemetry import (
     Telemetry,
@@ -9,7 +12,7 @@ from package.models.telemetry import (
 from package.ui.main_window import MainWindow
 import os
 import pyqtgraph as pg
-from package.config import DevMode
+from package.config import DevMode, Settings
 from package.constants import Colours
 
 
@@ -18,13 +21,17 @@ class App(QApplication):
     STYLESHEET_PATH = "./styles/styles.css"
     ONE_SECOND = 1000
     TIMER_INTERVAL = 250
+    STATS_REPORT_INTERVAL = 5
 
-    def __init__(self, sys_argv: list[str], dev_mode: DevMode) -> None:
+    def __init__(
+        self, sys_argv: list[str], dev_mode: DevMode, settings: Settings
+    ) -> None:
         super().__init__(sys_argv)
 
+        self.settings = settings
         self.__set_stylesheet()
 
-        self.communication = Communication()
+        self.communication = Communication(settings)
         self.main_window = MainWindow(
             APP_INFO,
             self.communication,
@@ -42,10 +49,38 @@ class App(QApplication):
         atexit.register(self.on_exit)
 
         self.last_recieved_packet = 0
+        self.__restore_recovered_flight()
+        self.dropped_packets = 0
+        self.stats_reported_at = time.perf_counter()
+        self.replay_reported = False
+        self.replay_packets = 0
+
+        self.ingest_worker = IngestWorker(self.communication)
+        self.ingest_worker.telemetry_received.connect(
+            self.__receive_telemetry, Qt.ConnectionType.QueuedConnection
+        )
+        self.ingest_worker.message.connect(
+            self.logger.log, Qt.ConnectionType.QueuedConnection
+        )
+
+    def __restore_recovered_flight(self) -> None:
+        recovered = self.communication.store.recovered
+        if not recovered:
+            return
+
+        self.last_recieved_packet = recovered[-1].packet_count
+        self.communication.buffer.append(recovered)
+        self.main_window.update(len(recovered))
 
     def run(self) -> int:
         self.main_window.show()
         self.__setup_timer(App.TIMER_INTERVAL)
+        self.ingest_worker.start()
+
+        virtual_port = self.settings.virtual_port()
+        if virtual_port:
+            self.logger.log(f"Connecting to virtual device {virtual_port}...")
+            self.communication.initialise_connection(virtual_port)
 
         return self.exec()
 
@@ -64,12 +99,13 @@ class App(QApplication):
             App.ONE_SECOND // App.TIMER_INTERVAL
         )
         self.main_window.update_time()
+        self.communication.process_log_queue()
+        self.__update_queue_status()
+        self.__report_stats()
 
         if not self.__check_connection():
             return
 
-        self.__receive_telemetry()
-
         if (
             self.__is_simulation_mode()
             and self.__has_simulated_pressure_commands()
@@ -77,24 +113,70 @@ class App(QApplication):
         ):
             self.__send_next_simulated_pressure()
 
-    def __receive_telemetry(self) -> None:
-        telemetry = self.__recieve_data()
-        if telemetry is None:
+    def __receive_telemetry(
+        self, telemetries: list[Telemetry], emitted_at: float
+    ) -> None:
+        received_at = time.perf_counter()
+        self.communication.stats.record(
+            PipelineStats.DISPATCH, received_at - emitted_at, len(telemetries)
+        )
+
+        for telemetry in telemetries:
+            if self.__package_drop_detected(telemetry):
+                self.logger.log(
+                    f"Telemetry packet count mismatch: {self.last_recieved_packet} -> {telemetry.packet_count}. Missing packets {[i for i in range(self.last_recieved_packet + 1, telemetry.packet_count)]}"
+                )
+
+            if self.__package_backwards_detected(telemetry):
+                self.logger.log(
+                    f"Telemetry packet count backwards: {self.last_recieved_packet} -> {telemetry.packet_count}. Resetting telemetry packet number."
+                )
+
+            self.last_recieved_packet = telemetry.packet_count
+
+        self.communication.buffer.append(telemetries)
+        self.main_window.update(len(telemetries))
+        self.communication.stats.record(
+            PipelineStats.RENDER,
+            time.perf_counter() - received_at,
+            len(telemetries),
+        )
+
+    def __update_queue_status(self) -> None:
+        queue_stats = self.communication.queue_stats()
+        if queue_stats is None:
             return
 
-        if self.__package_drop_detected(telemetry):
+        if queue_stats.dropped > self.dropped_packets:
             self.logger.log(
-                f"Telemetry packet count mismatch: {self.last_recieved_packet} -> {telemetry.packet_count}. Missing packets {[i for i in range(self.last_recieved_packet + 1, telemetry.packet_count)]}"
+                f"Receive queue overflow: dropped {queue_stats.dropped - self.dropped_packets} packets ({queue_stats.dropped} total)"
             )
+            self.dropped_packets = queue_stats.dropped
 
-        if self.__package_backwards_detected(telemetry):
+        self.main_window.update_queue_status(queue_stats)
+
+    def __report_stats(self) -> None:
+        if not self.settings.replay or self.replay_reported:
+            return
+
+        packets = self.communication.stats.packets
+        if (
+            self.communication.replay_finished()
+            and packets == self.replay_packets
+        ):
+            self.replay_reported = True
             self.logger.log(
-                f"Telemetry packet count backwards: {self.last_recieved_packet} -> {telemetry.packet_count}. Resetting telemetry packet number."
+                f"Replay finished: {self.communication.stats.report()}"
             )
+            return
+        self.replay_packets = packets
+
+        now = time.perf_counter()
+        if now - self.stats_reported_at < App.STATS_REPORT_INTERVAL:
+            return
 
-        self.main_window.update(telemetry)
-        self.communication.save(telemetry)
-        self.last_recieved_packet = telemetry.packet_count
+        self.stats_reported_at = now
+        self.logger.log(f"Replay: {self.communication.stats.report()}")
 
     def __package_drop_detected(self, telemetry: Telemetry) -> bool:
         return telemetry.packet_count - self.last_recieved_packet > 1
@@ -120,9 +202,6 @@ class App(QApplication):
 
         return True
 
-    def __recieve_data(self) -> Telemetry | None:
-        return self.communication.receive()
-
     def __is_simulation_mode(self) -> bool:
         return self.main_window.is_simulation_mode()
 
@@ -144,6 +223,11 @@ class App(QApplication):
 
     def on_exit(self) -> None:
         self.logger.log("Exiting application")
+        self.ingest_worker.stop()
+        self.logger.log(f"Pipeline: {self.communication.stats.report()}")
+        self.logger.log(
+            f"Telemetry buffer: {len(self.communication.buffer):,} rows, {self.communication.buffer.nbytes() / 2**20:.1f} MiB"
+        )
         self.communication.close()
         self.timer.stop()
         self.quit()
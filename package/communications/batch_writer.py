@@ -0,0 +1,136 @@
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from package.communications.wal import WriteAheadLog
+
+
+class BatchWriter(ABC):
+    ERRORS: tuple[type[Exception], ...] = (OSError,)
+    CLOSE_ATTEMPTS = 3
+    RETRY_DELAY = 0.1
+
+    def __init__(
+        self,
+        name: str,
+        flush_rows: int,
+        flush_interval: float,
+        fsync_interval: float | None = None,
+        wal: WriteAheadLog | None = None,
+    ) -> None:
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.wal = wal
+        self.rows: deque[list] = deque()
+        self.rows_written = 0
+        self.error: Exception | None = None
+        self.log_queue: queue.Queue[str] = queue.Queue()
+        self.closing = False
+        self.closed = False
+
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(
+            target=self.__run, name=name, daemon=True
+        )
+        self.thread.start()
+
+    @abstractmethod
+    def write_rows(self, rows: list[list]) -> None:
+        pass
+
+    @abstractmethod
+    def sync(self) -> None:
+        pass
+
+    @abstractmethod
+    def release(self) -> None:
+        pass
+
+    def restore(self, rows: list[list]) -> None:
+        self.write_rows(rows)
+        self.rows_written += len(rows)
+
+    def write(self, row: list) -> None:
+        with self.condition:
+            self.rows.append(row)
+            if len(self.rows) >= self.flush_rows:
+                self.condition.notify()
+
+    def __run(self) -> None:
+        last_fsync = time.monotonic()
+        # A batch that failed to write stays here and is retried with the
+        # next one; journaled counts its rows already in the WAL
+        batch: list[list] = []
+        journaled = 0
+        close_attempts = 0
+        while True:
+            with self.condition:
+                self.condition.wait_for(
+                    lambda: self.closing
+                    or (
+                        self.error is None
+                        and len(self.rows) >= self.flush_rows
+                    ),
+                    timeout=self.flush_interval,
+                )
+                batch.extend(self.rows)
+                self.rows.clear()
+                closing = self.closing
+
+            if batch:
+                try:
+                    if self.wal and journaled < len(batch):
+                        self.wal.append(
+                            [
+                                ",".join(map(str, row)).encode()
+                                for row in batch[journaled:]
+                            ]
+                        )
+                        journaled = len(batch)
+                    self.write_rows(batch)
+                    self.rows_written += len(batch)
+                    batch, journaled = [], 0
+                    self.error = None
+                    last_fsync = self.__sync(last_fsync, closing)
+                except self.ERRORS as e:
+                    if self.error is None:
+                        self.log_queue.put(f"{e}; retrying {len(batch)} rows")
+                    self.error = e
+
+            if closing:
+                close_attempts += 1
+                if not batch or close_attempts >= BatchWriter.CLOSE_ATTEMPTS:
+                    return
+                time.sleep(BatchWriter.RETRY_DELAY)
+
+    def __sync(self, last_fsync: float, final: bool) -> float:
+        now = time.monotonic()
+        if self.fsync_interval is None or (
+            not final and now - last_fsync < self.fsync_interval
+        ):
+            return last_fsync
+
+        try:
+            if self.wal:
+                self.wal.sync()
+            self.sync()
+        except self.ERRORS as e:
+            self.error = e
+            self.log_queue.put(str(e))
+            return last_fsync
+        return now
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        self.closed = True
+        with self.condition:
+            self.closing = True
+            self.condition.notify()
+        self.thread.join()
+        if self.wal:
+            self.wal.close()
+        self.release()
@@ -0,0 +1,220 @@
+import binascii
+import struct
+from functools import cache
+from operator import truediv
+from package.exceptions.TelemetryDecodeException import (
+    TelemetryDecodeException,
+)
+from package.models.telemetry import (
+    GPS,
+    Mode,
+    PrincipalAxesCoordinate,
+    State,
+    Telemetry,
+)
+
+
+class BinaryFrame:
+    SYNC = b"\xa5"
+    VERSION = 2
+    HEADER = struct.Struct("<cBB")
+    BODY = struct.Struct("<HIIIhhHHhhhhhhhhhhhiihH")
+    CHECKSUM = struct.Struct("<H")
+    CRC_SEED = 0xFFFF
+    FIXED_SIZE = HEADER.size + BODY.size + CHECKSUM.size
+
+    TIME_BITS = 17
+    TIME_MASK = (1 << TIME_BITS) - 1
+    MODES = tuple(Mode)
+    STATES = tuple(State)
+
+    ALTITUDE_SCALE = 10
+    TEMPERATURE_SCALE = 10
+    PRESSURE_SCALE = 100
+    VOLTAGE_SCALE = 100
+    GYRO_SCALE = 100
+    ACCELERATION_SCALE = 100
+    MAGNETOMETER_SCALE = 1000
+    ROTATION_RATE_SCALE = 10
+    COORDINATE_SCALE = 1_000_000
+    DESCENT_RATE_SCALE = 100
+    SCALES = (
+        ALTITUDE_SCALE,
+        TEMPERATURE_SCALE,
+        PRESSURE_SCALE,
+        VOLTAGE_SCALE,
+        *(GYRO_SCALE,) * 3,
+        *(ACCELERATION_SCALE,) * 3,
+        *(MAGNETOMETER_SCALE,) * 3,
+        ROTATION_RATE_SCALE,
+        ALTITUDE_SCALE,
+        COORDINATE_SCALE,
+        COORDINATE_SCALE,
+        DESCENT_RATE_SCALE,
+    )
+
+    @staticmethod
+    def encode(telemetry: Telemetry) -> bytes:
+        cmd_echo = telemetry.cmd_echo.encode()
+        try:
+            frame = (
+                BinaryFrame.HEADER.pack(
+                    BinaryFrame.SYNC, BinaryFrame.VERSION, len(cmd_echo)
+                )
+                + BinaryFrame.BODY.pack(
+                    telemetry.team_id,
+                    telemetry.packet_count,
+                    BinaryFrame.__pack_time(telemetry.mission_time)
+                    | BinaryFrame.MODES.index(telemetry.mode)
+                    << BinaryFrame.TIME_BITS
+                    | BinaryFrame.STATES.index(telemetry.state)
+                    << BinaryFrame.TIME_BITS + 1,
+                    BinaryFrame.__pack_time(telemetry.gps.time)
+                    | telemetry.gps.sats << BinaryFrame.TIME_BITS,
+                    round(telemetry.altitude * BinaryFrame.ALTITUDE_SCALE),
+                    round(
+                        telemetry.temperature * BinaryFrame.TEMPERATURE_SCALE
+                    ),
+                    round(telemetry.pressure * BinaryFrame.PRESSURE_SCALE),
+                    round(telemetry.voltage * BinaryFrame.VOLTAGE_SCALE),
+                    *BinaryFrame.__pack_axes(
+                        telemetry.gyro, BinaryFrame.GYRO_SCALE
+                    ),
+                    *BinaryFrame.__pack_axes(
+                        telemetry.acceleration, BinaryFrame.ACCELERATION_SCALE
+                    ),
+                    *BinaryFrame.__pack_axes(
+                        telemetry.magnetometer, BinaryFrame.MAGNETOMETER_SCALE
+                    ),
+                    round(
+                        telemetry.auto_gyro_rotation_rate
+                        * BinaryFrame.ROTATION_RATE_SCALE
+                    ),
+                    round(telemetry.gps.altitude * BinaryFrame.ALTITUDE_SCALE),
+                    round(
+                        telemetry.gps.latitude * BinaryFrame.COORDINATE_SCALE
+                    ),
+                    round(
+                        telemetry.gps.longitude * BinaryFrame.COORDINATE_SCALE
+                    ),
+                    round(
+                        telemetry.descent_rate * BinaryFrame.DESCENT_RATE_SCALE
+                    ),
+                    telemetry.geographic_heading,
+                )
+                + cmd_echo
+            )
+        except struct.error as e:
+            raise ValueError(
+                f"Telemetry does not fit in a binary frame: {e}"
+            ) from None
+
+        return frame + BinaryFrame.CHECKSUM.pack(
+            binascii.crc_hqx(frame, BinaryFrame.CRC_SEED)
+        )
+
+    @staticmethod
+    def __pack_time(value: str) -> int:
+        hours, minutes, seconds = map(int, value.split(":"))
+        packed = hours * 3600 + minutes * 60 + seconds
+        if not 0 <= packed <= BinaryFrame.TIME_MASK:
+            raise ValueError(f"Time {value!r} does not fit in a binary frame")
+        return packed
+
+    @staticmethod
+    def __pack_axes(
+        coordinate: PrincipalAxesCoordinate, scale: int
+    ) -> tuple[int, int, int]:
+        return (
+            round(coordinate.roll * scale),
+            round(coordinate.pitch * scale),
+            round(coordinate.yaw * scale),
+        )
+
+    @staticmethod
+    def frame_size(buffer: bytes | bytearray, start: int = 0) -> int | None:
+        if len(buffer) - start < BinaryFrame.HEADER.size:
+            return None
+
+        _, version, cmd_echo_length = BinaryFrame.HEADER.unpack_from(
+            buffer, start
+        )
+        if version != BinaryFrame.VERSION:
+            return 0
+        return BinaryFrame.FIXED_SIZE + cmd_echo_length
+
+    @staticmethod
+    def is_valid(frame: bytes | bytearray) -> bool:
+        (checksum,) = BinaryFrame.CHECKSUM.unpack_from(
+            frame, len(frame) - BinaryFrame.CHECKSUM.size
+        )
+        return checksum == binascii.crc_hqx(
+            memoryview(frame)[: -BinaryFrame.CHECKSUM.size],
+            BinaryFrame.CRC_SEED,
+        )
+
+    @staticmethod
+    def decode(frame: bytes) -> Telemetry:
+        size = BinaryFrame.frame_size(frame)
+        if size == 0:
+            raise TelemetryDecodeException(
+                f"Unsupported binary frame version {frame[1]}"
+            )
+        if size != len(frame):
+            raise TelemetryDecodeException(
+                f"Invalid binary frame. Expected {size} bytes, got {len(frame)}"
+            )
+        if not BinaryFrame.is_valid(frame):
+            raise TelemetryDecodeException("Binary frame checksum mismatch")
+
+        values = BinaryFrame.BODY.unpack_from(frame, BinaryFrame.HEADER.size)
+        mission, gps = values[2], values[3]
+        try:
+            mode = BinaryFrame.MODES[mission >> BinaryFrame.TIME_BITS & 1]
+            state = BinaryFrame.STATES[mission >> BinaryFrame.TIME_BITS + 1]
+        except IndexError:
+            raise TelemetryDecodeException(
+                "Invalid mode or state in binary frame"
+            ) from None
+
+        scaled = list(map(truediv, values[4:22], BinaryFrame.SCALES))
+
+        return Telemetry(
+            values[0],
+            BinaryFrame.__unpack_time(mission),
+            values[1],
+            mode,
+            state,
+            scaled[0],
+            scaled[1],
+            scaled[2],
+            scaled[3],
+            PrincipalAxesCoordinate(scaled[4], scaled[5], scaled[6]),
+            PrincipalAxesCoordinate(scaled[7], scaled[8], scaled[9]),
+            PrincipalAxesCoordinate(scaled[10], scaled[11], scaled[12]),
+            scaled[13],
+            GPS(
+                BinaryFrame.__unpack_time(gps),
+                scaled[14],
+                scaled[15],
+                scaled[16],
+                gps >> BinaryFrame.TIME_BITS,
+            ),
+            frame[
+                BinaryFrame.FIXED_SIZE
+                - BinaryFrame.CHECKSUM.size : -BinaryFrame.CHECKSUM.size
+            ].decode(errors="replace"),
+            scaled[17],
+            values[22],
+        )
+
+    @staticmethod
+    def __unpack_time(value: int) -> str:
+        return BinaryFrame.__format_time(value & BinaryFrame.TIME_MASK)
+
+    @staticmethod
+    @cache
+    def __format_time(seconds: int) -> str:
+        return (
+            f"{seconds // 3600:02}:{seconds // 60 % 60:02}:{seconds % 60:02}"
+        )
@@ -0,0 +1,92 @@
+import queue
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+from package.config import OverflowPolicy
+
+T = TypeVar("T")
+
+
+@dataclass
+class QueueStats:
+    depth: int
+    capacity: int
+    high_water_mark: int
+    dropped: int
+
+
+class BoundedQueue(Generic[T]):
+    def __init__(self, capacity: int, policy: OverflowPolicy) -> None:
+        if capacity <= 0:
+            raise ValueError("Queue capacity must be positive.")
+
+        self.capacity = capacity
+        self.policy = policy
+        self.items: deque[T] = deque()
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+        self.closed = False
+        self.high_water_mark = 0
+        self.dropped = 0
+
+    def put(self, item: T) -> bool:
+        with self.lock:
+            if len(self.items) >= self.capacity:
+                if self.policy == OverflowPolicy.DROP_NEWEST:
+                    self.dropped += 1
+                    return False
+                elif self.policy == OverflowPolicy.DROP_OLDEST:
+                    self.items.popleft()
+                    self.dropped += 1
+                else:
+                    while len(self.items) >= self.capacity and not self.closed:
+                        self.not_full.wait()
+                    if self.closed:
+                        self.dropped += 1
+                        return False
+
+            self.items.append(item)
+            self.high_water_mark = max(self.high_water_mark, len(self.items))
+            self.not_empty.notify()
+            return True
+
+    def get(self, timeout: float | None = None) -> T:
+        with self.lock:
+            if not self.items:
+                self.not_empty.wait(timeout)
+            if not self.items:
+                raise queue.Empty
+            item = self.items.popleft()
+            self.not_full.notify()
+            return item
+
+    def get_nowait(self) -> T:
+        with self.lock:
+            if not self.items:
+                raise queue.Empty
+            item = self.items.popleft()
+            self.not_full.notify()
+            return item
+
+    def qsize(self) -> int:
+        return len(self.items)
+
+    def empty(self) -> bool:
+        return not self.items
+
+    def close(self) -> None:
+        with self.lock:
+            self.closed = True
+            self.not_full.notify_all()
+            self.not_empty.notify_all()
+
+    def stats(self) -> QueueStats:
+        with self.lock:
+            return QueueStats(
+                depth=len(self.items),
+                capacity=self.capacity,
+                high_water_mark=self.high_water_mark,
+                dropped=self.dropped,
+            )
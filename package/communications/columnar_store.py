@@ -0,0 +1,230 @@
+import json
+import os
+from dataclasses import dataclass
+import numpy as np
+from package.communications.decoder import TelemetryDecoder
+from package.models.telemetry import Mode, State
+
+
+@dataclass
+class ColumnarFlight:
+    rows: int
+    columns: dict[str, np.ndarray]
+    categories: dict[str, list[str]]
+
+
+class ColumnarStore:
+    EXTENSION = ".columns"
+    META_FILE = "meta.json"
+    COLUMN_EXTENSION = ".bin"
+    VERSION = 2
+    INITIAL_CAPACITY = 4096
+    STRING_WIDTH = 16
+    DTYPES = {
+        int: "<i8",
+        float: "<f8",
+        str: f"S{STRING_WIDTH}",
+        Mode: "u1",
+        State: "u1",
+    }
+    CATEGORIES = {
+        heading.value: [member.value for member in field_type]
+        for heading, field_type in TelemetryDecoder.SCHEMA
+        if field_type in (Mode, State)
+    }
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self.rows = 0
+        self.capacity = ColumnarStore.INITIAL_CAPACITY
+        self.fields = [
+            (index, heading.value, np.dtype(ColumnarStore.DTYPES[field_type]))
+            for index, (heading, field_type) in enumerate(
+                TelemetryDecoder.SCHEMA
+            )
+            if field_type is not None
+        ]
+        self.categories = ColumnarStore.CATEGORIES
+        self.codes = {
+            name: {value: code for code, value in enumerate(values)}
+            for name, values in self.categories.items()
+        }
+
+        # String columns holding a value wider than their field no longer
+        # match the CSV and are not read back
+        self.lossy: set[str] = set()
+
+        os.makedirs(self.directory, exist_ok=True)
+        self.columns = {
+            name: self.__map(name, dtype, "w+")
+            for _, name, dtype in self.fields
+        }
+        self.__write_meta()
+
+    def __map(self, name: str, dtype: np.dtype, mode: str) -> np.memmap:
+        return np.memmap(
+            ColumnarStore.column_path(self.directory, name),
+            dtype=dtype,
+            mode=mode,
+            shape=(self.capacity,),
+        )
+
+    @staticmethod
+    def column_path(directory: str, name: str) -> str:
+        return os.path.join(
+            directory, f"{name}{ColumnarStore.COLUMN_EXTENSION}"
+        )
+
+    def append(self, rows: list[list]) -> None:
+        if not rows:
+            return
+
+        start, end = self.rows, self.rows + len(rows)
+        if end > self.capacity:
+            self.__grow(end)
+
+        for index, name, dtype in self.fields:
+            values = [row[index] for row in rows]
+            if name in self.codes:
+                codes = self.codes[name]
+                values = [codes[value] for value in values]
+            elif dtype.kind == "S":
+                values = [value.encode() for value in values]
+                if any(len(value) > dtype.itemsize for value in values):
+                    self.lossy.add(name)
+            self.columns[name][start:end] = values
+
+        self.rows = end
+        self.__write_meta()
+
+    def __grow(self, rows: int) -> None:
+        while self.capacity < rows:
+            self.capacity *= 2
+
+        for _, name, dtype in self.fields:
+            self.columns[name].flush()
+            self.columns[name] = self.__map(name, dtype, "r+")
+
+    def __write_meta(self) -> None:
+        ColumnarStore.__dump_meta(
+            self.directory,
+            {
+                "version": ColumnarStore.VERSION,
+                "rows": self.rows,
+                "capacity": self.capacity,
+                "columns": {name: dtype.str for _, name, dtype in self.fields},
+                "categories": self.categories,
+                "lossy": sorted(self.lossy),
+            },
+        )
+
+    @staticmethod
+    def __dump_meta(directory: str, meta: dict) -> None:
+        path = os.path.join(directory, ColumnarStore.META_FILE)
+        with open(f"{path}.{os.getpid()}.tmp", "w") as file:
+            json.dump(meta, file)
+        os.replace(f"{path}.{os.getpid()}.tmp", path)
+
+    def close(self) -> None:
+        for column in self.columns.values():
+            column.flush()
+        self.__write_meta()
+
+    @staticmethod
+    def read_meta(directory: str) -> dict | None:
+        try:
+            with open(
+                os.path.join(directory, ColumnarStore.META_FILE)
+            ) as file:
+                meta = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(meta, dict)
+            or meta.get("version") != ColumnarStore.VERSION
+            or not {"rows", "columns", "categories", "lossy"} <= set(meta)
+        ):
+            return None
+        return meta
+
+    @staticmethod
+    def read(directory: str) -> ColumnarFlight | None:
+        meta = ColumnarStore.read_meta(directory)
+        if meta is None:
+            return None
+
+        rows = meta["rows"]
+        columns = {
+            name: (
+                np.memmap(
+                    ColumnarStore.column_path(directory, name),
+                    dtype=np.dtype(dtype),
+                    mode="r",
+                    shape=(rows,),
+                )
+                if rows
+                else np.empty(0, dtype=np.dtype(dtype))
+            )
+            for name, dtype in meta["columns"].items()
+            if name not in meta["lossy"]
+        }
+        return ColumnarFlight(rows, columns, meta["categories"])
+
+    @staticmethod
+    def sign(directory: str, signature: list) -> None:
+        meta = ColumnarStore.read_meta(directory)
+        if meta is not None:
+            meta["signature"] = signature
+            ColumnarStore.__dump_meta(directory, meta)
+
+    @staticmethod
+    def write(
+        directory: str, arrays: dict[str, np.ndarray], signature: list
+    ) -> None:
+        rows = len(next(iter(arrays.values()), ()))
+        meta = ColumnarStore.read_meta(directory)
+        columns = {}
+        if meta is not None:
+            if meta.get("signature") == signature and meta["rows"] == rows:
+                columns = {
+                    name: dtype
+                    for name, dtype in meta["columns"].items()
+                    if name not in meta["lossy"]
+                }
+            else:
+                ColumnarStore.remove(directory)
+
+        os.makedirs(directory, exist_ok=True)
+        for name, array in arrays.items():
+            if array.dtype.kind == "U":
+                array = np.char.encode(array)
+            path = ColumnarStore.column_path(directory, name)
+            np.ascontiguousarray(array).tofile(f"{path}.{os.getpid()}.tmp")
+            os.replace(f"{path}.{os.getpid()}.tmp", path)
+            columns[name] = array.dtype.str
+
+        ColumnarStore.__dump_meta(
+            directory,
+            {
+                "version": ColumnarStore.VERSION,
+                "rows": rows,
+                "capacity": rows,
+                "columns": columns,
+                "categories": ColumnarStore.CATEGORIES,
+                "lossy": [],
+                "signature": signature,
+            },
+        )
+
+    @staticmethod
+    def remove(directory: str) -> None:
+        meta = ColumnarStore.read_meta(directory)
+        paths = [
+            ColumnarStore.column_path(directory, name)
+            for name in (meta["columns"] if meta else ())
+        ]
+        for path in paths + [os.path.join(directory, ColumnarStore.META_FILE)]:
+            if os.path.exists(path):
+                os.remove(path)
+        if os.path.isdir(directory) and not os.listdir(directory):
+            os.rmdir(directory)
@@ -1,5 +1,4 @@
 import time
-from serial import SerialException
 from package import constants
 from package.communications.sender import Sender
 from package.communications.receiver import Receiver
@@ -8,7 +7,13 @@ from digi.xbee.exception import (
     InvalidOperatingModeException,
 )
 import serial.tools.list_ports
+from package.communications.bounded_queue import QueueStats
+from package.communications.pipeline_stats import PipelineStats
+from package.communications.replay import ReplayDevice
 from package.communications.store import Store
+from package.communications.synthetic_device import SyntheticXBeeDevice
+from package.communications.telemetry_buffer import TelemetryBuffer
+from package.config import Settings
 from package.exceptions.SenderNotInitialisedException import (
     SenderNotInitialisedException,
 )
@@ -28,14 +33,29 @@ class Communication:
         "Sender is not initialised or not connected. Cannot %s."
     )
 
-    def __init__(self) -> None:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
         self.device = None
         self.remote_device = None
         self.sender = None
         self.receiver = None
         self.logger = None
-
-        self.store = Store()
+        self.stats = PipelineStats()
+        self.buffer = TelemetryBuffer(settings.graph_capacity)
+
+        live = settings.virtual_port() is None
+        self.store = Store(
+            settings.csv_flush_rows,
+            settings.csv_flush_interval,
+            settings.csv_fsync_interval,
+            settings.wal_sync_interval,
+            write_ahead=live,
+            recover=live and settings.recover,
+            backend=settings.store_backend,
+            segment_bytes=settings.csv_segment_bytes,
+            segment_interval=settings.csv_segment_interval,
+            compress_segments=settings.csv_compress_segments,
+        )
 
     def initialise_connection(self, port: str) -> None:
         self.__initialise_device(port)
@@ -57,8 +77,16 @@ class Communication:
 
     def __initialise_receiver(self) -> None:
         self.logger.log("Initialising receiver...")
-        self.receiver = Receiver(self.device)
+        self.receiver = Receiver(
+            self.device,
+            self.settings.queue_capacity,
+            self.settings.queue_policy,
+            self.store.journal,
+            self.stats,
+        )
         self.receiver.set_logger(self.logger)
+        if self.store.recovered:
+            self.receiver.packet_count = self.store.recovered[-1].packet_count
 
     def __initialise_sender(self) -> None:
         self.logger.log("Initialising sender...")
@@ -67,7 +95,7 @@ class Communication:
 
     def __initialise_device(self, port: str) -> None:
         self.logger.log("Initialising device...")
-        self.device = XBeeDevice(port, Communication.BAUD_RATE)
+        self.device = self.__create_device(port)
         try:
             self.device.open()
             self.logger.log(f"Device opened on port: {port}")
@@ -75,6 +103,21 @@ class Communication:
             self.logger.log(f"Error opening device: {e}")
             return
 
+    def __create_device(
+        self, port: str
+    ) -> XBeeDevice | ReplayDevice | SyntheticXBeeDevice:
+        if self.settings.replay:
+            return ReplayDevice(port, self.settings.replay_speed)
+        if self.settings.synthetic_rate:
+            return SyntheticXBeeDevice(
+                self.settings.synthetic_rate,
+                self.settings.synthetic_loss,
+                self.settings.synthetic_duplication,
+                self.settings.synthetic_corruption,
+                binary=self.settings.synthetic_binary,
+            )
+        return XBeeDevice(port, Communication.BAUD_RATE)
+
     def initialise_remote_device(self) -> None:
         if not self.device.is_open():
             self.logger.log(
@@ -105,6 +148,8 @@ class Communication:
 
     def close(self) -> None:
         self.logger.log("Closing device...")
+        if self.receiver:
+            self.receiver.close()
         if self.device and self.device.is_open():
             self.device.close()
 
@@ -128,34 +173,21 @@ class Communication:
     def remote_device_is_connected(self) -> bool:
         return self.remote_device is not None
 
-    def receive(self) -> Telemetry:
-
-        try:
-            if not self.device or not self.device.is_open():
-                self.logger.log("Device is not open. Cannot receive data.")
-
-                return None
-
-            if not self.remote_device:
-                self.logger.log(
-                    "Remote device is not found. Cannot receive data."
-                )
-
-                return None
-
-            if not self.receiver:
-                self.logger.log(
-                    "Receiver is not initialised. Cannot receive data."
-                )
-
-                return None
+    def replay_finished(self) -> bool:
+        return (
+            isinstance(self.device, ReplayDevice)
+            and self.device.finished.is_set()
+            and self.receiver is not None
+            and self.receiver.data_queue.empty()
+        )
 
-            return self.receiver.receive()
-        except (OSError, SerialException) as e:
-            self.logger.log(f"Error receiving data: {e}")
-            self.device.close()
+    def queue_stats(self) -> QueueStats | None:
+        return self.receiver.queue_stats() if self.receiver else None
 
-            return None
+    def process_log_queue(self) -> None:
+        if self.receiver:
+            self.receiver.process_log_queue()
+        self.store.process_log_queue()
 
     def has_simulated_pressure(self) -> bool:
         if not self.sender:
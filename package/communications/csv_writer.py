@@ -0,0 +1,147 @@
+import csv
+import io
+import os
+import time
+from package.communications.batch_writer import BatchWriter
+from package.communications.columnar_store import ColumnarStore
+from package.communications.flight_index import FlightIndex
+from package.communications.flight_log import FlightLog, SegmentCompressor
+from package.communications.wal import WriteAheadLog
+
+
+class CsvWriter(BatchWriter):
+    def __init__(
+        self,
+        file_path: str,
+        header: list[str],
+        flush_rows: int,
+        flush_interval: float,
+        fsync_interval: float | None = None,
+        columns: ColumnarStore | None = None,
+        wal: WriteAheadLog | None = None,
+        index: FlightIndex | None = None,
+        segment_bytes: int | None = None,
+        segment_interval: float | None = None,
+        compressor: SegmentCompressor | None = None,
+    ) -> None:
+        self.file_path = file_path
+        self.header = header
+        self.columns = columns
+        self.index = index
+        self.segment_bytes = segment_bytes
+        self.segment_interval = segment_interval
+        self.compressor = compressor
+        self.segment = len(FlightLog.closed_segments(self.file_path))
+        self.segment_start_row = 0
+
+        self.__open()
+        super().__init__(
+            "csv-writer", flush_rows, flush_interval, fsync_interval, wal
+        )
+
+    def __open(self) -> None:
+        # Unbuffered, so a failed write leaves nothing pending that could
+        # reach the file after it has been truncated back
+        self.file = open(self.file_path, mode="ab", buffering=0)
+        if self.file.tell() == 0:
+            self.__write(CsvWriter.__format([self.header]))
+        self.segment_opened = time.monotonic()
+
+    @staticmethod
+    def __format(rows: list[list]) -> bytes:
+        text = io.StringIO(newline="")
+        csv.writer(text).writerows(rows)
+        return text.getvalue().encode()
+
+    def __write(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            view = view[self.file.write(view) :]
+
+    def __should_rotate(self) -> bool:
+        if (
+            self.segment_bytes is not None
+            and self.file.tell() >= self.segment_bytes
+        ):
+            return True
+        return (
+            self.segment_interval is not None
+            and time.monotonic() - self.segment_opened >= self.segment_interval
+        )
+
+    def __rotate(self, end_row: int) -> None:
+        segment_path = FlightLog.segment_path(self.file_path, self.segment + 1)
+        self.file.close()
+        try:
+            os.replace(self.file_path, segment_path)
+        finally:
+            # Opens the next segment, or the same one again if it could
+            # not be moved
+            self.__open()
+        self.segment += 1
+        if self.index:
+            self.index.add_segment(
+                self.segment_start_row,
+                end_row,
+                os.path.basename(segment_path),
+            )
+        if self.compressor:
+            self.compressor.compress(segment_path)
+
+        self.segment_start_row = end_row
+
+    def write_rows(self, rows: list[list]) -> None:
+        start = self.file.tell()
+        chunks: list[bytes] = []
+        offsets = []
+        size = start
+        position = 0
+        while position < len(rows):
+            row_number = self.rows_written + position
+            gap = row_number % FlightIndex.OFFSET_INTERVAL
+            # Each segment also starts with an offset, so every packet can
+            # be found by seeking within its own segment
+            if self.index and (
+                gap == 0 or row_number == self.segment_start_row
+            ):
+                offsets.append((row_number, rows[position], size))
+
+            end = position + FlightIndex.OFFSET_INTERVAL - gap
+            chunks.append(CsvWriter.__format(rows[position:end]))
+            size += len(chunks[-1])
+            position = end
+
+        try:
+            self.__write(b"".join(chunks))
+            if self.columns:
+                self.columns.append(rows)
+        except self.ERRORS:
+            # The whole batch is retried, so whatever part of it reached
+            # the file is cut off again rather than written twice
+            os.ftruncate(self.file.fileno(), start)
+            self.file.seek(start)
+            raise
+
+        if self.index:
+            for row_number, row, offset in offsets:
+                self.index.add_offset(row_number, row, offset)
+            self.index.update(rows)
+        try:
+            if self.__should_rotate():
+                self.__rotate(self.rows_written + len(rows))
+            if self.index:
+                self.index.save()
+        except self.ERRORS as e:
+            # The rows are already written; rotating and saving the index
+            # are tried again after the next batch
+            self.log_queue.put(str(e))
+
+    def sync(self) -> None:
+        os.fsync(self.file.fileno())
+
+    def release(self) -> None:
+        self.file.close()
+        if self.compressor:
+            self.compressor.close()
+        if self.columns:
+            self.columns.close()
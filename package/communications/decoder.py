@@ -0,0 +1,131 @@
+from operator import call
+from typing import Callable
+from package.communications.binary_frame import BinaryFrame
+from package.constants import TelemetryFieldsCSVHeadings
+from package.exceptions.TelemetryDecodeException import (
+    TelemetryDecodeException,
+)
+from package.models.telemetry import (
+    GPS,
+    Mode,
+    PrincipalAxesCoordinate,
+    State,
+    Telemetry,
+)
+
+
+class TelemetryDecoder:
+    SEPARATOR = b","
+    SCHEMA: tuple[tuple[TelemetryFieldsCSVHeadings, type | None], ...] = (
+        (TelemetryFieldsCSVHeadings.TEAM_ID, int),
+        (TelemetryFieldsCSVHeadings.MISSION_TIME, str),
+        (TelemetryFieldsCSVHeadings.PACKET_COUNT, int),
+        (TelemetryFieldsCSVHeadings.MODE, Mode),
+        (TelemetryFieldsCSVHeadings.STATE, State),
+        (TelemetryFieldsCSVHeadings.ALTITUDE, float),
+        (TelemetryFieldsCSVHeadings.TEMPERATURE, float),
+        (TelemetryFieldsCSVHeadings.PRESSURE, float),
+        (TelemetryFieldsCSVHeadings.VOLTAGE, float),
+        (TelemetryFieldsCSVHeadings.GYRO_R, float),
+        (TelemetryFieldsCSVHeadings.GYRO_P, float),
+        (TelemetryFieldsCSVHeadings.GYRO_Y, float),
+        (TelemetryFieldsCSVHeadings.ACCEL_R, float),
+        (TelemetryFieldsCSVHeadings.ACCEL_P, float),
+        (TelemetryFieldsCSVHeadings.ACCEL_Y, float),
+        (TelemetryFieldsCSVHeadings.MAG_R, float),
+        (TelemetryFieldsCSVHeadings.MAG_P, float),
+        (TelemetryFieldsCSVHeadings.MAG_Y, float),
+        (TelemetryFieldsCSVHeadings.AUTO_GYRO_ROTATION_RATE, float),
+        (TelemetryFieldsCSVHeadings.GPS_TIME, str),
+        (TelemetryFieldsCSVHeadings.GPS_ALTITUDE, float),
+        (TelemetryFieldsCSVHeadings.GPS_LATITUDE, float),
+        (TelemetryFieldsCSVHeadings.GPS_LONGITUDE, float),
+        (TelemetryFieldsCSVHeadings.GPS_SATS, int),
+        (TelemetryFieldsCSVHeadings.CMD_ECHO, str),
+        (TelemetryFieldsCSVHeadings.BLANK, None),
+        (TelemetryFieldsCSVHeadings.DESC_RATE, float),
+        (TelemetryFieldsCSVHeadings.GEOG_HEAD, int),
+    )
+    FIELD_COUNT = len(SCHEMA)
+
+    def __init__(self) -> None:
+        self.converters = tuple(
+            TelemetryDecoder.__compile(field_type)
+            for _, field_type in TelemetryDecoder.SCHEMA
+        )
+
+    @staticmethod
+    def __compile(field_type: type | None) -> Callable[[bytes], object]:
+        if field_type is None:
+            return TelemetryDecoder.__blank
+        if field_type is str:
+            return TelemetryDecoder.__text
+        if field_type in (Mode, State):
+            return TelemetryDecoder.__enum_lookup(field_type)
+        return field_type
+
+    @staticmethod
+    def __blank(_: bytes) -> None:
+        return None
+
+    @staticmethod
+    def __text(field: bytes) -> str:
+        return field.strip().decode()
+
+    @staticmethod
+    def __enum_lookup(
+        enum: type[Mode] | type[State],
+    ) -> Callable[[bytes], Mode | State]:
+        members = {member.value.encode(): member for member in enum}
+
+        def lookup(field: bytes) -> Mode | State:
+            try:
+                return members[field.strip()]
+            except KeyError:
+                raise ValueError(
+                    f"{field.strip().decode(errors='replace')!r} is not a valid {enum.__name__}"
+                ) from None
+
+        return lookup
+
+    def decode(self, data: bytes | bytearray | str) -> Telemetry:
+        if isinstance(data, str):
+            data = data.encode()
+        elif isinstance(data, bytearray):
+            data = bytes(data)
+
+        if data.startswith(BinaryFrame.SYNC):
+            return BinaryFrame.decode(data)
+
+        fields = data.split(TelemetryDecoder.SEPARATOR)
+        if len(fields) != TelemetryDecoder.FIELD_COUNT:
+            raise TelemetryDecodeException(
+                f"Invalid data format. Expected {TelemetryDecoder.FIELD_COUNT} fields, got {len(fields)}"
+            )
+
+        try:
+            values = list(map(call, self.converters, fields))
+        except ValueError as e:
+            raise TelemetryDecodeException(
+                f"Invalid data format. {e}"
+            ) from None
+
+        return Telemetry(
+            values[0],
+            values[1],
+            values[2],
+            values[3],
+            values[4],
+            values[5],
+            values[6],
+            values[7],
+            values[8],
+            PrincipalAxesCoordinate(values[9], values[10], values[11]),
+            PrincipalAxesCoordinate(values[12], values[13], values[14]),
+            PrincipalAxesCoordinate(values[15], values[16], values[17]),
+            values[18],
+            GPS(values[19], values[20], values[21], values[22], values[23]),
+            values[24],
+            values[26],
+            values[27],
+        )
@@ -0,0 +1,158 @@
+import glob
+import hashlib
+import os
+import numpy as np
+from package.communications.columnar_store import ColumnarStore
+from package.communications.flight_log import FlightLog
+from package.communications.wal import WriteAheadLog
+
+
+class FlightCache:
+    LOGS_DIR = "logs"
+    PATTERN = f"Flight_*{ColumnarStore.EXTENSION}"
+    SAMPLE_BYTES = 64 * 1024
+    MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+    def __init__(self, csv_file: str) -> None:
+        self.csv_file = csv_file
+        self.directory = (
+            f"{os.path.splitext(csv_file)[0]}{ColumnarStore.EXTENSION}"
+        )
+        self.meta_path = os.path.join(self.directory, ColumnarStore.META_FILE)
+
+    def signature(self) -> list:
+        return [
+            [
+                os.path.basename(path),
+                stat.st_size,
+                stat.st_mtime_ns,
+                FlightCache.__sample_hash(path, stat.st_size),
+            ]
+            for path in FlightLog.segments(self.csv_file)
+            for stat in [os.stat(path)]
+        ]
+
+    @staticmethod
+    def __sample_hash(path: str, size: int) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, mode="rb") as file:
+            digest.update(file.read(FlightCache.SAMPLE_BYTES))
+            if size > FlightCache.SAMPLE_BYTES:
+                file.seek(
+                    max(
+                        FlightCache.SAMPLE_BYTES,
+                        size - FlightCache.SAMPLE_BYTES,
+                    )
+                )
+                digest.update(file.read())
+        return digest.hexdigest()
+
+    @staticmethod
+    def __unfinished(directory: str) -> bool:
+        # The store of a flight that is still being written, or is waiting
+        # to be recovered, belongs to its CsvWriter
+        return os.path.exists(
+            f"{directory.removesuffix(ColumnarStore.EXTENSION)}"
+            f"{WriteAheadLog.EXTENSION}"
+        )
+
+    def load(
+        self, columns: list[str], signature: list
+    ) -> dict[str, np.ndarray] | None:
+        meta = ColumnarStore.read_meta(self.directory)
+        if meta is None:
+            return None
+
+        if "signature" not in meta:
+            # The store written during the flight becomes the cache once
+            # it holds every row of the CSV
+            if meta["rows"] != FlightLog.count_rows(self.csv_file):
+                return None
+            ColumnarStore.sign(self.directory, signature)
+        elif meta["signature"] != signature:
+            return None
+
+        flight = ColumnarStore.read(self.directory)
+        if flight is None or not set(columns) <= set(flight.columns):
+            return None
+
+        try:
+            os.utime(self.meta_path)
+        except OSError:
+            pass
+        return {name: flight.columns[name] for name in columns}
+
+    def store(self, arrays: dict[str, np.ndarray], signature: list) -> None:
+        if FlightCache.__unfinished(self.directory):
+            return
+
+        try:
+            ColumnarStore.write(self.directory, arrays, signature)
+        except OSError:
+            return
+
+        # Only flights under the logs root share its size budget; caches
+        # for CSVs elsewhere are never evicted on their behalf
+        logs_dir = os.path.abspath(FlightCache.LOGS_DIR)
+        if (
+            os.path.commonpath([logs_dir, os.path.abspath(self.directory)])
+            == logs_dir
+        ):
+            FlightCache.evict(logs_dir, keep=self.directory)
+
+    @staticmethod
+    def __size(directory: str) -> int:
+        return sum(
+            entry.stat().st_size
+            for entry in os.scandir(directory)
+            if entry.is_file()
+        )
+
+    @staticmethod
+    def evict(
+        logs_dir: str = LOGS_DIR,
+        max_bytes: int = MAX_BYTES,
+        keep: str | None = None,
+    ) -> int:
+        caches = []
+        root = os.path.realpath(logs_dir)
+        for directory in glob.glob(
+            os.path.join(logs_dir, "*", FlightCache.PATTERN)
+        ):
+            # Links anywhere on the path could lead out of the logs root
+            if (
+                os.path.realpath(directory)
+                != os.path.join(root, os.path.relpath(directory, logs_dir))
+                or not os.path.isdir(directory)
+                or FlightCache.__unfinished(directory)
+            ):
+                continue
+            meta = ColumnarStore.read_meta(directory)
+            if meta is None or "signature" not in meta:
+                continue
+
+            caches.append(
+                (
+                    os.path.getmtime(
+                        os.path.join(directory, ColumnarStore.META_FILE)
+                    ),
+                    directory,
+                    FlightCache.__size(directory),
+                )
+            )
+
+        total = sum(size for _, _, size in caches)
+        removed = 0
+        for _, directory, size in sorted(caches):
+            if total <= max_bytes:
+                break
+            if keep and os.path.abspath(directory) == os.path.abspath(keep):
+                continue
+
+            try:
+                ColumnarStore.remove(directory)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
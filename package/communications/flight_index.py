@@ -0,0 +1,126 @@
+import json
+import math
+import os
+from package.communications.decoder import TelemetryDecoder
+from package.communications.flight_log import FlightLog
+from package.constants import TelemetryFieldsCSVHeadings
+
+
+class FlightIndex:
+    EXTENSION = ".index.json"
+    VERSION = 1
+    OFFSET_INTERVAL = 1000
+    FIELDS = [heading for heading, _ in TelemetryDecoder.SCHEMA]
+    PACKET_COUNT = FIELDS.index(TelemetryFieldsCSVHeadings.PACKET_COUNT)
+    MISSION_TIME = FIELDS.index(TelemetryFieldsCSVHeadings.MISSION_TIME)
+    CHANNELS = [
+        (index, heading.value)
+        for index, (heading, field_type) in enumerate(TelemetryDecoder.SCHEMA)
+        if field_type in (int, float)
+    ]
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+        self.rows = 0
+        self.first_packet = None
+        self.last_packet = None
+        self.first_mission_time = None
+        self.last_mission_time = None
+        self.channels: dict[str, list[float | None]] = {
+            name: [None, None] for _, name in FlightIndex.CHANNELS
+        }
+        self.offsets: list[list[int]] = []
+        self.segments: list[list] = []
+
+    def add_offset(self, row_number: int, row: list, byte_offset: int) -> None:
+        self.offsets.append(
+            [row_number, row[FlightIndex.PACKET_COUNT], byte_offset]
+        )
+
+    def add_segment(self, first_row: int, end_row: int, name: str) -> None:
+        self.segments.append([first_row, end_row, name])
+
+    def update(self, rows: list[list]) -> None:
+        if not rows:
+            return
+
+        if self.rows == 0:
+            self.first_packet = rows[0][FlightIndex.PACKET_COUNT]
+            self.first_mission_time = rows[0][FlightIndex.MISSION_TIME]
+        self.last_packet = rows[-1][FlightIndex.PACKET_COUNT]
+        self.last_mission_time = rows[-1][FlightIndex.MISSION_TIME]
+        self.rows += len(rows)
+
+        for index, name in FlightIndex.CHANNELS:
+            values = [row[index] for row in rows if math.isfinite(row[index])]
+            if not values:
+                continue
+
+            bounds = self.channels[name]
+            low, high = min(values), max(values)
+            bounds[0] = low if bounds[0] is None else min(bounds[0], low)
+            bounds[1] = high if bounds[1] is None else max(bounds[1], high)
+
+    def offset_for_packet(self, packet_count: int) -> tuple[str, int] | None:
+        if not self.offsets:
+            return None
+
+        row_number, _, byte_offset = self.offsets[0]
+        for offset in self.offsets:
+            if offset[1] > packet_count:
+                break
+            row_number, _, byte_offset = offset
+        return self.__segment_for_row(row_number), byte_offset
+
+    def __segment_for_row(self, row_number: int) -> str:
+        for first_row, end_row, name in self.segments:
+            if first_row <= row_number < end_row:
+                return FlightLog.resolve(
+                    os.path.join(os.path.dirname(self.file_path), name)
+                )
+        return f"{self.file_path.removesuffix(FlightIndex.EXTENSION)}.csv"
+
+    def save(self) -> None:
+        with open(f"{self.file_path}.tmp", "w") as file:
+            json.dump(
+                {
+                    "version": FlightIndex.VERSION,
+                    "rows": self.rows,
+                    "first_packet": self.first_packet,
+                    "last_packet": self.last_packet,
+                    "first_mission_time": self.first_mission_time,
+                    "last_mission_time": self.last_mission_time,
+                    "channels": {
+                        name: {"min": low, "max": high}
+                        for name, (low, high) in self.channels.items()
+                    },
+                    "offset_interval": FlightIndex.OFFSET_INTERVAL,
+                    "offsets": self.offsets,
+                    "segments": self.segments,
+                },
+                file,
+            )
+        os.replace(f"{self.file_path}.tmp", self.file_path)
+
+    def remove(self) -> None:
+        if os.path.exists(self.file_path):
+            os.remove(self.file_path)
+
+    @staticmethod
+    def load(file_path: str) -> "FlightIndex":
+        with open(file_path) as file:
+            data = json.load(file)
+
+        index = FlightIndex(file_path)
+        index.rows = data["rows"]
+        index.first_packet = data["first_packet"]
+        index.last_packet = data["last_packet"]
+        index.first_mission_time = data["first_mission_time"]
+        index.last_mission_time = data["last_mission_time"]
+        index.channels = {
+            name: [bounds["min"], bounds["max"]]
+            for name, bounds in data["channels"].items()
+        }
+        index.offsets = data["offsets"]
+        index.segments = data.get("segments", [])
+        return index
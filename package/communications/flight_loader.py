@@ -0,0 +1,114 @@
+from typing import Iterator
+import numpy as np
+import pandas as pd
+from package.communications.decoder import TelemetryDecoder
+from package.communications.flight_cache import FlightCache
+from package.communications.flight_log import FlightLog
+from package.models.telemetry import Mode, State
+
+
+class FlightLoader:
+    CHUNK_ROWS = 100_000
+    DTYPES = {
+        int: "int64",
+        float: "float64",
+        str: "object",
+        Mode: pd.CategoricalDtype([mode.value for mode in Mode]),
+        State: pd.CategoricalDtype([state.value for state in State]),
+    }
+    COLUMNS = {
+        heading.value: dtype
+        for (heading, _), dtype in zip(
+            TelemetryDecoder.SCHEMA,
+            map(
+                DTYPES.get,
+                (field_type for _, field_type in TelemetryDecoder.SCHEMA),
+            ),
+        )
+        if dtype is not None
+    }
+
+    @staticmethod
+    def dtypes(columns: list[str] | None = None) -> dict:
+        if columns is None:
+            return dict(FlightLoader.COLUMNS)
+        return {column: FlightLoader.COLUMNS[column] for column in columns}
+
+    @staticmethod
+    def chunks(
+        csv_file: str,
+        columns: list[str] | None = None,
+        chunk_rows: int = CHUNK_ROWS,
+    ) -> Iterator[pd.DataFrame]:
+        dtypes = FlightLoader.dtypes(columns)
+        for path in FlightLog.segments(csv_file):
+            with pd.read_csv(
+                path,
+                usecols=list(dtypes),
+                dtype=dtypes,
+                chunksize=chunk_rows,
+            ) as reader:
+                for chunk in reader:
+                    if not chunk.empty:
+                        yield chunk[list(dtypes)]
+
+    @staticmethod
+    def load(
+        csv_file: str, columns: list[str] | None = None, cached: bool = True
+    ) -> pd.DataFrame:
+        dtypes = FlightLoader.dtypes(columns)
+        cache = FlightCache(csv_file) if cached else None
+        signature = cache.signature() if cache else None
+        if signature:
+            arrays = cache.load(list(dtypes), signature)
+            if arrays is not None:
+                return FlightLoader.__frame(arrays, dtypes)
+
+        frames = [
+            frame
+            for frame in (
+                pd.read_csv(path, usecols=list(dtypes), dtype=dtypes)
+                for path in FlightLog.segments(csv_file)
+            )
+            if not frame.empty
+        ]
+        if not frames:
+            return pd.DataFrame(
+                {
+                    column: pd.Series(dtype=dtype)
+                    for column, dtype in dtypes.items()
+                }
+            )
+
+        data = pd.concat(frames, ignore_index=True)[list(dtypes)]
+        if signature:
+            cache.store(FlightLoader.__arrays(data), signature)
+        return data
+
+    @staticmethod
+    def __arrays(data: pd.DataFrame) -> dict[str, np.ndarray]:
+        arrays = {}
+        for column in data.columns:
+            series = data[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                arrays[column] = series.cat.codes.to_numpy()
+            elif series.dtype == object:
+                arrays[column] = series.fillna("").to_numpy(dtype=str)
+            else:
+                arrays[column] = series.to_numpy()
+        return arrays
+
+    @staticmethod
+    def __frame(arrays: dict[str, np.ndarray], dtypes: dict) -> pd.DataFrame:
+        columns = {}
+        for column, dtype in dtypes.items():
+            array = np.asarray(arrays[column])
+            if isinstance(dtype, pd.CategoricalDtype):
+                columns[column] = pd.Categorical.from_codes(array, dtype=dtype)
+            elif dtype == "object":
+                if array.dtype.kind == "S":
+                    array = np.char.decode(array, errors="replace")
+                columns[column] = array.astype(object)
+            else:
+                columns[column] = array
+        return pd.DataFrame(columns, copy=False)
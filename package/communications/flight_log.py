@@ -0,0 +1,114 @@
+import csv
+import glob
+import gzip
+import os
+import queue
+import shutil
+import threading
+from functools import partial
+from typing import IO, Iterator
+
+
+class FlightLog:
+    COMPRESSED_EXTENSION = ".gz"
+    READ_BYTES = 1024 * 1024
+
+    @staticmethod
+    def segment_path(file_path: str, number: int) -> str:
+        base, extension = os.path.splitext(file_path)
+        return f"{base}.{number:04d}{extension}"
+
+    @staticmethod
+    def closed_segments(file_path: str) -> list[str]:
+        base, extension = os.path.splitext(file_path)
+        segments = {}
+        for path in glob.glob(f"{glob.escape(base)}.[0-9][0-9][0-9][0-9]*"):
+            name = path.removesuffix(FlightLog.COMPRESSED_EXTENSION)
+            if not name.endswith(extension):
+                continue
+            if name not in segments or path == name:
+                segments[name] = path
+        return [segments[name] for name in sorted(segments)]
+
+    @staticmethod
+    def segments(file_path: str) -> list[str]:
+        segments = FlightLog.closed_segments(file_path)
+        if os.path.exists(file_path):
+            segments.append(file_path)
+        return segments
+
+    @staticmethod
+    def resolve(segment_path: str) -> str:
+        if os.path.exists(segment_path):
+            return segment_path
+        return f"{segment_path}{FlightLog.COMPRESSED_EXTENSION}"
+
+    @staticmethod
+    def open(path: str) -> IO[str]:
+        if path.endswith(FlightLog.COMPRESSED_EXTENSION):
+            return gzip.open(path, mode="rt", newline="")
+        return open(path, newline="")
+
+    @staticmethod
+    def rows(file_path: str) -> Iterator[list[str]]:
+        for path in FlightLog.segments(file_path):
+            with FlightLog.open(path) as file:
+                reader = csv.reader(file)
+                next(reader, None)
+                yield from reader
+
+    @staticmethod
+    def count_rows(file_path: str) -> int:
+        rows = 0
+        for path in FlightLog.segments(file_path):
+            with (
+                gzip.open(path, mode="rb")
+                if path.endswith(FlightLog.COMPRESSED_EXTENSION)
+                else open(path, mode="rb")
+            ) as file:
+                lines = sum(
+                    chunk.count(b"\n")
+                    for chunk in iter(
+                        partial(file.read, FlightLog.READ_BYTES), b""
+                    )
+                )
+            rows += max(0, lines - 1)
+        return rows
+
+    @staticmethod
+    def remove(file_path: str) -> None:
+        for path in FlightLog.segments(file_path):
+            os.remove(path)
+
+
+class SegmentCompressor:
+    def __init__(self) -> None:
+        self.segments: queue.Queue[str | None] = queue.Queue()
+        self.error: OSError | None = None
+        self.thread = threading.Thread(
+            target=self.__run, name="segment-compressor", daemon=True
+        )
+        self.thread.start()
+
+    def compress(self, path: str) -> None:
+        self.segments.put(path)
+
+    def __run(self) -> None:
+        while (path := self.segments.get()) is not None:
+            compressed = f"{path}{FlightLog.COMPRESSED_EXTENSION}"
+            try:
+                with open(path, mode="rb") as source, gzip.open(
+                    f"{compressed}.tmp", mode="wb"
+                ) as target:
+                    shutil.copyfileobj(source, target)
+                os.replace(f"{compressed}.tmp", compressed)
+                os.remove(path)
+            except OSError as e:
+                self.error = e
+
+    def close(self) -> None:
+        if not self.thread.is_alive():
+            return
+
+        self.segments.put(None)
+        self.thread.join()
@@ -0,0 +1,115 @@
+from dataclasses import dataclass
+from package.communications.binary_frame import BinaryFrame
+
+
+@dataclass
+class FramerStats:
+    frames: int = 0
+    partial_frames: int = 0
+    merged_frames: int = 0
+    garbage_bytes: int = 0
+
+
+class Framer:
+    FRAME_START = b"<"
+    FRAME_END = b">"
+    SEPARATORS = b" \t\r\n"
+    MAX_FRAME_SIZE = 1024
+
+    def __init__(self) -> None:
+        self.buffers: dict[bytes, bytearray] = {}
+        self.scan_offsets: dict[bytes, int] = {}
+        self.stats = FramerStats()
+
+    def feed(self, source: bytes, data: bytes | bytearray) -> list[bytes]:
+        buffer = self.buffers.setdefault(source, bytearray())
+        carried_over = len(buffer) > 0
+        scan = self.scan_offsets.pop(source, 1)
+        buffer += data
+
+        frames = []
+        position = 0
+        start = 0 if carried_over else None
+
+        while True:
+            if start is None:
+                start = Framer.__find_start(buffer, position, len(buffer))
+                if start == -1:
+                    self.__discard(buffer, position, len(buffer))
+                    position = len(buffer)
+                    break
+                self.__discard(buffer, position, start)
+                scan = start + 1
+
+            if buffer.startswith(BinaryFrame.SYNC, start):
+                size = BinaryFrame.frame_size(buffer, start)
+                if size is None or len(buffer) - start < size:
+                    position = start
+                    break
+
+                if not size or not BinaryFrame.is_valid(
+                    buffer[start : start + size]
+                ):
+                    self.__discard(buffer, start, start + 1)
+                    position = start + 1
+                    start = None
+                    carried_over = False
+                    continue
+
+                frames.append(bytes(buffer[start : start + size]))
+                if carried_over:
+                    self.stats.partial_frames += 1
+                    carried_over = False
+                position = start + size
+                start = None
+                continue
+
+            end = buffer.find(Framer.FRAME_END, scan)
+            restart = Framer.__find_start(
+                buffer, scan, end if end != -1 else len(buffer)
+            )
+            if restart != -1:
+                self.__discard(buffer, start, restart)
+                start, scan = restart, restart + 1
+                carried_over = False
+                continue
+
+            if end == -1:
+                if len(buffer) - start > Framer.MAX_FRAME_SIZE:
+                    self.__discard(buffer, start, len(buffer))
+                    position = len(buffer)
+                else:
+                    position = start
+                    self.scan_offsets[source] = len(buffer) - start
+                break
+
+            frames.append(bytes(buffer[start + 1 : end]))
+            if carried_over:
+                self.stats.partial_frames += 1
+                carried_over = False
+            position = end + 1
+            start = None
+
+        del buffer[:position]
+
+        self.stats.frames += len(frames)
+        self.stats.merged_frames += max(0, len(frames) - 1)
+
+        return frames
+
+    @staticmethod
+    def __find_start(buffer: bytearray, start: int, end: int) -> int:
+        ascii_start = buffer.find(Framer.FRAME_START, start, end)
+        binary_start = buffer.find(
+            BinaryFrame.SYNC, start, ascii_start if ascii_start != -1 else end
+        )
+        return binary_start if binary_start != -1 else ascii_start
+
+    def __discard(self, buffer: bytearray, start: int, end: int) -> None:
+        if end > start:
+            self.stats.garbage_bytes += len(
+                buffer[start:end].translate(None, Framer.SEPARATORS)
+            )
+
+    def pending_bytes(self) -> int:
+        return sum(len(buffer) for buffer in self.buffers.values())
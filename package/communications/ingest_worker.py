@@ -0,0 +1,76 @@
+import time
+from PyQt6.QtCore import QThread, pyqtSignal
+from serial import SerialException
+from package.communications.communication import Communication
+from package.communications.pipeline_stats import PipelineStats
+from package.models.telemetry import Telemetry
+
+
+class IngestWorker(QThread):
+    POLL_TIMEOUT = 0.05
+    IDLE_INTERVAL = 100
+    EMIT_INTERVAL = 0.1
+
+    telemetry_received = pyqtSignal(list, float)
+    message = pyqtSignal(str)
+
+    def __init__(self, communication: Communication) -> None:
+        super().__init__()
+        self.communication = communication
+
+    def run(self) -> None:
+        pending: list[Telemetry] = []
+        last_emitted_at = time.perf_counter()
+
+        while not self.isInterruptionRequested():
+            receiver = self.communication.receiver
+            if not self.communication.device_is_connected() or not receiver:
+                self.msleep(IngestWorker.IDLE_INTERVAL)
+                continue
+
+            try:
+                telemetries = receiver.receive_batch(
+                    timeout=IngestWorker.POLL_TIMEOUT
+                )
+            except (OSError, SerialException) as e:
+                self.message.emit(f"Error receiving data: {e}")
+                self.communication.device.close()
+                continue
+
+            if telemetries:
+                self.__store(telemetries)
+                pending.extend(telemetries)
+
+            now = time.perf_counter()
+            if pending and now - last_emitted_at >= IngestWorker.EMIT_INTERVAL:
+                self.telemetry_received.emit(pending, now)
+                pending = []
+                last_emitted_at = now
+
+        # Frames already queued when the worker is stopped still belong in
+        # the flight log
+        receiver = self.communication.receiver
+        if receiver and self.communication.device_is_connected():
+            try:
+                telemetries = receiver.receive_batch()
+            except (OSError, SerialException) as e:
+                self.message.emit(f"Error receiving data: {e}")
+                telemetries = []
+            if telemetries:
+                self.__store(telemetries)
+
+    def __store(self, telemetries: list[Telemetry]) -> None:
+        stored_at = time.perf_counter()
+        for telemetry in telemetries:
+            self.communication.save(telemetry)
+
+        self.communication.stats.record(
+            PipelineStats.STORE,
+            time.perf_counter() - stored_at,
+            len(telemetries),
+        )
+        self.communication.stats.processed(len(telemetries))
+
+    def stop(self) -> None:
+        self.requestInterruption()
+        self.wait()
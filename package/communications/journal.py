@@ -0,0 +1,108 @@
+import os
+import struct
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterator
+
+
+@dataclass
+class JournalEntry:
+    timestamp_ns: int
+    source: bytes
+    payload: bytes
+
+
+class Journal:
+    EXTENSION = ".journal"
+    MAGIC = b"LNJ1"
+    ENTRY_HEADER = struct.Struct("<Q8sI")
+    UNKNOWN_SOURCE = bytes(8)
+    FLUSH_INTERVAL = 0.5
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+        self.pending: deque[tuple[int, bytes, bytes]] = deque()
+        self.entries = 0
+
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+        if os.path.exists(self.file_path):
+            os.truncate(self.file_path, Journal.__valid_length(self.file_path))
+
+        self.file = open(self.file_path, mode="ab")
+        if self.file.tell() == 0:
+            self.file.write(Journal.MAGIC)
+
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(
+            target=self.__run, name="journal-writer", daemon=True
+        )
+        self.thread.start()
+
+    def append(self, source: bytes, payload: bytes | bytearray) -> None:
+        self.pending.append((time.monotonic_ns(), source, payload))
+
+    def __run(self) -> None:
+        while not self.stop_event.wait(Journal.FLUSH_INTERVAL):
+            self.__flush()
+
+    def __flush(self) -> None:
+        chunks = []
+        while self.pending:
+            timestamp_ns, source, payload = self.pending.popleft()
+            chunks.append(
+                Journal.ENTRY_HEADER.pack(timestamp_ns, source, len(payload))
+            )
+            chunks.append(payload)
+
+        if not chunks:
+            return
+
+        self.file.write(b"".join(chunks))
+        self.file.flush()
+        self.entries += len(chunks) // 2
+
+    def close(self) -> None:
+        if self.file.closed:
+            return
+
+        self.stop_event.set()
+        self.thread.join()
+        self.__flush()
+        self.file.close()
+
+    def is_empty(self) -> bool:
+        if self.pending:
+            return False
+        return os.path.getsize(self.file_path) <= len(Journal.MAGIC)
+
+    @staticmethod
+    def __valid_length(file_path: str) -> int:
+        length = len(Journal.MAGIC)
+        try:
+            for entry in Journal.read(file_path):
+                length += Journal.ENTRY_HEADER.size + len(entry.payload)
+        except ValueError:
+            return 0
+        return length
+
+    @staticmethod
+    def read(file_path: str) -> Iterator[JournalEntry]:
+        with open(file_path, mode="rb") as file:
+            if file.read(len(Journal.MAGIC)) != Journal.MAGIC:
+                raise ValueError(f"{file_path} is not a telemetry journal")
+
+            while True:
+                header = file.read(Journal.ENTRY_HEADER.size)
+                if len(header) < Journal.ENTRY_HEADER.size:
+                    return
+
+                timestamp_ns, source, length = Journal.ENTRY_HEADER.unpack(
+                    header
+                )
+                payload = file.read(length)
+                if len(payload) < length:
+                    return
+
+                yield JournalEntry(timestamp_ns, source, payload)
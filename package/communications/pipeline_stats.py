@@ -0,0 +1,84 @@
+import threading
+import time
+from dataclasses import dataclass
+
+
+@dataclass
+class StageStats:
+    packets: int = 0
+    total: float = 0.0
+    maximum: float = 0.0
+
+    def mean(self) -> float:
+        return self.total / self.packets if self.packets else 0.0
+
+
+class PipelineStats:
+    QUEUE = "queue"
+    DECODE = "decode"
+    STORE = "store"
+    DISPATCH = "dispatch"
+    RENDER = "render"
+    FRAME = "frame"
+    STAGES = (QUEUE, DECODE, STORE, DISPATCH, RENDER, FRAME)
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.stages = {stage: StageStats() for stage in PipelineStats.STAGES}
+        self.packets = 0
+        self.dropped_frames = 0
+        self.started_at = None
+        self.last_processed_at = None
+
+    def record(
+        self,
+        stage: str,
+        seconds: float,
+        packets: int = 1,
+        maximum: float | None = None,
+    ) -> None:
+        # Stages are timed per batch, so the mean is amortised over its
+        # packets while the maximum is the slowest batch
+        with self.lock:
+            stats = self.stages[stage]
+            stats.packets += packets
+            stats.total += seconds
+            stats.maximum = max(
+                stats.maximum, seconds if maximum is None else maximum
+            )
+
+    def frames_dropped(self, frames: int) -> None:
+        with self.lock:
+            self.dropped_frames += frames
+
+    def dequeued(self, at: float) -> None:
+        with self.lock:
+            if self.started_at is None:
+                self.started_at = at
+
+    def processed(self, packets: int) -> None:
+        with self.lock:
+            self.last_processed_at = time.perf_counter()
+            if self.started_at is None:
+                self.started_at = self.last_processed_at
+            self.packets += packets
+
+    def throughput(self) -> float:
+        with self.lock:
+            if self.started_at is None:
+                return 0.0
+            elapsed = self.last_processed_at - self.started_at
+            return self.packets / elapsed if elapsed > 0 else 0.0
+
+    def report(self) -> str:
+        throughput = self.throughput()
+        with self.lock:
+            stages = ", ".join(
+                f"{stage} {stats.mean() * 1e3:.3f}/{stats.maximum * 1e3:.1f} ms"
+                for stage, stats in self.stages.items()
+            )
+            return (
+                f"{self.packets:,} packets at {throughput:,.1f} packets/s "
+                f"(mean per packet/max per batch: {stages}; "
+                f"{self.dropped_frames:,} dropped frames)"
+            )
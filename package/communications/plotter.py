@@ -1,9 +1,15 @@
+import json
+import math
+import os
 import pandas as pd
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from matplotlib.ticker import MaxNLocator
-import shutil
-import os
+from typing import Callable, Iterator
 
+from package.communications.flight_loader import FlightLoader
+from package.communications.flight_log import FlightLog
 from package.constants import (
     TelemetryFieldsCSVHeadings,
     TelemetryUnits,
@@ -39,51 +45,114 @@ class Plotter:
         ],
     ]
 
+    PLOTS = [[plot] for plot in PLOTS_1_LINE] + PLOTS_3_LINES
+    PLOT_COUNT = len(PLOTS)
+    CACHE_FILE = "plots.json"
+    CACHE_VERSION = 1
+    COLUMNS = [TelemetryFieldsCSVHeadings.MISSION_TIME.value] + [
+        line for plot in PLOTS for line in plot
+    ]
+    FIGURE: Figure | None = None
+    DATA: tuple[str, pd.DataFrame] | None = None
+
     def __init__(self, date_time: str, csv_file: str) -> None:
         self.csv_file = csv_file
-        self.data = None
-        self.log_dir = f"{Plotter.LOGS_DIR}{date_time}/"
-
-    def __load_data(self, time_recieved_first_packet: str) -> bool:
-        self.data = pd.read_csv(self.csv_file)
-        if self.data.empty:
-            print("No data found in the CSV file.")
-            if os.path.exists(self.log_dir):
-                shutil.rmtree(self.log_dir)
-            return False
-
-        return True
-
-    def generate_plots(self, time_recieved_first_packet: str) -> None:
-        if not self.__load_data(time_recieved_first_packet):
-            return
+        self.log_dir = os.path.join(
+            os.path.dirname(csv_file) or f"{Plotter.LOGS_DIR}{date_time}", ""
+        )
+        self.cache_file = os.path.join(self.log_dir, Plotter.CACHE_FILE)
+
+    def generate_plots(
+        self,
+        time_recieved_first_packet: str,
+        progress: Callable[[str], None] | None = None,
+        workers: int | None = None,
+        force: bool = False,
+    ) -> None:
+        Plotter.generate_all([self], progress, workers, force)
+
+    @staticmethod
+    def generate_all(
+        plotters: list["Plotter"],
+        progress: Callable[[str], None] | None = None,
+        workers: int | None = None,
+        force: bool = False,
+    ) -> int:
+        pending = [
+            plotter
+            for plotter in plotters
+            if force or not plotter.is_current()
+        ]
+        jobs = [
+            (plotter.csv_file, plotter.log_dir, plot)
+            for plotter in pending
+            for plot in Plotter.PLOTS
+        ]
+        if not jobs:
+            return 0
 
         print("Generating plots...")
-        for plot in Plotter.PLOTS_1_LINE:
-            self.__plot_single_line(plot)
+        workers = min(workers or os.cpu_count() or 1, len(jobs))
+        if workers == 1:
+            Plotter.__report(jobs, map(Plotter.render, jobs), progress)
+            Plotter.DATA = None
+        else:
+            with ProcessPoolExecutor(workers) as pool:
+                Plotter.__report(
+                    jobs,
+                    pool.map(
+                        Plotter.render,
+                        jobs,
+                        chunksize=math.ceil(len(jobs) / workers),
+                    ),
+                    progress,
+                )
+
+        for plotter in pending:
+            plotter.__save_cache()
+        return len(pending)
+
+    @staticmethod
+    def __report(
+        jobs: list[tuple[str, str, list[str]]],
+        results: Iterator[bool],
+        progress: Callable[[str], None] | None,
+    ) -> None:
+        for (csv_file, _, plot), rendered in zip(jobs, results):
+            if progress:
+                progress(plot[0])
+            if not rendered:
+                print(f"No data found in {csv_file}.")
+
+    def __signature(self) -> list:
+        return [Plotter.CACHE_VERSION] + [
+            [os.path.basename(path), stat.st_size, stat.st_mtime_ns]
+            for path in FlightLog.segments(self.csv_file)
+            for stat in [os.stat(path)]
+        ]
+
+    def is_current(self) -> bool:
+        try:
+            with open(self.cache_file) as file:
+                signature = json.load(file)
+        except (OSError, ValueError):
+            return False
 
-        for plot in Plotter.PLOTS_3_LINES:
-            self.__plot_three_lines(plot)
+        return signature == self.__signature() and all(
+            os.path.exists(Plotter.__image_path(self.log_dir, plot))
+            for plot in Plotter.PLOTS
+        )
 
-    def __plot_single_line(self, plot: str) -> None:
-        plt.figure()
-        variable = " ".join(word.capitalize() for word in plot.split("_"))
+    def __save_cache(self) -> None:
+        with open(f"{self.cache_file}.tmp", "w") as file:
+            json.dump(self.__signature(), file)
+        os.replace(f"{self.cache_file}.tmp", self.cache_file)
+
+    @staticmethod
+    def __title(plot: list[str]) -> str:
+        if len(plot) == 1:
+            return " ".join(word.capitalize() for word in plot[0].split("_"))
 
-        plt.plot(
-            self.data[TelemetryFieldsCSVHeadings.MISSION_TIME.value],
-            self.data[plot],
-        )
-        plt.title(f"{variable} over Time")
-        plt.xlabel("")
-        plt.ylabel(f"{variable}/{self.__get_unit(plot)}")
-        plt.gca().xaxis.set_major_locator(MaxNLocator(nbins=self.NBINS))
-        plt.gca().set_xticklabels([])
-        plt.savefig(f"{self.log_dir}{variable.replace(' ', '')}.png")
-        plt.close()
-
-    def __plot_three_lines(self, plot: list) -> None:
-        plt.figure()
-        legend_labels = []
         variable = " ".join(
             word.capitalize() for word in plot[0].split("_")[:-1]
         )
@@ -91,11 +160,41 @@ class Plotter:
             variable = "Acceleration"
         elif variable == "Mag":
             variable = "Magnetometer"
+        return variable
+
+    @staticmethod
+    def __image_path(log_dir: str, plot: list[str]) -> str:
+        return f"{log_dir}{Plotter.__title(plot).replace(' ', '')}.png"
+
+    @staticmethod
+    def __load_data(csv_file: str) -> pd.DataFrame:
+        if Plotter.DATA is not None and Plotter.DATA[0] == csv_file:
+            return Plotter.DATA[1]
+
+        data = FlightLoader.load(csv_file, Plotter.COLUMNS)
+        Plotter.DATA = (csv_file, data)
+        return data
+
+    @staticmethod
+    def render(job: tuple[str, str, list[str]]) -> bool:
+        csv_file, log_dir, plot = job
+        data = Plotter.__load_data(csv_file)
+        if data.empty:
+            return False
+
+        if Plotter.FIGURE is None:
+            Plotter.FIGURE = Figure()
+            FigureCanvasAgg(Plotter.FIGURE)
+        figure = Plotter.FIGURE
+        figure.clear()
+        axes = figure.add_subplot()
 
+        variable = Plotter.__title(plot)
+        legend_labels = []
         for line in plot:
-            plt.plot(
-                self.data[TelemetryFieldsCSVHeadings.MISSION_TIME.value],
-                self.data[line],
+            axes.plot(
+                data[TelemetryFieldsCSVHeadings.MISSION_TIME.value],
+                data[line],
             )
             if line.endswith("R"):
                 legend_labels.append(f"{variable} Roll")
@@ -106,16 +205,18 @@ class Plotter:
             else:
                 legend_labels.append(line)
 
-        plt.title(f"{variable} over Time")
-        plt.xlabel("")
-        plt.ylabel(f"{variable}/{self.__get_unit(plot[0])}")
-        plt.gca().xaxis.set_major_locator(MaxNLocator(nbins=self.NBINS))
-        plt.gca().set_xticklabels([])
-        plt.legend(legend_labels, loc="upper right")
-        plt.savefig(f"{self.log_dir}{variable.replace(' ', '')}.png")
-        plt.close()
+        axes.set_title(f"{variable} over Time")
+        axes.set_xlabel("")
+        axes.set_ylabel(f"{variable}/{Plotter.__get_unit(plot[0])}")
+        axes.xaxis.set_major_locator(MaxNLocator(nbins=Plotter.NBINS))
+        axes.set_xticklabels([])
+        if len(plot) > 1:
+            axes.legend(legend_labels, loc="upper right")
+        figure.savefig(Plotter.__image_path(log_dir, plot))
+        return True
 
-    def __get_unit(self, field: str) -> str:
+    @staticmethod
+    def __get_unit(field: str) -> str:
         if field not in [
             member.value for member in TelemetryFieldsCSVHeadings
         ]:
@@ -0,0 +1,134 @@
+import json
+import os
+import subprocess
+import sys
+import time
+import traceback
+
+
+class PostFlight:
+    STATUS_FILE = "postflight.json"
+    LOG_FILE = "postflight.log"
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    PROJECT_ROOT = os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+
+    @staticmethod
+    def start(
+        start_time: str,
+        csv_file: str,
+        time_recieved_first_packet: str | None,
+        export: tuple[str, str] | None = None,
+    ) -> subprocess.Popen:
+        directory = os.path.dirname(csv_file)
+        PostFlight.write_status(directory, PostFlight.QUEUED)
+
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, (PostFlight.PROJECT_ROOT, env.get("PYTHONPATH")))
+        )
+        with open(os.path.join(directory, PostFlight.LOG_FILE), "a") as log:
+            return subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "package.communications.postflight",
+                    start_time,
+                    csv_file,
+                    time_recieved_first_packet or "",
+                    *(export or ()),
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                env=env,
+                start_new_session=True,
+            )
+
+    @staticmethod
+    def status_path(directory: str) -> str:
+        return os.path.join(directory, PostFlight.STATUS_FILE)
+
+    @staticmethod
+    def write_status(
+        directory: str,
+        state: str,
+        completed: int = 0,
+        total: int | None = None,
+        step: str | None = None,
+        error: str | None = None,
+    ) -> None:
+        path = PostFlight.status_path(directory)
+        with open(f"{path}.tmp", "w") as file:
+            json.dump(
+                {
+                    "state": state,
+                    "completed": completed,
+                    "total": total,
+                    "step": step,
+                    "error": error,
+                    "updated": time.time(),
+                },
+                file,
+            )
+        os.replace(f"{path}.tmp", path)
+
+    @staticmethod
+    def status(directory: str) -> dict | None:
+        try:
+            with open(PostFlight.status_path(directory)) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+
+def main() -> int:
+    from package.communications.plotter import Plotter
+    from package.communications.sqlite_writer import SqliteWriter
+
+    start_time, csv_file, time_recieved_first_packet = sys.argv[1:4]
+    export = sys.argv[4:6]
+    directory = os.path.dirname(csv_file)
+    total = (Plotter.PLOT_COUNT if time_recieved_first_packet else 0) + (
+        1 if export else 0
+    )
+    completed = 0
+
+    def progress(step: str) -> None:
+        nonlocal completed
+        completed += 1
+        PostFlight.write_status(
+            directory, PostFlight.RUNNING, completed, total, step
+        )
+
+    PostFlight.write_status(directory, PostFlight.RUNNING, total=total)
+    try:
+        if export:
+            database_path, flight_id = export
+            SqliteWriter.export_csv(database_path, flight_id, csv_file)
+            progress(os.path.basename(csv_file))
+        if time_recieved_first_packet:
+            Plotter(start_time, csv_file).generate_plots(
+                time_recieved_first_packet, progress
+            )
+    except Exception as e:
+        traceback.print_exc()
+        PostFlight.write_status(
+            directory,
+            PostFlight.FAILED,
+            completed,
+            total,
+            error=repr(e),
+        )
+        return 1
+
+    PostFlight.write_status(directory, PostFlight.DONE, completed, total)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,134 +2,135 @@ import queue
 import threading
 import time
 from digi.xbee.devices import XBeeDevice
-from package.models.telemetry import (
-    Mode,
-    State,
-    Telemetry,
-    PrincipalAxesCoordinate,
-    GPS,
+from digi.xbee.models.message import XBeeMessage
+from package.communications.bounded_queue import BoundedQueue, QueueStats
+from package.communications.decoder import TelemetryDecoder
+from package.communications.framer import Framer
+from package.communications.journal import Journal
+from package.communications.pipeline_stats import PipelineStats
+from package.exceptions.TelemetryDecodeException import (
+    TelemetryDecodeException,
 )
+from package.config import OverflowPolicy
+from package.models.telemetry import Telemetry
 from package.ui.log.log import Log
 
 
 class Receiver:
-    DATA_START_INDEX, DATA_END_INDEX = 1, -3
-    FIELD_COUNT = 28
-
-    def __init__(self, device: XBeeDevice) -> None:
+    def __init__(
+        self,
+        device: XBeeDevice,
+        queue_capacity: int,
+        queue_policy: OverflowPolicy,
+        journal: Journal | None = None,
+        stats: PipelineStats | None = None,
+    ) -> None:
         self.device = device
-        self.data_queue: queue.Queue[str] = queue.Queue()
+        self.journal = journal
+        self.stats = stats
+        self.data_queue: BoundedQueue[tuple[float, bytes]] = BoundedQueue(
+            queue_capacity, queue_policy
+        )
         self.log_queue: queue.Queue[str] = queue.Queue()
         self.packet_count = -1
         self.logger = None
-        self.device.add_data_received_callback(
-            lambda xbee_message: self.__data_received_callback(
-                xbee_message.data.decode()
-            )
-        )
+        self.decoder = TelemetryDecoder()
+        self.framer = Framer()
+        self.device.add_data_received_callback(self.__data_received_callback)
         self.time_recieved_first_packet = None
 
-    def __parse_data(self, data: str) -> Telemetry:
+    def __parse_data(self, data: bytes) -> Telemetry:
         if not data:
             return None
 
-        fields = [field.strip() for field in data.split(",")]
-
-        if len(fields) != Receiver.FIELD_COUNT:
-            self.logger.log(
-                f"Invalid data format. Expected {Receiver.FIELD_COUNT} fields, got {len(fields)}"
-            )
-            self.logger.log(f"Received data: {data}")
-            return None
-
         try:
-            team_id = int(fields[0])
-            mission_time = fields[1]
-            packet_count = int(fields[2])
-            mode = Mode(fields[3])
-            state = State(fields[4])
-            altitude = float(fields[5])
-            temperature = float(fields[6])
-            pressure = float(fields[7])
-            voltage = float(fields[8])
-            gyro_r, gyro_p, gyro_y = map(float, fields[9:12])
-            accel_r, accel_p, accel_y = map(float, fields[12:15])
-            mag_r, mag_p, mag_y = map(float, fields[15:18])
-            auto_gyro_rotation_rate = float(fields[18])
-            gps_time = fields[19]
-            gps_altitude = float(fields[20])
-            gps_latitude = float(fields[21])
-            gps_longitude = float(fields[22])
-            gps_sats = int(fields[23])
-            cmd_echo = fields[24]
-            descent_rate = float(fields[26])
-            geographic_heading = int(fields[27])
-
-            if self.time_recieved_first_packet is None:
-                self.time_recieved_first_packet = time.strftime(
-                    "%H:%M:%S", time.localtime()
-                )
-
-            return Telemetry(
-                team_id=team_id,
-                mission_time=mission_time,
-                packet_count=packet_count,
-                mode=mode,
-                state=state,
-                altitude=altitude,
-                temperature=temperature,
-                pressure=pressure,
-                voltage=voltage,
-                gyro=PrincipalAxesCoordinate(
-                    roll=gyro_r, pitch=gyro_p, yaw=gyro_y
-                ),
-                acceleration=PrincipalAxesCoordinate(
-                    roll=accel_r, pitch=accel_p, yaw=accel_y
-                ),
-                magnetometer=PrincipalAxesCoordinate(
-                    roll=mag_r, pitch=mag_p, yaw=mag_y
-                ),
-                auto_gyro_rotation_rate=auto_gyro_rotation_rate,
-                gps=GPS(
-                    time=gps_time,
-                    altitude=gps_altitude,
-                    latitude=gps_latitude,
-                    longitude=gps_longitude,
-                    sats=gps_sats,
-                ),
-                cmd_echo=cmd_echo,
-                descent_rate=descent_rate,
-                geographic_heading=geographic_heading,
-            )
+            telemetry = self.decoder.decode(data)
+        except TelemetryDecodeException as e:
+            self.__log(str(e))
+            self.__log(f"Received data: {data.decode(errors='replace')}")
+            return None
         except (ValueError, TypeError) as e:
-            if self.logger:
-                self.logger.log(f"Error parsing telemetry data: {e}")
+            self.__log(f"Error parsing telemetry data: {e}")
             return None
 
+        if self.time_recieved_first_packet is None:
+            self.time_recieved_first_packet = time.strftime(
+                "%H:%M:%S", time.localtime()
+            )
+
+        return telemetry
+
     def receive(self) -> Telemetry:
+        batch = self.receive_batch(1)
+        return batch[0] if batch else None
+
+    def receive_batch(
+        self, max_items: int | None = None, timeout: float | None = None
+    ) -> list[Telemetry]:
         if not self.device.is_open():
-            if self.logger:
-                self.logger.log("Device is not open. Cannot receive data.")
-            return None
+            self.__log("Device is not open. Cannot receive data.")
+            return []
+
+        raw_batch = []
+        if timeout is not None:
+            try:
+                raw_batch.append(self.data_queue.get(timeout=timeout))
+            except queue.Empty:
+                return []
+
+        pending = (
+            self.data_queue.qsize()
+            if max_items is None
+            else max_items - len(raw_batch)
+        )
+        for _ in range(pending):
+            try:
+                raw_batch.append(self.data_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        if not raw_batch:
+            return []
+
+        dequeued_at = time.perf_counter()
+        batch = []
+        for _, raw_data in raw_batch:
+            telemetry = self.__process(raw_data)
+            if telemetry:
+                batch.append(telemetry)
+
+        if self.stats:
+            self.stats.dequeued(dequeued_at)
+            waits = [dequeued_at - enqueued_at for enqueued_at, _ in raw_batch]
+            self.stats.record(
+                PipelineStats.QUEUE, sum(waits), len(waits), max(waits)
+            )
+            self.stats.record(
+                PipelineStats.DECODE,
+                time.perf_counter() - dequeued_at,
+                len(raw_batch),
+            )
 
-        try:
-            raw_data = self.data_queue.get_nowait()
-        except queue.Empty:
-            # if self.logger:
-            # self.logger.log("No data received.")
-            return None
+        return batch
 
+    def __process(self, raw_data: bytes) -> Telemetry | None:
         telemetry = self.__parse_data(raw_data)
-        if telemetry and telemetry.packet_count == self.packet_count:
-            if self.logger:
-                self.logger.log(
-                    "No new data received (packet count unchanged)."
-                )
+        if not telemetry:
+            return None
+
+        if telemetry.packet_count == self.packet_count:
+            self.__log("No new data received (packet count unchanged).")
             return None
 
         self.packet_count = telemetry.packet_count
         return telemetry
 
+    def queue_stats(self) -> QueueStats:
+        return self.data_queue.stats()
+
+    def close(self) -> None:
+        self.data_queue.close()
+
     def set_logger(self, logger: Log) -> None:
         self.logger = logger
 
@@ -146,12 +147,21 @@ class Receiver:
             if self.logger:
                 self.logger.log(message)
 
-    def __data_received_callback(self, data: str) -> None:
+    @staticmethod
+    def __source(xbee_message: XBeeMessage) -> bytes:
+        if not xbee_message.remote_device:
+            return Journal.UNKNOWN_SOURCE
+        return bytes(xbee_message.remote_device.get_64bit_addr().address)
+
+    def __data_received_callback(self, xbee_message: XBeeMessage) -> None:
         try:
-            raw_data = data[
-                Receiver.DATA_START_INDEX : Receiver.DATA_END_INDEX
-            ]
-            self.data_queue.put(raw_data)
+            source = Receiver.__source(xbee_message)
+            if self.journal:
+                self.journal.append(source, xbee_message.data)
+
+            received_at = time.perf_counter()
+            for frame in self.framer.feed(source, xbee_message.data):
+                self.data_queue.put((received_at, frame))
         except OSError as e:
             self.__log(f"OS error in data callback: {e}")
         except Exception as e:
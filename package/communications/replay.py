@@ -0,0 +1,38 @@
+from typing import Iterator
+from package.communications.flight_log import FlightLog
+from package.communications.journal import Journal
+from package.communications.virtual_device import VirtualXBeeDevice
+
+
+class ReplayDevice(VirtualXBeeDevice):
+    CSV_PACKET_INTERVAL = 1.0
+    FRAME_TERMINATOR = b"\r\n"
+
+    def __init__(self, file_path: str, speed: float | None) -> None:
+        super().__init__()
+        self.file_path = file_path
+        self.speed = speed
+
+    def _messages(self) -> Iterator[tuple[float, bytes]]:
+        if self.file_path.endswith(Journal.EXTENSION):
+            messages = self.__journal_messages()
+        else:
+            messages = self.__csv_messages()
+
+        for offset, payload in messages:
+            yield (offset / self.speed if self.speed else 0.0), payload
+
+    def __csv_messages(self) -> Iterator[tuple[float, bytes]]:
+        for index, row in enumerate(FlightLog.rows(self.file_path)):
+            frame = ",".join(row).encode()
+            yield (
+                index * ReplayDevice.CSV_PACKET_INTERVAL,
+                b"<" + frame + b">" + ReplayDevice.FRAME_TERMINATOR,
+            )
+
+    def __journal_messages(self) -> Iterator[tuple[float, bytes]]:
+        start = None
+        for entry in Journal.read(self.file_path):
+            if start is None:
+                start = entry.timestamp_ns
+            yield (entry.timestamp_ns - start) / 1e9, entry.payload
@@ -0,0 +1,201 @@
+import csv
+import sqlite3
+from package.communications.batch_writer import BatchWriter
+from package.communications.decoder import TelemetryDecoder
+from package.communications.wal import WriteAheadLog
+from package.constants import TelemetryFieldsCSVHeadings
+from package.models.telemetry import Mode, State
+
+
+class SqliteWriter(BatchWriter):
+    ERRORS = (OSError, sqlite3.Error)
+    TABLE = "telemetry"
+    SQL_TYPES = {
+        int: "INTEGER",
+        float: "REAL",
+        str: "TEXT",
+        Mode: "TEXT",
+        State: "TEXT",
+    }
+    FIELDS = [
+        (index, heading.value, field_type)
+        for index, (heading, field_type) in enumerate(TelemetryDecoder.SCHEMA)
+        if field_type is not None
+    ]
+    INDEXES = {
+        "telemetry_packet_count": TelemetryFieldsCSVHeadings.PACKET_COUNT,
+        "telemetry_mission_time": TelemetryFieldsCSVHeadings.MISSION_TIME,
+        "telemetry_state": TelemetryFieldsCSVHeadings.STATE,
+    }
+
+    def __init__(
+        self,
+        database_path: str,
+        flight_id: str,
+        flush_rows: int,
+        flush_interval: float,
+        fsync_interval: float | None = None,
+        wal: WriteAheadLog | None = None,
+    ) -> None:
+        self.database_path = database_path
+        self.flight_id = flight_id
+        self.connection = SqliteWriter.connect(
+            database_path, check_same_thread=False
+        )
+        self.insert = (
+            f"INSERT INTO {SqliteWriter.TABLE} (flight_id, "
+            + ", ".join(name for _, name, _ in SqliteWriter.FIELDS)
+            + ") VALUES (?, "
+            + ", ".join("?" for _ in SqliteWriter.FIELDS)
+            + ")"
+        )
+        super().__init__(
+            "sqlite-writer", flush_rows, flush_interval, fsync_interval, wal
+        )
+
+    @staticmethod
+    def connect(database_path: str, **kwargs) -> sqlite3.Connection:
+        connection = sqlite3.connect(database_path, **kwargs)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        with connection:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {SqliteWriter.TABLE} ("
+                "flight_id TEXT NOT NULL, "
+                + ", ".join(
+                    f"{name} {SqliteWriter.SQL_TYPES[field_type]}"
+                    for _, name, field_type in SqliteWriter.FIELDS
+                )
+                + ")"
+            )
+            for name, heading in SqliteWriter.INDEXES.items():
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {name} ON "
+                    f"{SqliteWriter.TABLE} (flight_id, {heading.value})"
+                )
+        return connection
+
+    def restore(self, rows: list[list]) -> None:
+        with self.connection:
+            self.connection.execute(
+                f"DELETE FROM {SqliteWriter.TABLE} WHERE flight_id = ?",
+                (self.flight_id,),
+            )
+        super().restore(rows)
+
+    def write_rows(self, rows: list[list]) -> None:
+        with self.connection:
+            self.connection.executemany(
+                self.insert,
+                (
+                    [self.flight_id]
+                    + [row[index] for index, _, _ in SqliteWriter.FIELDS]
+                    for row in rows
+                ),
+            )
+
+    def sync(self) -> None:
+        self.__checkpoint("FULL")
+
+    def release(self) -> None:
+        # Commits run with synchronous=NORMAL, so they are only durable
+        # once checkpointed; the flight's WAL must outlive this
+        try:
+            self.__checkpoint("TRUNCATE")
+        except SqliteWriter.ERRORS as e:
+            self.error = e
+        finally:
+            self.connection.close()
+
+    def __checkpoint(self, mode: str) -> None:
+        busy, _, _ = self.connection.execute(
+            f"PRAGMA wal_checkpoint({mode})"
+        ).fetchone()
+        if busy:
+            raise sqlite3.OperationalError(
+                f"{mode} checkpoint of {self.database_path} did not complete"
+            )
+
+    @staticmethod
+    def __columns() -> str:
+        return ", ".join(
+            (
+                heading.value
+                if field_type is not None
+                else f"'' AS blank_{index}"
+            )
+            for index, (heading, field_type) in enumerate(
+                TelemetryDecoder.SCHEMA
+            )
+        )
+
+    @staticmethod
+    def export_csv(database_path: str, flight_id: str, file_path: str) -> int:
+        connection = SqliteWriter.connect(database_path)
+        try:
+            cursor = connection.execute(
+                f"SELECT {SqliteWriter.__columns()} FROM {SqliteWriter.TABLE} "
+                "WHERE flight_id = ? ORDER BY rowid",
+                (flight_id,),
+            )
+            with open(file_path, mode="w", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow(
+                    [heading.value for heading, _ in TelemetryDecoder.SCHEMA]
+                )
+                rows = 0
+                while batch := cursor.fetchmany(10_000):
+                    writer.writerows(batch)
+                    rows += len(batch)
+            return rows
+        finally:
+            connection.close()
+
+    @staticmethod
+    def flights(database_path: str) -> list[str]:
+        connection = SqliteWriter.connect(database_path)
+        try:
+            return [
+                flight_id
+                for (flight_id,) in connection.execute(
+                    f"SELECT DISTINCT flight_id FROM {SqliteWriter.TABLE} "
+                    "ORDER BY flight_id"
+                )
+            ]
+        finally:
+            connection.close()
+
+    @staticmethod
+    def time_range(
+        database_path: str, flight_id: str, start: str, end: str
+    ) -> list[tuple]:
+        return SqliteWriter.__query(
+            database_path,
+            f"flight_id = ? AND {TelemetryFieldsCSVHeadings.MISSION_TIME.value} "
+            "BETWEEN ? AND ?",
+            (flight_id, start, end),
+        )
+
+    @staticmethod
+    def in_state(
+        database_path: str, flight_id: str, state: State
+    ) -> list[tuple]:
+        return SqliteWriter.__query(
+            database_path,
+            f"flight_id = ? AND {TelemetryFieldsCSVHeadings.STATE.value} = ?",
+            (flight_id, state.value),
+        )
+
+    @staticmethod
+    def __query(
+        database_path: str, condition: str, parameters: tuple
+    ) -> list[tuple]:
+        connection = SqliteWriter.connect(database_path)
+        try:
+            return connection.execute(
+                f"SELECT {SqliteWriter.__columns()} FROM {SqliteWriter.TABLE} "
+                f"WHERE {condition} ORDER BY rowid",
+                parameters,
+            ).fetchall()
+        finally:
+            connection.close()
@@ -1,67 +1,149 @@
 from ast import Constant
-import csv
-from io import TextIOWrapper
+import glob
 import time
 from package import constants
-from package.communications.plotter import Plotter
+from package.communications.columnar_store import ColumnarStore
+from package.communications.csv_writer import CsvWriter
+from package.communications.decoder import TelemetryDecoder
+from package.communications.flight_index import FlightIndex
+from package.communications.flight_log import FlightLog, SegmentCompressor
+from package.communications.journal import Journal
+from package.communications.postflight import PostFlight
+from package.communications.sqlite_writer import SqliteWriter
+from package.config import StoreBackend
 from package.models.telemetry import Telemetry
+from package.communications.wal import WriteAheadLog
 from package.ui.log.log import Log
 import os
+import shutil
 
 
 class Store:
-    def __init__(self) -> None:
-        self.start_time = time.strftime("%m%d_%H%M%S", time.localtime())
+    LOGS_DIR = "logs"
+    DATABASE_PATH = os.path.join(LOGS_DIR, "telemetry.sqlite3")
+    FLUSH_ROWS = 256
+    FLUSH_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        flush_rows: int = FLUSH_ROWS,
+        flush_interval: float = FLUSH_INTERVAL,
+        fsync_interval: float | None = None,
+        wal_sync_interval: float = WriteAheadLog.SYNC_INTERVAL,
+        write_ahead: bool = True,
+        recover: bool = True,
+        backend: StoreBackend = StoreBackend.CSV,
+        segment_bytes: int | None = None,
+        segment_interval: float | None = None,
+        compress_segments: bool = True,
+    ) -> None:
+        unfinished = Store.find_unfinished_flight() if recover else None
+        started = (
+            time.localtime(os.path.getmtime(os.path.dirname(unfinished)))
+            if unfinished
+            else time.localtime()
+        )
+        self.start_time = (
+            os.path.basename(os.path.dirname(unfinished))
+            if unfinished
+            else time.strftime("%m%d_%H%M%S", started)
+        )
+        # The run directory name has no year, so SQLite flights are keyed
+        # by the year as well to keep them unique across years
+        self.flight_id = f"{started.tm_year}{self.start_time}"
         self.file_path = (
             f"logs/{self.start_time}/Flight_{constants.APP_INFO.team_id()}.csv"
         )
+        base_path = os.path.splitext(self.file_path)[0]
+        self.journal = Journal(f"{base_path}{Journal.EXTENSION}")
 
-        self.file = self.__open_file()
-        self.writer = csv.writer(self.file)
-        self.__write_header()
+        self.recovered: list[Telemetry] = []
+        self.recovered_at = None
+        if unfinished:
+            self.__recover(unfinished)
+
+        self.wal = (
+            WriteAheadLog(
+                f"{base_path}{WriteAheadLog.EXTENSION}", wal_sync_interval
+            )
+            if write_ahead
+            else None
+        )
+        self.backend = backend
+        self.columns = None
+        self.index = None
+        self.compressor = None
+        if self.backend is StoreBackend.SQLITE:
+            self.writer = SqliteWriter(
+                Store.DATABASE_PATH,
+                self.flight_id,
+                flush_rows,
+                flush_interval,
+                fsync_interval,
+                self.wal,
+            )
+        else:
+            self.columns = ColumnarStore(
+                f"{base_path}{ColumnarStore.EXTENSION}"
+            )
+            self.index = FlightIndex(f"{base_path}{FlightIndex.EXTENSION}")
+            if compress_segments and (segment_bytes or segment_interval):
+                self.compressor = SegmentCompressor()
+            self.writer = CsvWriter(
+                self.file_path,
+                Store.__header(),
+                flush_rows,
+                flush_interval,
+                fsync_interval,
+                self.columns,
+                self.wal,
+                self.index,
+                segment_bytes,
+                segment_interval,
+                self.compressor,
+            )
+        if self.recovered:
+            self.writer.restore(
+                [Store.__row(telemetry) for telemetry in self.recovered]
+            )
         self.enabled = False
+        self.closed = False
         self.enable()
 
         self.logger = None
-        self.plotter = Plotter(self.start_time, self.file_path)
-
-    def __open_file(self) -> TextIOWrapper:
-        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
-        return open(self.file_path, mode="a", newline="", buffering=1)
-
-    def __write_header(self) -> None:
-        self.writer.writerow(
-            [
-                constants.TelemetryFieldsCSVHeadings.TEAM_ID.value,
-                constants.TelemetryFieldsCSVHeadings.MISSION_TIME.value,
-                constants.TelemetryFieldsCSVHeadings.PACKET_COUNT.value,
-                constants.TelemetryFieldsCSVHeadings.MODE.value,
-                constants.TelemetryFieldsCSVHeadings.STATE.value,
-                constants.TelemetryFieldsCSVHeadings.ALTITUDE.value,
-                constants.TelemetryFieldsCSVHeadings.TEMPERATURE.value,
-                constants.TelemetryFieldsCSVHeadings.PRESSURE.value,
-                constants.TelemetryFieldsCSVHeadings.VOLTAGE.value,
-                constants.TelemetryFieldsCSVHeadings.GYRO_R.value,
-                constants.TelemetryFieldsCSVHeadings.GYRO_P.value,
-                constants.TelemetryFieldsCSVHeadings.GYRO_Y.value,
-                constants.TelemetryFieldsCSVHeadings.ACCEL_R.value,
-                constants.TelemetryFieldsCSVHeadings.ACCEL_P.value,
-                constants.TelemetryFieldsCSVHeadings.ACCEL_Y.value,
-                constants.TelemetryFieldsCSVHeadings.MAG_R.value,
-                constants.TelemetryFieldsCSVHeadings.MAG_P.value,
-                constants.TelemetryFieldsCSVHeadings.MAG_Y.value,
-                constants.TelemetryFieldsCSVHeadings.AUTO_GYRO_ROTATION_RATE.value,
-                constants.TelemetryFieldsCSVHeadings.GPS_TIME.value,
-                constants.TelemetryFieldsCSVHeadings.GPS_ALTITUDE.value,
-                constants.TelemetryFieldsCSVHeadings.GPS_LATITUDE.value,
-                constants.TelemetryFieldsCSVHeadings.GPS_LONGITUDE.value,
-                constants.TelemetryFieldsCSVHeadings.GPS_SATS.value,
-                constants.TelemetryFieldsCSVHeadings.CMD_ECHO.value,
-                constants.TelemetryFieldsCSVHeadings.BLANK.value,
-                constants.TelemetryFieldsCSVHeadings.DESC_RATE.value,
-                constants.TelemetryFieldsCSVHeadings.GEOG_HEAD.value,
-            ]
-        )
+
+    @staticmethod
+    def __header() -> list[str]:
+        return [
+            constants.TelemetryFieldsCSVHeadings.TEAM_ID.value,
+            constants.TelemetryFieldsCSVHeadings.MISSION_TIME.value,
+            constants.TelemetryFieldsCSVHeadings.PACKET_COUNT.value,
+            constants.TelemetryFieldsCSVHeadings.MODE.value,
+            constants.TelemetryFieldsCSVHeadings.STATE.value,
+            constants.TelemetryFieldsCSVHeadings.ALTITUDE.value,
+            constants.TelemetryFieldsCSVHeadings.TEMPERATURE.value,
+            constants.TelemetryFieldsCSVHeadings.PRESSURE.value,
+            constants.TelemetryFieldsCSVHeadings.VOLTAGE.value,
+            constants.TelemetryFieldsCSVHeadings.GYRO_R.value,
+            constants.TelemetryFieldsCSVHeadings.GYRO_P.value,
+            constants.TelemetryFieldsCSVHeadings.GYRO_Y.value,
+            constants.TelemetryFieldsCSVHeadings.ACCEL_R.value,
+            constants.TelemetryFieldsCSVHeadings.ACCEL_P.value,
+            constants.TelemetryFieldsCSVHeadings.ACCEL_Y.value,
+            constants.TelemetryFieldsCSVHeadings.MAG_R.value,
+            constants.TelemetryFieldsCSVHeadings.MAG_P.value,
+            constants.TelemetryFieldsCSVHeadings.MAG_Y.value,
+            constants.TelemetryFieldsCSVHeadings.AUTO_GYRO_ROTATION_RATE.value,
+            constants.TelemetryFieldsCSVHeadings.GPS_TIME.value,
+            constants.TelemetryFieldsCSVHeadings.GPS_ALTITUDE.value,
+            constants.TelemetryFieldsCSVHeadings.GPS_LATITUDE.value,
+            constants.TelemetryFieldsCSVHeadings.GPS_LONGITUDE.value,
+            constants.TelemetryFieldsCSVHeadings.GPS_SATS.value,
+            constants.TelemetryFieldsCSVHeadings.CMD_ECHO.value,
+            constants.TelemetryFieldsCSVHeadings.BLANK.value,
+            constants.TelemetryFieldsCSVHeadings.DESC_RATE.value,
+            constants.TelemetryFieldsCSVHeadings.GEOG_HEAD.value,
+        ]
 
     def enable(self) -> None:
         self.enabled = True
@@ -69,59 +151,140 @@ class Store:
     def disable(self) -> None:
         self.enabled = False
 
+    @staticmethod
+    def find_unfinished_flight() -> str | None:
+        flights = sorted(
+            glob.glob(
+                os.path.join(
+                    Store.LOGS_DIR,
+                    "*",
+                    f"Flight_{constants.APP_INFO.team_id()}{WriteAheadLog.EXTENSION}",
+                )
+            )
+        )
+        return flights[-1] if flights else None
+
+    def __recover(self, wal_directory: str) -> None:
+        decoder = TelemetryDecoder()
+        for record in WriteAheadLog.recover(wal_directory):
+            try:
+                self.recovered.append(decoder.decode(record))
+            except (ValueError, TypeError):
+                continue
+
+        FlightLog.remove(self.file_path)
+        if self.recovered:
+            self.recovered_at = time.strftime("%H:%M:%S", time.localtime())
+
     def write(self, telemetry: Telemetry) -> None:
         if not self.enabled:
             return
-        self.writer.writerow(
-            [
-                telemetry.team_id,
-                telemetry.mission_time,
-                telemetry.packet_count,
-                telemetry.mode.value,
-                telemetry.state.value,
-                telemetry.altitude,
-                telemetry.temperature,
-                telemetry.pressure,
-                telemetry.voltage,
-                telemetry.gyro.roll,
-                telemetry.gyro.pitch,
-                telemetry.gyro.yaw,
-                telemetry.acceleration.roll,
-                telemetry.acceleration.pitch,
-                telemetry.acceleration.yaw,
-                telemetry.magnetometer.roll,
-                telemetry.magnetometer.pitch,
-                telemetry.magnetometer.yaw,
-                telemetry.auto_gyro_rotation_rate,
-                telemetry.gps.time,
-                telemetry.gps.altitude,
-                telemetry.gps.latitude,
-                telemetry.gps.longitude,
-                telemetry.gps.sats,
-                telemetry.cmd_echo,
-                "",
-                telemetry.descent_rate,
-                telemetry.geographic_heading,
-            ]
-        )
+        self.writer.write(Store.__row(telemetry))
+
+    @staticmethod
+    def __row(telemetry: Telemetry) -> list:
+        return [
+            telemetry.team_id,
+            telemetry.mission_time,
+            telemetry.packet_count,
+            telemetry.mode.value,
+            telemetry.state.value,
+            telemetry.altitude,
+            telemetry.temperature,
+            telemetry.pressure,
+            telemetry.voltage,
+            telemetry.gyro.roll,
+            telemetry.gyro.pitch,
+            telemetry.gyro.yaw,
+            telemetry.acceleration.roll,
+            telemetry.acceleration.pitch,
+            telemetry.acceleration.yaw,
+            telemetry.magnetometer.roll,
+            telemetry.magnetometer.pitch,
+            telemetry.magnetometer.yaw,
+            telemetry.auto_gyro_rotation_rate,
+            telemetry.gps.time,
+            telemetry.gps.altitude,
+            telemetry.gps.latitude,
+            telemetry.gps.longitude,
+            telemetry.gps.sats,
+            telemetry.cmd_echo,
+            "",
+            telemetry.descent_rate,
+            telemetry.geographic_heading,
+        ]
 
     def close(self, time_recieved_first_packet: str) -> None:
-        self.file.close()
-        if (
-            os.stat(self.file_path).st_size == 0
-            or sum(1 for _ in open(self.file_path)) == 1
-        ):
-            os.remove(self.file_path)
+        if self.closed:
+            return
+
+        self.closed = True
+        self.journal.close()
+        if self.journal.is_empty():
+            os.remove(self.journal.file_path)
+
+        self.writer.close()
+        self.process_log_queue()
+        if self.writer.error and self.logger:
+            self.logger.log(
+                f"Error writing telemetry to {self.file_path}: {self.writer.error}"
+            )
+        if self.compressor and self.compressor.error and self.logger:
+            self.logger.log(
+                f"Error compressing flight log segments: {self.compressor.error}"
+            )
+
+        if self.writer.rows_written == 0:
+            FlightLog.remove(self.file_path)
+            if self.columns:
+                shutil.rmtree(self.columns.directory)
+            if self.index:
+                self.index.remove()
+            if self.wal:
+                self.wal.remove()
             parent_dir = os.path.dirname(self.file_path)
             if not os.listdir(parent_dir):
                 os.rmdir(parent_dir)
             return
 
-        if time_recieved_first_packet is None:
+        if self.wal and not self.writer.error:
+            self.wal.remove()
+
+        time_recieved_first_packet = (
+            time_recieved_first_packet or self.recovered_at
+        )
+        export = (
+            (Store.DATABASE_PATH, self.flight_id)
+            if self.backend is StoreBackend.SQLITE
+            else None
+        )
+        if time_recieved_first_packet is None and export is None:
             return
 
-        self.plotter.generate_plots(time_recieved_first_packet)
+        PostFlight.start(
+            self.start_time,
+            self.file_path,
+            time_recieved_first_packet,
+            export,
+        )
+        if self.logger:
+            self.logger.log(
+                "Finishing the flight log in the background, progress in "
+                f"{PostFlight.status_path(os.path.dirname(self.file_path))}"
+            )
+
+    def process_log_queue(self) -> None:
+        while not self.writer.log_queue.empty():
+            message = self.writer.log_queue.get()
+            if self.logger:
+                self.logger.log(
+                    f"Error writing telemetry to {self.file_path}: {message}"
+                )
 
     def set_logger(self, logger: Log) -> None:
         self.logger = logger
         self.logger.log(f"Telemetry data is being stored in {self.file_path}")
+        if self.recovered_at:
+            self.logger.log(
+                f"Recovered {len(self.recovered)} packets from an unfinished flight"
+            )
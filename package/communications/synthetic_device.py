@@ -0,0 +1,151 @@
+import math
+import random
+import time
+from typing import Iterator
+from package.communications.binary_frame import BinaryFrame
+from package.communications.decoder import TelemetryDecoder
+from package.communications.virtual_device import (
+    VirtualRemoteDevice,
+    VirtualXBeeDevice,
+)
+from package.constants import APP_INFO
+from package.models.telemetry import Mode, State
+
+
+class SyntheticXBeeDevice(VirtualXBeeDevice):
+    MIN_RATE, MAX_RATE = 1.0, 1000.0
+    APOGEE = 725.0
+    ASCENT_TIME = 8.0
+    DESCENT_RATE = 5.0
+    PAD_TIME = 10.0
+    FRAME_TERMINATOR = b"\r\n"
+
+    def __init__(
+        self,
+        rate: float,
+        loss: float = 0.0,
+        duplication: float = 0.0,
+        corruption: float = 0.0,
+        seed: int | None = None,
+        binary: bool = False,
+    ) -> None:
+        super().__init__()
+        if (
+            not SyntheticXBeeDevice.MIN_RATE
+            <= rate
+            <= SyntheticXBeeDevice.MAX_RATE
+        ):
+            raise ValueError(
+                f"Rate must be between {SyntheticXBeeDevice.MIN_RATE} and {SyntheticXBeeDevice.MAX_RATE} Hz"
+            )
+
+        self.rate = rate
+        self.loss = loss
+        self.duplication = duplication
+        self.corruption = corruption
+        self.random = random.Random(seed)
+        self.binary = binary
+        self.decoder = TelemetryDecoder()
+        self.cmd_echo = "CXON"
+
+    def send_data(self, remote_device: VirtualRemoteDevice, data: str) -> None:
+        super().send_data(remote_device, data)
+        fields = [field.strip() for field in data.strip("<>").split(",")]
+        if len(fields) > 2:
+            self.cmd_echo = "".join(fields[2:])
+
+    def _messages(self) -> Iterator[tuple[float, bytes]]:
+        packet_count = 0
+        while True:
+            packet_count += 1
+            offset = (packet_count - 1) / self.rate
+            frame = self.__frame(packet_count, offset)
+
+            if self.random.random() < self.loss:
+                continue
+            if self.random.random() < self.corruption:
+                frame = self.__corrupt(frame)
+
+            yield offset, frame
+            if self.random.random() < self.duplication:
+                yield offset, frame
+
+    def __frame(self, packet_count: int, elapsed: float) -> bytes:
+        altitude, state, descent_rate = self.__profile(elapsed)
+        pressure = 101.325 * (1 - 2.25577e-5 * altitude) ** 5.25588
+        mission_time = time.strftime("%H:%M:%S", time.gmtime(elapsed))
+        wobble = math.sin(elapsed)
+
+        fields = [
+            APP_INFO.team_id(),
+            mission_time,
+            packet_count,
+            Mode.FLIGHT.value,
+            state.value,
+            round(altitude, 1),
+            round(25.0 - altitude * 0.0065, 1),
+            round(pressure, 2),
+            round(8.4 - elapsed * 1e-4, 2),
+            round(12.0 * wobble, 2),
+            round(8.0 * math.cos(elapsed), 2),
+            round(90.0 if state == State.PROBE_RELEASE else 3.0, 2),
+            round(0.1 * wobble, 2),
+            round(-0.1 * wobble, 2),
+            9.81,
+            round(0.3 * math.cos(elapsed), 3),
+            round(0.2 * wobble, 3),
+            0.45,
+            round(1500.0 if state == State.PROBE_RELEASE else 0.0, 1),
+            mission_time,
+            round(altitude + 5.0, 1),
+            round(32.2401 + 1e-6 * packet_count, 6),
+            round(-98.2012 - 1e-6 * packet_count, 6),
+            8,
+            self.cmd_echo,
+            "",
+            round(descent_rate, 2),
+            int(elapsed * 10) % 360,
+        ]
+
+        body = ", ".join(str(field) for field in fields).encode()
+        if self.binary:
+            return BinaryFrame.encode(self.decoder.decode(body))
+        return b"<" + body + b">" + SyntheticXBeeDevice.FRAME_TERMINATOR
+
+    def __profile(self, elapsed: float) -> tuple[float, State, float]:
+        flight_time = elapsed - SyntheticXBeeDevice.PAD_TIME
+        if flight_time < 0:
+            return 0.0, State.LAUNCH_PAD, 0.0
+
+        if flight_time < SyntheticXBeeDevice.ASCENT_TIME:
+            progress = flight_time / SyntheticXBeeDevice.ASCENT_TIME
+            return (
+                SyntheticXBeeDevice.APOGEE * (1 - (1 - progress) ** 2),
+                State.ASCENT,
+                0.0,
+            )
+
+        fallen = (
+            flight_time - SyntheticXBeeDevice.ASCENT_TIME
+        ) * SyntheticXBeeDevice.DESCENT_RATE
+        altitude = SyntheticXBeeDevice.APOGEE - fallen
+        if altitude <= 0:
+            return 0.0, State.LANDED, 0.0
+        if fallen < 1.0:
+            return altitude, State.APOGEE, SyntheticXBeeDevice.DESCENT_RATE
+        if altitude < 0.75 * SyntheticXBeeDevice.APOGEE:
+            return (
+                altitude,
+                State.PROBE_RELEASE,
+                SyntheticXBeeDevice.DESCENT_RATE,
+            )
+        return altitude, State.DESCENT, SyntheticXBeeDevice.DESCENT_RATE
+
+    def __corrupt(self, frame: bytes) -> bytes:
+        corrupted = bytearray(frame)
+        if self.random.random() < 0.5:
+            del corrupted[self.random.randrange(1, len(corrupted) - 3) :]
+        else:
+            index = self.random.randrange(1, len(corrupted) - 3)
+            corrupted[index] = self.random.randrange(32, 127)
+        return bytes(corrupted)
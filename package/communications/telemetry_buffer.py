@@ -0,0 +1,131 @@
+import numpy as np
+from package.communications.decoder import TelemetryDecoder
+from package.constants import TelemetryFieldsCSVHeadings
+from package.models.telemetry import Mode, State, Telemetry
+
+
+class TelemetryBuffer:
+    ROW = "ROW"
+    DEFAULT_CAPACITY = 10_000
+    STRING_WIDTH = 16
+    DTYPES = {
+        int: "<i8",
+        float: "<f8",
+        str: f"U{STRING_WIDTH}",
+        Mode: "u1",
+        State: "u1",
+    }
+    DTYPE = np.dtype(
+        [(ROW, "<i8")]
+        + [
+            (heading.value, dtype)
+            for (heading, _), dtype in zip(
+                TelemetryDecoder.SCHEMA,
+                map(
+                    DTYPES.get,
+                    (field_type for _, field_type in TelemetryDecoder.SCHEMA),
+                ),
+            )
+            if dtype is not None
+        ]
+    )
+    CATEGORIES = {
+        TelemetryFieldsCSVHeadings.MODE.value: list(Mode),
+        TelemetryFieldsCSVHeadings.STATE.value: list(State),
+    }
+    MODE_CODES = {mode: code for code, mode in enumerate(Mode)}
+    STATE_CODES = {state: code for code, state in enumerate(State)}
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.capacity = capacity
+        self.data = np.zeros(2 * capacity, dtype=TelemetryBuffer.DTYPE)
+        self.start = 0
+        self.end = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def nbytes(self) -> int:
+        return self.data.nbytes
+
+    def append(self, telemetries: list[Telemetry]) -> None:
+        if not telemetries:
+            return
+
+        self.count += len(telemetries)
+        telemetries = telemetries[-self.capacity :]
+        rows = np.array(
+            [
+                TelemetryBuffer.__record(row, telemetry)
+                for row, telemetry in enumerate(
+                    telemetries, self.count - len(telemetries)
+                )
+            ],
+            dtype=TelemetryBuffer.DTYPE,
+        )
+
+        count = len(rows)
+        if self.end + count > len(self.data):
+            keep = min(len(self), self.capacity - count)
+            self.data[:keep] = self.data[self.end - keep : self.end]
+            self.start, self.end = 0, keep
+
+        self.data[self.end : self.end + count] = rows
+        self.end += count
+        self.start = max(self.start, self.end - self.capacity)
+
+    @staticmethod
+    def __record(row: int, telemetry: Telemetry) -> tuple:
+        return (
+            row,
+            telemetry.team_id,
+            telemetry.mission_time,
+            telemetry.packet_count,
+            TelemetryBuffer.MODE_CODES[telemetry.mode],
+            TelemetryBuffer.STATE_CODES[telemetry.state],
+            telemetry.altitude,
+            telemetry.temperature,
+            telemetry.pressure,
+            telemetry.voltage,
+            telemetry.gyro.roll,
+            telemetry.gyro.pitch,
+            telemetry.gyro.yaw,
+            telemetry.acceleration.roll,
+            telemetry.acceleration.pitch,
+            telemetry.acceleration.yaw,
+            telemetry.magnetometer.roll,
+            telemetry.magnetometer.pitch,
+            telemetry.magnetometer.yaw,
+            telemetry.auto_gyro_rotation_rate,
+            telemetry.gps.time,
+            telemetry.gps.altitude,
+            telemetry.gps.latitude,
+            telemetry.gps.longitude,
+            telemetry.gps.sats,
+            str(telemetry.cmd_echo),
+            telemetry.descent_rate,
+            telemetry.geographic_heading,
+        )
+
+    def rows(self) -> np.ndarray:
+        return self.data[self.start : self.end]
+
+    def field(self, name: str) -> np.ndarray:
+        return self.data[name][self.start : self.end]
+
+    def since(self, count: int) -> np.ndarray:
+        return self.data[
+            max(self.start, self.end - (self.count - count)) : self.end
+        ]
+
+    def latest(self) -> dict[str, object] | None:
+        if self.end == self.start:
+            return None
+
+        values = dict(
+            zip(TelemetryBuffer.DTYPE.names, self.data[self.end - 1].item())
+        )
+        for name, members in TelemetryBuffer.CATEGORIES.items():
+            values[name] = members[values[name]]
+        return values
@@ -0,0 +1,110 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Iterator
+from digi.xbee.models.address import XBee64BitAddress
+from digi.xbee.models.message import XBeeMessage
+
+
+class VirtualRemoteDevice:
+    def __init__(self, node_id: str, address: XBee64BitAddress) -> None:
+        self.node_id = node_id
+        self.address = address
+
+    def get_node_id(self) -> str:
+        return self.node_id
+
+    def get_64bit_addr(self) -> XBee64BitAddress:
+        return self.address
+
+
+class VirtualNetwork:
+    def __init__(self, remote_device: VirtualRemoteDevice) -> None:
+        self.remote_device = remote_device
+
+    def discover_device(self, node_id: str) -> VirtualRemoteDevice | None:
+        if node_id != self.remote_device.get_node_id():
+            return None
+        return self.remote_device
+
+
+class VirtualXBeeDevice(ABC):
+    REMOTE_NODE_ID = "LEONUS_PAYLOAD"
+    REMOTE_ADDRESS = XBee64BitAddress.from_hex_string("0013A20041C0FFEE")
+
+    def __init__(self) -> None:
+        self.opened = False
+        self.callbacks: list[Callable[[XBeeMessage], None]] = []
+        self.remote_device = VirtualRemoteDevice(
+            VirtualXBeeDevice.REMOTE_NODE_ID, VirtualXBeeDevice.REMOTE_ADDRESS
+        )
+        self.network = VirtualNetwork(self.remote_device)
+        self.sent: list[str] = []
+        self.stop_event = threading.Event()
+        self.finished = threading.Event()
+        self.thread = None
+
+    @abstractmethod
+    def _messages(self) -> Iterator[tuple[float, bytes]]:
+        pass
+
+    def open(self) -> None:
+        if self.opened:
+            return
+
+        self.opened = True
+        self.stop_event.clear()
+        self.__start()
+
+    def __start(self) -> None:
+        if not self.opened or not self.callbacks or self.thread:
+            return
+
+        self.thread = threading.Thread(
+            target=self.__run, name="virtual-xbee", daemon=True
+        )
+        self.thread.start()
+
+    def close(self) -> None:
+        self.opened = False
+        self.stop_event.set()
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join()
+        self.thread = None
+
+    def is_open(self) -> bool:
+        return self.opened
+
+    def add_data_received_callback(
+        self, callback: Callable[[XBeeMessage], None]
+    ) -> None:
+        self.callbacks.append(callback)
+        self.__start()
+
+    def del_data_received_callback(
+        self, callback: Callable[[XBeeMessage], None]
+    ) -> None:
+        self.callbacks.remove(callback)
+
+    def get_network(self) -> VirtualNetwork:
+        return self.network
+
+    def send_data(self, remote_device: VirtualRemoteDevice, data: str) -> None:
+        self.sent.append(data)
+
+    def __run(self) -> None:
+        start = time.perf_counter()
+        for offset, payload in self._messages():
+            delay = start + offset - time.perf_counter()
+            if delay > 0 and self.stop_event.wait(delay):
+                return
+            if self.stop_event.is_set():
+                return
+
+            message = XBeeMessage(
+                bytearray(payload), self.remote_device, time.time()
+            )
+            for callback in self.callbacks:
+                callback(message)
+
+        self.finished.set()
@@ -0,0 +1,129 @@
+import glob
+import os
+import shutil
+import struct
+import time
+import zlib
+
+
+class WriteAheadLog:
+    EXTENSION = ".wal"
+    SEGMENT_EXTENSION = ".seg"
+    MAGIC = b"LNW1"
+    RECORD_HEADER = struct.Struct("<II")
+    SEGMENT_SIZE = 8 * 1024 * 1024
+    SYNC_INTERVAL = 0.5
+
+    def __init__(
+        self, directory: str, sync_interval: float = SYNC_INTERVAL
+    ) -> None:
+        self.directory = directory
+        self.sync_interval = sync_interval
+        self.last_sync = time.monotonic()
+        os.makedirs(self.directory, exist_ok=True)
+
+        segments = WriteAheadLog.segments(self.directory)
+        self.segment_index = (
+            WriteAheadLog.__index(segments[-1]) + 1 if segments else 1
+        )
+        self.file = self.__open_segment()
+
+    def __open_segment(self):
+        file = open(
+            os.path.join(
+                self.directory,
+                f"{self.segment_index:06d}{WriteAheadLog.SEGMENT_EXTENSION}",
+            ),
+            mode="wb",
+        )
+        file.write(WriteAheadLog.MAGIC)
+        return file
+
+    @staticmethod
+    def __index(path: str) -> int:
+        return int(os.path.splitext(os.path.basename(path))[0])
+
+    @staticmethod
+    def segments(directory: str) -> list[str]:
+        return sorted(
+            glob.glob(
+                os.path.join(directory, f"*{WriteAheadLog.SEGMENT_EXTENSION}")
+            )
+        )
+
+    def append(self, records: list[bytes]) -> None:
+        chunks = []
+        for record in records:
+            chunks.append(
+                WriteAheadLog.RECORD_HEADER.pack(
+                    len(record), zlib.crc32(record)
+                )
+            )
+            chunks.append(record)
+
+        self.file.write(b"".join(chunks))
+        self.file.flush()
+        if time.monotonic() - self.last_sync >= self.sync_interval:
+            self.sync()
+
+        if self.file.tell() >= WriteAheadLog.SEGMENT_SIZE:
+            self.sync()
+            self.file.close()
+            self.segment_index += 1
+            self.file = self.__open_segment()
+
+    def sync(self) -> None:
+        os.fsync(self.file.fileno())
+        self.last_sync = time.monotonic()
+
+    def close(self) -> None:
+        if not self.file.closed:
+            self.sync()
+            self.file.close()
+
+    def remove(self) -> None:
+        self.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    @staticmethod
+    def recover(directory: str) -> list[bytes]:
+        records = []
+        segments = WriteAheadLog.segments(directory)
+        for position, path in enumerate(segments):
+            valid_length = WriteAheadLog.__read_segment(path, records)
+            if valid_length == os.path.getsize(path):
+                continue
+
+            if valid_length <= len(WriteAheadLog.MAGIC):
+                os.remove(path)
+            else:
+                os.truncate(path, valid_length)
+            for torn in segments[position + 1 :]:
+                os.remove(torn)
+            break
+
+        return records
+
+    @staticmethod
+    def __read_segment(path: str, records: list[bytes]) -> int:
+        with open(path, mode="rb") as file:
+            data = file.read()
+
+        if not data.startswith(WriteAheadLog.MAGIC):
+            return 0
+
+        offset = len(WriteAheadLog.MAGIC)
+        header_size = WriteAheadLog.RECORD_HEADER.size
+        while len(data) - offset >= header_size:
+            length, checksum = WriteAheadLog.RECORD_HEADER.unpack_from(
+                data, offset
+            )
+            start = offset + header_size
+            record = data[start : start + length]
+            if len(record) < length or zlib.crc32(record) != checksum:
+                break
+
+            records.append(record)
+            offset = start + length
+
+        return offset
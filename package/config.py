@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from enum import Enum
 
 
@@ -5,3 +6,44 @@ class DevMode(Enum):
     LAPTOP = "laptop"
     MONITOR = "monitor"
 
+
+class OverflowPolicy(Enum):
+    DROP_OLDEST = "drop-oldest"
+    DROP_NEWEST = "drop-newest"
+    BLOCK = "block"
+
+
+class StoreBackend(Enum):
+    CSV = "csv"
+    SQLITE = "sqlite"
+
+
+@dataclass
+class Settings:
+    queue_capacity: int = 4096
+    queue_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    replay: str | None = None
+    replay_speed: float | None = 1.0
+    synthetic_rate: float | None = None
+    synthetic_loss: float = 0.0
+    synthetic_duplication: float = 0.0
+    synthetic_corruption: float = 0.0
+    synthetic_binary: bool = False
+    store_backend: StoreBackend = StoreBackend.CSV
+    csv_flush_rows: int = 256
+    csv_flush_interval: float = 1.0
+    csv_fsync_interval: float | None = None
+    wal_sync_interval: float = 0.5
+    csv_segment_bytes: int | None = None
+    csv_segment_interval: float | None = None
+    csv_compress_segments: bool = True
+    recover: bool = True
+    graph_capacity: int = 10_000
+    graph_fps: float = 10.0
+
+    def virtual_port(self) -> str | None:
+        if self.replay:
+            return self.replay
+        if self.synthetic_rate:
+            return "synthetic"
+        return None
@@ -0,0 +1,5 @@
+class TelemetryDecodeException(ValueError):
+    def __init__(
+        self, message: str = "Telemetry could not be decoded."
+    ) -> None:
+        super().__init__(message)
@@ -38,7 +38,7 @@ class State(Enum):
             return "Landed"
 
 
-@dataclass
+@dataclass(slots=True)
 class PrincipalAxesCoordinate:
     roll: float
     pitch: float
@@ -48,7 +48,7 @@ class PrincipalAxesCoordinate:
         return f"({self.roll:,}, {self.pitch:,}, {self.yaw:,})"
 
 
-@dataclass
+@dataclass(slots=True)
 class GPS:
     time: str
     altitude: float
@@ -189,7 +189,7 @@ class MechanismActuationCommand(Command):
         return f"{self.type.value}{self.device}{self.on_off}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Telemetry:
     team_id: int
     mission_time: str
@@ -227,7 +227,8 @@ class Telemetry:
     def gps_sats(self) -> int:
         return self.gps.sats
 
-    def display_number(self, number: int | float) -> str:
+    @staticmethod
+    def display_number(number: int | float) -> str:
         if number is None:
             return "NIL"
         if number == nan or str(number) == "nan":
@@ -5,9 +5,6 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
 )
 from package.communications.communication import Communication
-from package.models.telemetry import (
-    Telemetry,
-)
 from package.ui.log.log_display import LogDisplay
 from package.ui.log.log import Log
 from package.ui.telemetry.graph_view import GraphView
@@ -51,7 +48,9 @@ class Body(QWidget):
             )
         )
 
-        self.graph_view = GraphView()
+        self.graph_view = GraphView(
+            communication.settings, communication.buffer, communication.stats
+        )
         layout.addWidget(self.graph_view)
 
         self.setLayout(layout)
@@ -77,9 +76,9 @@ class Body(QWidget):
 
         return sidebar
 
-    def update(self, telemetry: Telemetry) -> None:
+    def update(self, received: int) -> None:
         self.log.update()
-        self.graph_view.update(telemetry)
+        self.graph_view.update(received)
 
     def log_display(self) -> Log:
         return self.log.log
@@ -11,8 +11,10 @@ from PyQt6.QtWidgets import (
     QListWidget,
     QDialogButtonBox,
 )
+from package.communications.bounded_queue import QueueStats
 from package.models.app_info import AppInfo
 from package.communications.communication import Communication
+from package.constants import TelemetryFieldsCSVHeadings
 from datetime import datetime
 
 
@@ -33,6 +35,7 @@ class Header(QWidget):
             f"{app_info.team_name()} {app_info.title}"
         )
         self.packet_label = QLabel()
+        self.queue_label = QLabel()
         self.time_label = QLabel(datetime.now().strftime("%H:%M:%S"))
         self.device_connection_status_button = QPushButton("GCS")
         self.device_connection_status_button.setCheckable(True)
@@ -49,7 +52,7 @@ class Header(QWidget):
             lambda: self.communication.connect_remote_device()
         )
 
-        self.packet_count = -1
+        self.packet_count = 0
 
         self.__setup_layout(app_info)
 
@@ -71,6 +74,12 @@ class Header(QWidget):
                 layout.maximumSize().width(), QSizePolicy.Policy.Maximum
             )
         )
+        layout.addWidget(
+            self.queue_label, alignment=Qt.AlignmentFlag.AlignRight
+        )
+        layout.addSpacerItem(
+            self.__create_spacer(10, QSizePolicy.Policy.Minimum)
+        )
         layout.addWidget(
             self.packet_label, alignment=Qt.AlignmentFlag.AlignRight
         )
@@ -101,9 +110,12 @@ class Header(QWidget):
         self.__update_packet()
         self.update_device_connection_status(False)
 
-    def update(self, header: tuple[int, str, int]) -> None:
-        team_id, _, packet = header
-        self.__update_team_id(team_id)
+    def update(self) -> None:
+        values = self.communication.buffer.latest()
+        if values is None:
+            return
+
+        self.__update_team_id(values[TelemetryFieldsCSVHeadings.TEAM_ID.value])
         self.__update_packet()
 
     def __update_team_id(self, team_id: int) -> None:
@@ -113,11 +125,18 @@ class Header(QWidget):
         self.time_label.setText(datetime.now().strftime("%H:%M:%S"))
 
     def __update_packet(self) -> None:
-        self.packet_count = self.packet_count + 1
+        self.packet_count = self.communication.buffer.count
         self.packet_label.setText(
             f"# of Packets Recieved: {self.packet_count}"
         )
 
+    def update_queue_status(self, queue_stats: QueueStats) -> None:
+        self.queue_label.setText(
+            f"Queue: {queue_stats.depth}/{queue_stats.capacity} "
+            f"(Peak: {queue_stats.high_water_mark}, "
+            f"Dropped: {queue_stats.dropped})"
+        )
+
     def update_device_connection_status(self, status: bool) -> None:
         self.device_connection_status_button.setChecked(status)
 
@@ -5,11 +5,11 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
 )
 from PyQt6.QtCore import Qt, QRect
+from package.communications.bounded_queue import QueueStats
 from package.communications.communication import Communication
 from package.config import DevMode
 from package.constants import GEOMETRY
 from package.models.app_info import AppInfo
-from package.models.telemetry import Telemetry
 from package.ui.header import Header
 from package.ui.body import Body
 from package.ui.log.log import Log
@@ -30,9 +30,9 @@ class MainWindow(QMainWindow):
         self.__setup_window(geometry)
         self.__setup_layout()
 
-    def update(self, telemetry: Telemetry) -> None:
-        self.header.update(telemetry.header())
-        self.body.update(telemetry)
+    def update(self, received: int) -> None:
+        self.header.update()
+        self.body.update(received)
 
     def __setup_window(self, geometry: tuple[int, int, int, int]) -> None:
         self.setWindowTitle(
@@ -80,6 +80,9 @@ class MainWindow(QMainWindow):
     def update_remote_device_connection_status(self, status: bool) -> None:
         self.header.update_remote_device_connection_status(status)
 
+    def update_queue_status(self, queue_stats: QueueStats) -> None:
+        self.header.update_queue_status(queue_stats)
+
     def is_simulation_mode(self) -> bool:
         return self.body.is_simulation_mode()
 
@@ -2,7 +2,10 @@ from math import nan
 from typing import Iterable
 import numpy as np
 import pyqtgraph as pg
+from package.communications.telemetry_buffer import TelemetryBuffer
 from package.constants import Colours
+from package.ui.telemetry.min_max_pyramid import MinMaxPyramid
+from package.ui.telemetry.window_extrema import WindowExtrema
 
 
 class CommaAxis(pg.AxisItem):
@@ -18,6 +21,8 @@ class CommaAxis(pg.AxisItem):
 class Graph(pg.PlotItem):
     LINE_COLOUR_ORDER = [Colours.RED, Colours.GREEN, Colours.NUS_BLUE]
     TIME_VIEW = 120
+    LIVE_POINTS = TIME_VIEW + 1
+    HISTORY_POINTS = 2000
     PEN_WIDTH = 3
     LEFT = "left"
     BOTTOM = "bottom"
@@ -32,7 +37,13 @@ class Graph(pg.PlotItem):
     LABEL_VERTICAL_OFFSET = 30
     LABEL_VERTICAL_SPACING = 15
 
-    def __init__(self, title: str, line_names: Iterable[str]) -> None:
+    def __init__(
+        self,
+        title: str,
+        line_names: Iterable[str],
+        fields: Iterable[str],
+        buffer: TelemetryBuffer,
+    ) -> None:
         super().__init__(
             name=title,
             title=self.__format_title(title),
@@ -56,16 +67,28 @@ class Graph(pg.PlotItem):
         )
 
         self.pointer = 0
-        self.num_lines = len(line_names)
+        self.samples = 0
         self.line_names = list(line_names)
+        self.num_lines = len(self.line_names)
+        self.fields = list(fields)
+        self.buffer = buffer
+        self.extrema = [
+            WindowExtrema(Graph.TIME_VIEW) for _ in range(self.num_lines)
+        ]
+        self.history = MinMaxPyramid(self.num_lines)
+        self.history_mode = False
+        self.x_range: tuple[float, float] | None = (
+            self.pointer,
+            self.pointer + Graph.TIME_VIEW,
+        )
+        self.y_range: tuple[float, float] | None = None
         self.graph_plots: list[pg.PlotDataItem] = []
-        self.graph_data: list[np.ndarray] = []
         self.graph_value_labels: list[pg.LabelItem] = []
 
-        self.getViewBox().setXRange(
-            self.pointer, self.pointer + Graph.TIME_VIEW
-        )
+        self.getViewBox().setXRange(*self.x_range)
+        self.getViewBox().sigXRangeChanged.connect(self.__x_range_changed)
         self.__initialize_lines()
+        self.__show_live()
 
     def __format_title(self, title: str) -> str:
         return f"<h5><b>{title}</b></h5>"
@@ -86,10 +109,6 @@ class Graph(pg.PlotItem):
         )
         self.graph_plots.append(plot)
 
-        data = np.array([])
-        self.graph_data.append(data)
-        plot.setData(data)
-
         label = self.__create_value_label(line_name, colour, index)
         self.graph_value_labels.append(label)
 
@@ -116,38 +135,106 @@ class Graph(pg.PlotItem):
             ),
         )
 
-    def update(self, values: list[float]) -> None:
-        if any(len(data) > Graph.TIME_VIEW for data in self.graph_data):
-            self.pointer += 1
-
+    def refresh(self) -> None:
+        rows = self.buffer.since(self.samples)
+        if not len(rows):
+            return
+
+        previous_samples = self.samples
+        self.__update_lines(rows, self.buffer.count - self.samples)
+        self.pointer = max(0, self.samples - Graph.TIME_VIEW - 1)
+        if not self.history_mode:
+            self.__update_view_range()
+            return
+
+        # Follow new samples while the right edge is in view; moving the
+        # range refreshes the lines through sigXRangeChanged
+        x_min, x_max = self.getViewBox().viewRange()[0]
+        if x_max >= previous_samples - 1:
+            self.getViewBox().setXRange(x_min, self.samples, padding=0)
+        else:
+            self.__update_history()
+
+    def line(self, index: int) -> np.ndarray:
+        return self.buffer.field(self.fields[index])
+
+    def set_history_mode(self, enabled: bool) -> None:
+        if enabled == self.history_mode:
+            return
+
+        self.history_mode = enabled
+        view_box = self.getViewBox()
+        if enabled:
+            view_box.setXRange(
+                0, max(self.samples, Graph.TIME_VIEW), padding=0
+            )
+            view_box.enableAutoRange(axis=pg.ViewBox.YAxis)
+            view_box.setAutoVisible(y=True)
+            self.__update_history()
+            return
+
+        view_box.setAutoVisible(y=False)
+        self.x_range = None
+        self.y_range = None
+        self.__show_live()
         self.__update_view_range()
-        self.__update_lines(values)
+
+    def __show_live(self) -> None:
+        # Only the rows in the live window are drawn, so the repaint cost
+        # does not grow with the packet rate or the buffer capacity
+        x = self.buffer.field(TelemetryBuffer.ROW)[-Graph.LIVE_POINTS :]
+        for i, plot in enumerate(self.graph_plots):
+            plot.setData(x, self.line(i)[-Graph.LIVE_POINTS :])
+
+    def __x_range_changed(self) -> None:
+        if self.history_mode:
+            self.__update_history()
+
+    def __update_history(self) -> None:
+        x_min, x_max = self.getViewBox().viewRange()[0]
+        for i, plot in enumerate(self.graph_plots):
+            plot.setData(
+                *self.history.query(i, x_min, x_max, Graph.HISTORY_POINTS)
+            )
 
     def __update_view_range(self) -> None:
-        self.getViewBox().setXRange(
-            self.pointer, self.pointer + Graph.TIME_VIEW
+        x_range = (self.pointer, self.pointer + Graph.TIME_VIEW)
+        if x_range != self.x_range:
+            self.x_range = x_range
+            self.getViewBox().setXRange(*x_range)
+
+        minima = [extrema.min() for extrema in self.extrema]
+        maxima = [extrema.max() for extrema in self.extrema]
+        y_min = min(0, min(0 if value is None else value for value in minima))
+        y_max = max(100 if value is None else value for value in maxima)
+
+        y_range = (
+            y_min * Graph.Y_RANGE_PADDING,
+            y_max * Graph.Y_RANGE_PADDING,
         )
+        if y_range != self.y_range:
+            self.y_range = y_range
+            self.getViewBox().setYRange(*y_range)
+
+    def __update_lines(self, rows: np.ndarray, count: int) -> None:
+        block = np.array([rows[field] for field in self.fields], dtype=float)
+        # Rows that left the buffer between frames are kept as gaps so the
+        # history stays aligned with the row numbers on the x axis
+        if count > len(rows):
+            self.history.extend(
+                np.full((self.num_lines, count - len(rows)), np.nan)
+            )
+        self.history.extend(block)
+        self.samples += count
 
-        y_min = min(
-            0,
-            min(
-                (data[-Graph.TIME_VIEW :].min() if len(data) > 0 else 0)
-                for data in self.graph_data
-            ),
-        )
-        y_max = max(
-            (data[-Graph.TIME_VIEW :].max() if len(data) > 0 else 100)
-            for data in self.graph_data
-        )
+        for extrema, column in zip(self.extrema, block):
+            for value in column[-Graph.TIME_VIEW :].tolist():
+                extrema.push(value)
 
-        self.getViewBox().setYRange(
-            y_min * Graph.Y_RANGE_PADDING, y_max * Graph.Y_RANGE_PADDING
-        )
+        if not self.history_mode:
+            self.__show_live()
 
-    def __update_lines(self, values: list[float]) -> None:
-        for i, value in enumerate(values):
-            self.graph_data[i] = np.append(self.graph_data[i], float(value))
-            self.graph_plots[i].setData(self.graph_data[i])
+        for i, value in enumerate(block[:, -1].tolist()):
             self.graph_value_labels[i].setText(
                 f"{self.line_names[i]}: {f"{value:,}" if value != nan else "NaN"}"
             )
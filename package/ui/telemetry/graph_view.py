@@ -4,18 +4,33 @@ from PyQt6.QtWidgets import (
     QSizePolicy,
     QFrame,
     QHBoxLayout,
+    QPushButton,
 )
 from PyQt6.QtCore import Qt, QSize
-from package.models.telemetry import Telemetry
+from package.communications.pipeline_stats import PipelineStats
+from package.communications.telemetry_buffer import TelemetryBuffer
+from package.config import Settings
 from .graph import Graph
+from .render_scheduler import RenderScheduler
 from .telemetry_display import TelemetryDisplay
-from package.constants import TelemetryFields, TelemetryUnits
+from package.constants import (
+    TelemetryFields,
+    TelemetryFieldsCSVHeadings,
+    TelemetryUnits,
+)
 import pyqtgraph as pg
 
 
 class GraphView(QWidget):
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        buffer: TelemetryBuffer,
+        stats: PipelineStats | None = None,
+    ) -> None:
         super().__init__()
+        self.settings = settings
+        self.buffer = buffer
 
         self.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
@@ -23,6 +38,9 @@ class GraphView(QWidget):
         self.setMaximumSize(QSize(int(1440 * 0.7), int(900 * 0.8)))
 
         self._setup_layout()
+        self.scheduler = RenderScheduler(
+            settings.graph_fps, self.__render, stats
+        )
 
     def _setup_layout(self) -> None:
         layout = QVBoxLayout()
@@ -48,8 +66,14 @@ class GraphView(QWidget):
         frame_layout.setContentsMargins(0, 0, 0, 0)
         frame_layout.setSpacing(5)
 
-        self.telemetry_display = TelemetryDisplay()
+        self.telemetry_display = TelemetryDisplay(self.buffer)
         frame_layout.addWidget(self.telemetry_display)
+
+        self.history_button = QPushButton("Full flight")
+        self.history_button.setCheckable(True)
+        self.history_button.setChecked(False)
+        self.history_button.toggled.connect(self.__set_history_mode)
+        frame_layout.addWidget(self.history_button)
         frame.setLayout(frame_layout)
 
         return frame
@@ -60,34 +84,62 @@ class GraphView(QWidget):
         self.altitude = Graph(
             f"{TelemetryFields.ALTITUDE.value}/{TelemetryUnits.ALTITUDE.value}",
             [TelemetryFields.ALTITUDE.value],
+            [TelemetryFieldsCSVHeadings.ALTITUDE.value],
+            self.buffer,
         )
         self.temperature = Graph(
             f"{TelemetryFields.TEMPERATURE.value}/{TelemetryUnits.TEMPERATURE.value}",
             [TelemetryFields.TEMPERATURE.value],
+            [TelemetryFieldsCSVHeadings.TEMPERATURE.value],
+            self.buffer,
         )
         self.pressure = Graph(
             f"{TelemetryFields.PRESSURE.value}/{TelemetryUnits.PRESSURE.value}",
             [TelemetryFields.PRESSURE.value],
+            [TelemetryFieldsCSVHeadings.PRESSURE.value],
+            self.buffer,
         )
         self.voltage = Graph(
             f"{TelemetryFields.VOLTAGE.value}/{TelemetryUnits.VOLTAGE.value}",
             [TelemetryFields.VOLTAGE.value],
+            [TelemetryFieldsCSVHeadings.VOLTAGE.value],
+            self.buffer,
         )
         self.gyro = Graph(
             f"{TelemetryFields.GYRO.value}/{TelemetryUnits.GYRO.value}",
             ["Roll", "Pitch", "Yaw"],
+            [
+                TelemetryFieldsCSVHeadings.GYRO_R.value,
+                TelemetryFieldsCSVHeadings.GYRO_P.value,
+                TelemetryFieldsCSVHeadings.GYRO_Y.value,
+            ],
+            self.buffer,
         )
         self.acceleration = Graph(
             f"{GraphView.__full_field_name(TelemetryFields.ACCELERATION.value)}/{TelemetryUnits.ACCELERATION.value}",
             ["Roll", "Pitch", "Yaw"],
+            [
+                TelemetryFieldsCSVHeadings.ACCEL_R.value,
+                TelemetryFieldsCSVHeadings.ACCEL_P.value,
+                TelemetryFieldsCSVHeadings.ACCEL_Y.value,
+            ],
+            self.buffer,
         )
         self.magnetometer = Graph(
             f"{GraphView.__full_field_name(TelemetryFields.MAGNETOMETER.value)}/{TelemetryUnits.MAGNETOMETER.value}",
             ["Roll", "Pitch", "Yaw"],
+            [
+                TelemetryFieldsCSVHeadings.MAG_R.value,
+                TelemetryFieldsCSVHeadings.MAG_P.value,
+                TelemetryFieldsCSVHeadings.MAG_Y.value,
+            ],
+            self.buffer,
         )
         self.gyro_rot_rate = Graph(
             f"{TelemetryFields.GYRO_ROTATION_RATE.value}/{TelemetryUnits.GYRO_ROTATION_RATE.value}",
             [TelemetryFields.GYRO_ROTATION_RATE.value],
+            [TelemetryFieldsCSVHeadings.AUTO_GYRO_ROTATION_RATE.value],
+            self.buffer,
         )
 
         graphs = [
@@ -99,6 +151,7 @@ class GraphView(QWidget):
                 self.gyro_rot_rate,
             ],
         ]
+        self.graphs = [graph for row in graphs for graph in row]
 
         for row_idx, row in enumerate(graphs):
             for col_idx, graph in enumerate(row):
@@ -114,28 +167,14 @@ class GraphView(QWidget):
             return "Magnetometer"
         return field
 
-    def update(self, telemetry: Telemetry) -> None:
-        self.telemetry_display.update(telemetry)
+    def __set_history_mode(self, enabled: bool) -> None:
+        for graph in self.graphs:
+            graph.set_history_mode(enabled)
 
-        self.altitude.update([telemetry.altitude])
-        self.temperature.update([telemetry.temperature])
-        self.pressure.update([telemetry.pressure])
-        self.voltage.update([telemetry.voltage])
-        self.gyro.update(
-            [telemetry.gyro.roll, telemetry.gyro.pitch, telemetry.gyro.yaw]
-        )
-        self.acceleration.update(
-            [
-                telemetry.acceleration.roll,
-                telemetry.acceleration.pitch,
-                telemetry.acceleration.yaw,
-            ]
-        )
-        self.magnetometer.update(
-            [
-                telemetry.magnetometer.roll,
-                telemetry.magnetometer.pitch,
-                telemetry.magnetometer.yaw,
-            ]
-        )
-        self.gyro_rot_rate.update([telemetry.auto_gyro_rotation_rate])
+    def update(self, count: int) -> None:
+        self.scheduler.submit(count)
+
+    def __render(self) -> None:
+        self.telemetry_display.update()
+        for graph in self.graphs:
+            graph.refresh()
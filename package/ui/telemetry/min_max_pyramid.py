@@ -0,0 +1,109 @@
+import math
+import numpy as np
+
+
+class MinMaxPyramid:
+    FACTOR = 4
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self, columns: int) -> None:
+        self.columns = columns
+        self.values = np.empty((columns, MinMaxPyramid.INITIAL_CAPACITY))
+        self.count = 0
+        self.minima: list[np.ndarray] = []
+        self.maxima: list[np.ndarray] = []
+        self.counts: list[int] = []
+
+    def __len__(self) -> int:
+        return self.count
+
+    @staticmethod
+    def __append(
+        array: np.ndarray, count: int, block: np.ndarray
+    ) -> np.ndarray:
+        end = count + block.shape[1]
+        if end > array.shape[1]:
+            grown = np.empty((array.shape[0], max(end, 2 * array.shape[1])))
+            grown[:, :count] = array[:, :count]
+            array = grown
+        array[:, count:end] = block
+        return array
+
+    def extend(self, block: np.ndarray) -> None:
+        self.values = MinMaxPyramid.__append(self.values, self.count, block)
+        self.count += block.shape[1]
+
+        minima, maxima, count = self.values, self.values, self.count
+        level = 0
+        while count >= MinMaxPyramid.FACTOR:
+            if level == len(self.counts):
+                self.minima.append(
+                    np.empty((self.columns, MinMaxPyramid.INITIAL_CAPACITY))
+                )
+                self.maxima.append(
+                    np.empty((self.columns, MinMaxPyramid.INITIAL_CAPACITY))
+                )
+                self.counts.append(0)
+
+            done = self.counts[level]
+            available = count // MinMaxPyramid.FACTOR
+            if available == done:
+                break
+
+            start = done * MinMaxPyramid.FACTOR
+            end = available * MinMaxPyramid.FACTOR
+            shape = (self.columns, available - done, MinMaxPyramid.FACTOR)
+            self.minima[level] = MinMaxPyramid.__append(
+                self.minima[level],
+                done,
+                np.fmin.reduce(minima[:, start:end].reshape(shape), axis=2),
+            )
+            self.maxima[level] = MinMaxPyramid.__append(
+                self.maxima[level],
+                done,
+                np.fmax.reduce(maxima[:, start:end].reshape(shape), axis=2),
+            )
+            self.counts[level] = available
+
+            minima, maxima = self.minima[level], self.maxima[level]
+            count = available
+            level += 1
+
+    def query(
+        self, column: int, start: float, end: float, max_points: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        start = min(max(0, math.floor(start)), self.count)
+        end = min(max(start, math.ceil(end) + 1), self.count)
+        span = end - start
+        if span <= max_points:
+            return (
+                np.arange(start, end, dtype=float),
+                self.values[column, start:end],
+            )
+
+        level = 0
+        while (
+            level < len(self.counts) - 1
+            and 2 * span / MinMaxPyramid.FACTOR ** (level + 1) > max_points
+        ):
+            level += 1
+        size = MinMaxPyramid.FACTOR ** (level + 1)
+
+        first = start // size
+        last = min(self.counts[level], math.ceil(end / size))
+        blocks = max(0, last - first)
+        x = np.empty(2 * blocks + 2)
+        y = np.empty(2 * blocks + 2)
+        x[0 : 2 * blocks : 2] = np.arange(first, first + blocks) * size
+        x[1 : 2 * blocks : 2] = x[0 : 2 * blocks : 2] + size / 2
+        y[0 : 2 * blocks : 2] = self.minima[level][column, first:last]
+        y[1 : 2 * blocks : 2] = self.maxima[level][column, first:last]
+
+        tail = self.values[column, max(start, last * size) : end]
+        if len(tail) == 0:
+            return x[: 2 * blocks], y[: 2 * blocks]
+
+        tail_start = max(start, last * size)
+        x[-2:] = (tail_start, (tail_start + end) / 2)
+        y[-2:] = (np.fmin.reduce(tail), np.fmax.reduce(tail))
+        return x, y
@@ -0,0 +1,52 @@
+import time
+from typing import Callable
+from PyQt6.QtCore import QTimer
+from package.communications.pipeline_stats import PipelineStats
+
+
+class RenderScheduler:
+    def __init__(
+        self,
+        fps: float,
+        render: Callable[[], None],
+        stats: PipelineStats | None = None,
+    ) -> None:
+        self.interval = 1.0 / fps
+        self.render = render
+        self.stats = stats
+        self.pending = 0
+        self.frames = 0
+        self.dropped_frames = 0
+        self.last_frame: float | None = None
+
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.__frame)
+        self.timer.start(max(1, round(self.interval * 1000)))
+
+    def submit(self, count: int) -> None:
+        self.pending += count
+
+    def __frame(self) -> None:
+        now = time.perf_counter()
+        last_frame, self.last_frame = self.last_frame, now
+        if not self.pending:
+            return
+
+        # A late tick only drops frames if there was data to draw
+        if last_frame is not None:
+            missed = round((now - last_frame) / self.interval) - 1
+            if missed > 0:
+                self.dropped_frames += missed
+                if self.stats:
+                    self.stats.frames_dropped(missed)
+
+        count, self.pending = self.pending, 0
+        self.render()
+        self.frames += 1
+        if self.stats:
+            self.stats.record(
+                PipelineStats.FRAME, time.perf_counter() - now, count
+            )
+
+    def stop(self) -> None:
+        self.timer.stop()
@@ -6,16 +6,22 @@ from PyQt6.QtWidgets import (
     QSizePolicy,
 )
 from PyQt6.QtCore import Qt
+from package.communications.telemetry_buffer import TelemetryBuffer
 from package.models.telemetry import Telemetry
 from PyQt6.QtGui import QGuiApplication
-from package.constants import TelemetryFields, TelemetryUnits
+from package.constants import (
+    TelemetryFields,
+    TelemetryFieldsCSVHeadings,
+    TelemetryUnits,
+)
 
 
 class TelemetryDisplay(QWidget):
     WIDTH_RATIO = 0.65
 
-    def __init__(self):
+    def __init__(self, buffer: TelemetryBuffer):
         super().__init__()
+        self.buffer = buffer
         self.telemetry = None
         self.labels: dict[str, tuple[QLabel, QLabel]] = {}
         self.__initialize_ui()
@@ -239,110 +245,160 @@ class TelemetryDisplay(QWidget):
         elif isinstance(value, str):
             value_label.setText(f"{value}{unit}" if value else "")
 
-    def update(self, telemetry: Telemetry) -> None:
-        self.telemetry = telemetry
+    def update(self) -> None:
+        values = self.buffer.latest()
+        if values is None:
+            return
 
         self.__update_label(
             TelemetryFields.TIME,
-            f"UTC {telemetry.mission_time}",
+            f"UTC {values[TelemetryFieldsCSVHeadings.MISSION_TIME.value]}",
             "",
         )
         self.__update_label(
             TelemetryFields.PACKET_COUNT,
-            str(telemetry.packet_count),
+            str(values[TelemetryFieldsCSVHeadings.PACKET_COUNT.value]),
             "",
         )
         self.__update_label(
             TelemetryFields.MODE,
-            telemetry.display_mode(),
+            str(values[TelemetryFieldsCSVHeadings.MODE.value]),
             "",
         )
         self.__update_label(
             TelemetryFields.STATE,
-            telemetry.display_state(),
+            str(values[TelemetryFieldsCSVHeadings.STATE.value]),
             "",
         )
         self.__update_label(
             TelemetryFields.ALTITUDE,
-            f"{telemetry.display_number(telemetry.altitude)}",
+            Telemetry.display_number(
+                values[TelemetryFieldsCSVHeadings.ALTITUDE.value]
+            ),
             TelemetryUnits.ALTITUDE.value,
         )
         self.__update_label(
             TelemetryFields.TEMPERATURE,
-            f"{telemetry.display_number(telemetry.temperature)}",
+            Telemetry.display_number(
+                values[TelemetryFieldsCSVHeadings.TEMPERATURE.value]
+            ),
             TelemetryUnits.TEMPERATURE.value,
         )
         self.__update_label(
             TelemetryFields.PRESSURE,
-            f"{telemetry.display_number(telemetry.pressure)}",
+            Telemetry.display_number(
+                values[TelemetryFieldsCSVHeadings.PRESSURE.value]
+            ),
             TelemetryUnits.PRESSURE.value,
         )
         self.__update_label(
             TelemetryFields.VOLTAGE,
-            f"{telemetry.display_number(telemetry.voltage)}",
+            Telemetry.display_number(
+                values[TelemetryFieldsCSVHeadings.VOLTAGE.value]
+            ),
             TelemetryUnits.VOLTAGE.value,
         )
         self.__update_label(
             TelemetryFields.principal_axes_str(TelemetryFields.GYRO),
-            telemetry.display_principal_axes_coordinate(telemetry.gyro),
+            TelemetryDisplay.__axes(
+                values,
+                TelemetryFieldsCSVHeadings.GYRO_R,
+                TelemetryFieldsCSVHeadings.GYRO_P,
+                TelemetryFieldsCSVHeadings.GYRO_Y,
+            ),
             TelemetryUnits.GYRO.value,
         )
         self.__update_label(
             TelemetryFields.GYRO_ROTATION_RATE,
-            f"{telemetry.display_number(telemetry.auto_gyro_rotation_rate)}",
+            Telemetry.display_number(
+                values[
+                    TelemetryFieldsCSVHeadings.AUTO_GYRO_ROTATION_RATE.value
+                ]
+            ),
             TelemetryUnits.GYRO_ROTATION_RATE.value,
         )
         self.__update_label(
             TelemetryFields.ACCELERATION,
-            telemetry.display_principal_axes_coordinate(
-                telemetry.acceleration
+            TelemetryDisplay.__axes(
+                values,
+                TelemetryFieldsCSVHeadings.ACCEL_R,
+                TelemetryFieldsCSVHeadings.ACCEL_P,
+                TelemetryFieldsCSVHeadings.ACCEL_Y,
             ),
             TelemetryUnits.ACCELERATION.value,
         )
         self.__update_label(
             TelemetryFields.MAGNETOMETER,
-            telemetry.display_principal_axes_coordinate(
-                telemetry.magnetometer
+            TelemetryDisplay.__axes(
+                values,
+                TelemetryFieldsCSVHeadings.MAG_R,
+                TelemetryFieldsCSVHeadings.MAG_P,
+                TelemetryFieldsCSVHeadings.MAG_Y,
             ),
             TelemetryUnits.MAGNETOMETER.value,
         )
         self.__update_label(
             TelemetryFields.GPS_TIME,
-            f"UTC {telemetry.gps.time}",
+            f"UTC {values[TelemetryFieldsCSVHeadings.GPS_TIME.value]}",
             "",
         )
         self.__update_label(
             TelemetryFields.GPS_LATITUDE,
-            f"{telemetry.display_number(telemetry.gps_latitude())}",
+            Telemetry.display_number(
+                values[TelemetryFieldsCSVHeadings.GPS_LATITUDE.value]
+            ),
             TelemetryUnits.GPS_LATITUDE.value,
         )
         self.__update_label(
             TelemetryFields.GPS_LONGITUDE,
-            f"{telemetry.display_number(telemetry.gps_longitude())}",
+            Telemetry.display_number(
+                values[TelemetryFieldsCSVHeadings.GPS_LONGITUDE.value]
+            ),
             TelemetryUnits.GPS_LONGITUDE.value,
         )
         self.__update_label(
             TelemetryFields.GPS_ALTITUDE,
-            f"{telemetry.display_number(telemetry.gps_altitude())}",
+            Telemetry.display_number(
+                values[TelemetryFieldsCSVHeadings.GPS_ALTITUDE.value]
+            ),
             TelemetryUnits.GPS_ALTITUDE.value,
         )
         self.__update_label(
             TelemetryFields.GPS_SATELLITE_NUMBER,
-            telemetry.display_number(telemetry.gps_sats()),
+            Telemetry.display_number(
+                values[TelemetryFieldsCSVHeadings.GPS_SATS.value]
+            ),
             "",
         )
         self.__update_label(
             TelemetryFields.COMMAND_ECHO,
-            str(telemetry.cmd_echo),
+            str(values[TelemetryFieldsCSVHeadings.CMD_ECHO.value]),
             "",
         )
         self.__update_label(
             TelemetryFields.DESCENT_RATE,
-            f"{telemetry.display_number(telemetry.descent_rate)}",
+            Telemetry.display_number(
+                values[TelemetryFieldsCSVHeadings.DESC_RATE.value]
+            ),
             TelemetryUnits.DESCENT_RATE.value,
         )
         self.__update_label(
             TelemetryFields.GEOGRAPHIC_HEADING,
-            f"{telemetry.display_number(telemetry.geographic_heading)}",
+            Telemetry.display_number(
+                values[TelemetryFieldsCSVHeadings.GEOG_HEAD.value]
+            ),
             TelemetryUnits.GEOGRAPHIC_HEADING.value,
         )
+
+    @staticmethod
+    def __axes(
+        values: dict[str, object],
+        roll: TelemetryFieldsCSVHeadings,
+        pitch: TelemetryFieldsCSVHeadings,
+        yaw: TelemetryFieldsCSVHeadings,
+    ) -> tuple[str, str, str]:
+        return (
+            Telemetry.display_number(values[roll.value]),
+            Telemetry.display_number(values[pitch.value]),
+            Telemetry.display_number(values[yaw.value]),
+        )
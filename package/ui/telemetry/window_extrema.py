@@ -0,0 +1,34 @@
+import math
+from collections import deque
+
+
+class WindowExtrema:
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self.index = 0
+        self.minima: deque[tuple[int, float]] = deque()
+        self.maxima: deque[tuple[int, float]] = deque()
+
+    def push(self, value: float) -> None:
+        self.index += 1
+        oldest = self.index - self.window
+        while self.minima and self.minima[0][0] <= oldest:
+            self.minima.popleft()
+        while self.maxima and self.maxima[0][0] <= oldest:
+            self.maxima.popleft()
+
+        if math.isnan(value):
+            return
+
+        while self.minima and self.minima[-1][1] >= value:
+            self.minima.pop()
+        self.minima.append((self.index, value))
+        while self.maxima and self.maxima[-1][1] <= value:
+            self.maxima.pop()
+        self.maxima.append((self.index, value))
+
+    def min(self) -> float | None:
+        return self.minima[0][1] if self.minima else None
+
+    def max(self) -> float | None:
+        return self.maxima[0][1] if self.maxima else None
@@ -1,23 +1,64 @@
 import argparse
+import glob
 import os
-import package.communications.plotter as plotter
+import re
+from package.communications.plotter import Plotter
+
+FLIGHT_CSV = re.compile(r"Flight_\d+\.csv$")
+
+
+def find_flights(paths: list[str]) -> list[str]:
+    flights = []
+    for path in paths:
+        if os.path.isdir(path):
+            flights.extend(
+                sorted(
+                    csv_file
+                    for csv_file in glob.glob(
+                        os.path.join(path, "**", "Flight_*.csv"),
+                        recursive=True,
+                    )
+                    if FLIGHT_CSV.search(csv_file)
+                )
+            )
+        else:
+            flights.append(path)
+    return flights
 
 
 def main():
     parser = argparse.ArgumentParser(
-        description="Generate plots from a CSV file"
+        description="Generate plots from one or more flight CSV files"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="Flight CSV files, or directories to search for them "
+        "(e.g. logs/)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of plotting processes (default: one per CPU).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate plots even if they are newer than the flight data.",
     )
-    parser.add_argument("csv_file", type=str, help="Path to the CSV file")
     args = parser.parse_args()
 
-    # Extract the parent directory name
-    parent_dir = os.path.basename(os.path.dirname(args.csv_file))
+    plotters = []
+    for csv_file in find_flights(args.paths):
+        # The flight directory is named after its start time
+        start_time = os.path.basename(os.path.dirname(csv_file))[-15:]
+        plotters.append(Plotter(start_time, csv_file))
 
-    # Parse the last 6 characters as start_time
-    start_time = parent_dir[-15:]
-
-    print(f"Generating plots from {args.csv_file}")
-    plotter.generate_plots(start_time, args.csv_file)
+    print(f"Generating plots for {len(plotters)} flight(s)")
+    generated = Plotter.generate_all(
+        plotters, workers=args.workers, force=args.force
+    )
+    print(f"{generated} generated, {len(plotters) - generated} up to date")
 
 
 if __name__ == "__main__":
@@ -50,3 +50,17 @@ def clearlogs(c: Context) -> None:
 @task
 def makeplots(c: Context, csv: str) -> None:
     c.run(f"python plot_maker.py {csv}", pty=True)
+
+
+@task
+def bench(c: Context, sizes: str = "", baseline: bool = False) -> None:
+    options = f" --sizes {sizes.replace(',', ' ')}" if sizes else ""
+    options += " --baseline" if baseline else ""
+    c.run(f"python -m benchmarks.suite run{options}", pty=True)
+
+
+@task
+def benchcompare(c: Context, current: str = "", threshold: str = "") -> None:
+    options = f" {current}" if current else ""
+    options += f" --threshold {threshold}" if threshold else ""
+    c.run(f"python -m benchmarks.suite compare{options}", pty=True)
@@ -0,0 +1,41 @@
+from pathlib import Path
+import pytest
+from benchmarks.decoder_benchmark import FRAME
+from package.communications.columnar_store import ColumnarStore
+from package.communications.csv_writer import CsvWriter
+from package.communications.decoder import TelemetryDecoder
+
+HEADER = [heading.value for heading, _ in TelemetryDecoder.SCHEMA]
+
+
+def row(packet_count: int) -> list:
+    values = [field.strip().decode() for field in FRAME.split(b",")]
+    values[2] = str(packet_count)
+    return [
+        (field_type(value) if field_type in (int, float) and value else value)
+        for value, (_, field_type) in zip(values, TelemetryDecoder.SCHEMA)
+    ]
+
+
+def fail_read_csv(*args, **kwargs) -> None:
+    pytest.fail("The CSV was parsed")
+
+
+def write_flight(directory: Path, rows: int, columns: bool = True) -> str:
+    directory.mkdir(parents=True, exist_ok=True)
+    csv_file = str(directory / "Flight_3171.csv")
+    writer = CsvWriter(
+        csv_file,
+        HEADER,
+        flush_rows=100,
+        flush_interval=1.0,
+        columns=(
+            ColumnarStore(str(directory / "Flight_3171.columns"))
+            if columns
+            else None
+        ),
+    )
+    for packet_count in range(rows):
+        writer.write(row(packet_count))
+    writer.close()
+    return csv_file
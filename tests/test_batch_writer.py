@@ -0,0 +1,130 @@
+import time
+from pathlib import Path
+import pytest
+from package.communications.batch_writer import BatchWriter
+from package.communications.columnar_store import ColumnarStore
+from package.communications.csv_writer import CsvWriter
+from package.communications.flight_index import FlightIndex
+from package.communications.flight_log import FlightLog
+from tests.flights import HEADER, row
+
+ROWS = [[packet_count] for packet_count in range(10)]
+
+
+class FlakyWriter(BatchWriter):
+    def __init__(
+        self, failures: int, flush_rows: int, flush_interval: float
+    ) -> None:
+        self.failures = failures
+        self.attempts = 0
+        self.written: list[list] = []
+        self.released = False
+        super().__init__("flaky-writer", flush_rows, flush_interval)
+
+    def write_rows(self, rows: list[list]) -> None:
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise OSError("No space left on device")
+        self.written.extend(rows)
+
+    def sync(self) -> None:
+        pass
+
+    def release(self) -> None:
+        self.released = True
+
+
+def log_messages(writer: BatchWriter) -> list[str]:
+    messages = []
+    while not writer.log_queue.empty():
+        messages.append(writer.log_queue.get())
+    return messages
+
+
+def test_failed_batch_is_retried() -> None:
+    writer = FlakyWriter(failures=2, flush_rows=5, flush_interval=0.01)
+    for values in ROWS:
+        writer.write(values)
+
+    deadline = time.monotonic() + 5
+    while writer.rows_written < len(ROWS) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    writer.close()
+
+    assert writer.written == ROWS
+    assert writer.rows_written == len(ROWS)
+    assert writer.error is None
+    # Only the first failure is logged, not every retry
+    assert len(log_messages(writer)) == 1
+
+
+def test_close_gives_up_after_retry_limit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(BatchWriter, "RETRY_DELAY", 0.0)
+    writer = FlakyWriter(failures=100, flush_rows=100, flush_interval=60.0)
+    for values in ROWS:
+        writer.write(values)
+
+    writer.close()
+
+    assert writer.attempts == BatchWriter.CLOSE_ATTEMPTS
+    assert writer.written == []
+    assert writer.rows_written == 0
+    assert isinstance(writer.error, OSError)
+    assert writer.released
+
+
+def test_close_flushes_pending_rows() -> None:
+    writer = FlakyWriter(failures=0, flush_rows=100, flush_interval=60.0)
+    for values in ROWS:
+        writer.write(values)
+
+    assert writer.written == []
+    writer.close()
+
+    assert writer.written == ROWS
+    assert writer.rows_written == len(ROWS)
+    assert writer.released
+
+
+def test_csv_retry_does_not_duplicate_rows(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_file = str(tmp_path / "Flight_3171.csv")
+    writer = CsvWriter(
+        csv_file,
+        HEADER,
+        flush_rows=100,
+        flush_interval=60.0,
+        columns=ColumnarStore(str(tmp_path / "Flight_3171.columns")),
+        index=FlightIndex(
+            str(tmp_path / f"Flight_3171{FlightIndex.EXTENSION}")
+        ),
+    )
+    writer.restore([row(i) for i in range(1500)])
+
+    # The CSV rows reach the file before the columnar copy fails
+    append = writer.columns.append
+
+    def fail_once(rows: list[list]) -> None:
+        monkeypatch.setattr(writer.columns, "append", append)
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(writer.columns, "append", fail_once)
+    batch = [row(i) for i in range(1500, 3000)]
+    with pytest.raises(OSError):
+        writer.restore(batch)
+    writer.restore(batch)
+    writer.close()
+
+    packet_counts = [int(values[2]) for values in FlightLog.rows(csv_file)]
+    assert packet_counts == list(range(3000))
+    assert writer.columns.rows == 3000
+
+    with open(csv_file, mode="rb") as file:
+        data = file.read()
+    assert [offset[0] for offset in writer.index.offsets] == [0, 1000, 2000]
+    for _, packet_count, byte_offset in writer.index.offsets:
+        line = data[byte_offset:].split(b"\r\n", 1)[0]
+        assert int(line.split(b",")[2]) == packet_count
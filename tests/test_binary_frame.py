@@ -0,0 +1,88 @@
+import binascii
+import pytest
+from benchmarks.decoder_benchmark import FRAME
+from package.communications.binary_frame import BinaryFrame
+from package.communications.decoder import TelemetryDecoder
+from package.exceptions.TelemetryDecodeException import (
+    TelemetryDecodeException,
+)
+
+TELEMETRY = TelemetryDecoder().decode(FRAME)
+
+
+def test_round_trip() -> None:
+    frame = BinaryFrame.encode(TELEMETRY)
+
+    assert BinaryFrame.frame_size(frame) == len(frame)
+    assert BinaryFrame.decode(frame) == TELEMETRY
+
+
+def test_decoder_accepts_binary_frames() -> None:
+    frame = BinaryFrame.encode(TELEMETRY)
+
+    assert TelemetryDecoder().decode(frame) == TELEMETRY
+
+
+def test_checksum_is_crc_of_frame() -> None:
+    frame = BinaryFrame.encode(TELEMETRY)
+
+    assert int.from_bytes(frame[-2:], "little") == binascii.crc_hqx(
+        frame[:-2], BinaryFrame.CRC_SEED
+    )
+    assert BinaryFrame.is_valid(frame)
+
+
+@pytest.mark.parametrize(
+    "index", [1, BinaryFrame.HEADER.size, -len(TELEMETRY.cmd_echo) - 3, -1]
+)
+def test_corrupted_frame_is_rejected(index: int) -> None:
+    frame = bytearray(BinaryFrame.encode(TELEMETRY))
+    frame[index] ^= 0x01
+
+    assert not BinaryFrame.is_valid(frame)
+    with pytest.raises(TelemetryDecodeException):
+        BinaryFrame.decode(bytes(frame))
+
+
+def test_truncated_frame_is_rejected() -> None:
+    frame = BinaryFrame.encode(TELEMETRY)
+
+    assert BinaryFrame.frame_size(frame[:2]) is None
+    with pytest.raises(TelemetryDecodeException):
+        BinaryFrame.decode(frame[:-1])
+
+
+def test_out_of_range_values_are_not_encoded() -> None:
+    telemetry = TelemetryDecoder().decode(FRAME)
+    telemetry.altitude = 10_000.0
+
+    with pytest.raises(ValueError):
+        BinaryFrame.encode(telemetry)
+
+
+@pytest.mark.parametrize("rate", [-1450.0, -3276.7, 3276.7])
+def test_signed_rotation_rate_round_trips(rate: float) -> None:
+    telemetry = TelemetryDecoder().decode(FRAME)
+    telemetry.auto_gyro_rotation_rate = rate
+
+    decoded = BinaryFrame.decode(BinaryFrame.encode(telemetry))
+
+    assert decoded.auto_gyro_rotation_rate == rate
+
+
+@pytest.mark.parametrize("rate", [-3276.9, 3276.9])
+def test_out_of_range_rotation_rate_is_not_encoded(rate: float) -> None:
+    telemetry = TelemetryDecoder().decode(FRAME)
+    telemetry.auto_gyro_rotation_rate = rate
+
+    with pytest.raises(ValueError):
+        BinaryFrame.encode(telemetry)
+
+
+def test_other_frame_version_is_rejected() -> None:
+    frame = bytearray(BinaryFrame.encode(TELEMETRY))
+    frame[1] = BinaryFrame.VERSION - 1
+
+    assert BinaryFrame.frame_size(frame) == 0
+    with pytest.raises(TelemetryDecodeException, match="version"):
+        BinaryFrame.decode(bytes(frame))
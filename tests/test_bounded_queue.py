@@ -0,0 +1,83 @@
+import queue
+import threading
+import pytest
+from package.communications.bounded_queue import BoundedQueue
+from package.config import OverflowPolicy
+
+
+def fill(policy: OverflowPolicy) -> BoundedQueue[int]:
+    bounded_queue = BoundedQueue(2, policy)
+    bounded_queue.put(1)
+    bounded_queue.put(2)
+    return bounded_queue
+
+
+def drain(bounded_queue: BoundedQueue[int]) -> list[int]:
+    items = []
+    while not bounded_queue.empty():
+        items.append(bounded_queue.get_nowait())
+    return items
+
+
+def test_drop_oldest_keeps_newest_items() -> None:
+    bounded_queue = fill(OverflowPolicy.DROP_OLDEST)
+
+    assert bounded_queue.put(3)
+    assert drain(bounded_queue) == [2, 3]
+    assert bounded_queue.stats().dropped == 1
+
+
+def test_drop_newest_rejects_new_items() -> None:
+    bounded_queue = fill(OverflowPolicy.DROP_NEWEST)
+
+    assert not bounded_queue.put(3)
+    assert drain(bounded_queue) == [1, 2]
+    assert bounded_queue.stats().dropped == 1
+
+
+def test_block_waits_for_space() -> None:
+    bounded_queue = fill(OverflowPolicy.BLOCK)
+    producer = threading.Thread(target=bounded_queue.put, args=(3,))
+    producer.start()
+    producer.join(0.05)
+
+    assert producer.is_alive()
+    assert bounded_queue.get(timeout=1) == 1
+    producer.join(1)
+    assert not producer.is_alive()
+    assert drain(bounded_queue) == [2, 3]
+    assert bounded_queue.stats().dropped == 0
+
+
+def test_close_releases_blocked_producer() -> None:
+    bounded_queue = fill(OverflowPolicy.BLOCK)
+    results = []
+    producer = threading.Thread(
+        target=lambda: results.append(bounded_queue.put(3))
+    )
+    producer.start()
+    producer.join(0.05)
+
+    bounded_queue.close()
+    producer.join(1)
+
+    assert results == [False]
+    assert bounded_queue.stats().dropped == 1
+
+
+def test_stats_track_high_water_mark() -> None:
+    bounded_queue = fill(OverflowPolicy.DROP_OLDEST)
+    bounded_queue.get_nowait()
+
+    stats = bounded_queue.stats()
+    assert (stats.depth, stats.capacity, stats.high_water_mark) == (1, 2, 2)
+
+
+def test_get_times_out_when_empty() -> None:
+    with pytest.raises(queue.Empty):
+        BoundedQueue(1, OverflowPolicy.BLOCK).get(timeout=0.01)
+
+
+def test_capacity_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        BoundedQueue(0, OverflowPolicy.DROP_OLDEST)
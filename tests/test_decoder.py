@@ -0,0 +1,71 @@
+import pytest
+from benchmarks.decoder_benchmark import FRAME, legacy_parse
+from package.communications.decoder import TelemetryDecoder
+from package.exceptions.TelemetryDecodeException import (
+    TelemetryDecodeException,
+)
+from package.models.telemetry import Mode, State
+
+FIELDS = FRAME.split(TelemetryDecoder.SEPARATOR)
+
+
+def frame(replacements: dict[int, bytes]) -> bytes:
+    fields = list(FIELDS)
+    for index, value in replacements.items():
+        fields[index] = value
+    return TelemetryDecoder.SEPARATOR.join(fields)
+
+
+@pytest.mark.parametrize("mode", list(Mode))
+@pytest.mark.parametrize("state", list(State))
+def test_matches_legacy_parser(mode: Mode, state: State) -> None:
+    data = frame({3: f" {mode.value}".encode(), 4: f" {state.value}".encode()})
+
+    assert TelemetryDecoder().decode(data) == legacy_parse(data.decode())
+
+
+def test_matches_legacy_parser_for_negative_values() -> None:
+    data = frame({5: b" -12.5", 18: b"-1450.0", 27: b" -3"})
+
+    assert TelemetryDecoder().decode(data) == legacy_parse(data.decode())
+
+
+def test_accepts_str_and_bytearray() -> None:
+    decoder = TelemetryDecoder()
+
+    assert decoder.decode(FRAME.decode()) == decoder.decode(FRAME)
+    assert decoder.decode(bytearray(FRAME)) == decoder.decode(FRAME)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        TelemetryDecoder.SEPARATOR.join(FIELDS[:-1]),
+        FRAME + b", 1",
+        b"",
+    ],
+    ids=["missing", "extra", "empty"],
+)
+def test_wrong_field_count(data: bytes) -> None:
+    with pytest.raises(TelemetryDecodeException, match="fields"):
+        TelemetryDecoder().decode(data)
+
+
+@pytest.mark.parametrize(
+    "replacements",
+    [{3: b" X"}, {4: b" ORBIT"}],
+    ids=["mode", "state"],
+)
+def test_unknown_enum(replacements: dict[int, bytes]) -> None:
+    with pytest.raises(TelemetryDecodeException, match="is not a valid"):
+        TelemetryDecoder().decode(frame(replacements))
+
+
+@pytest.mark.parametrize(
+    "replacements",
+    [{2: b" 12a4"}, {5: b" high"}, {23: b" "}],
+    ids=["int", "float", "blank"],
+)
+def test_non_numeric_field(replacements: dict[int, bytes]) -> None:
+    with pytest.raises(TelemetryDecodeException):
+        TelemetryDecoder().decode(frame(replacements))
@@ -0,0 +1,125 @@
+import os
+from pathlib import Path
+import pandas as pd
+import pytest
+from package.communications.columnar_store import ColumnarStore
+from package.communications.flight_cache import FlightCache
+from package.communications.flight_loader import FlightLoader
+from package.communications.wal import WriteAheadLog
+from package.constants import TelemetryFieldsCSVHeadings
+from tests.flights import fail_read_csv, row, write_flight
+
+PACKET_COUNT = TelemetryFieldsCSVHeadings.PACKET_COUNT.value
+CMD_ECHO = TelemetryFieldsCSVHeadings.CMD_ECHO.value
+
+
+def cache_flight(directory: Path, rows: int = 10) -> str:
+    csv_file = write_flight(directory, rows, columns=False)
+    FlightLoader.load(csv_file)
+    return FlightCache(csv_file).directory
+
+
+def test_load_fills_and_reuses_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_file = write_flight(tmp_path, 100, columns=False)
+    parsed = FlightLoader.load(csv_file)
+
+    assert "signature" in ColumnarStore.read_meta(
+        FlightCache(csv_file).directory
+    )
+    monkeypatch.setattr(pd, "read_csv", fail_read_csv)
+    pd.testing.assert_frame_equal(FlightLoader.load(csv_file), parsed)
+
+
+def test_appended_row_invalidates_cache(tmp_path: Path) -> None:
+    csv_file = write_flight(tmp_path, 100, columns=False)
+    FlightLoader.load(csv_file)
+    with open(csv_file, "a", newline="") as file:
+        file.write(",".join(map(str, row(100))) + "\r\n")
+
+    data = FlightLoader.load(csv_file)
+
+    assert len(data) == 101
+    assert data[PACKET_COUNT].iloc[-1] == 100
+
+
+def test_edited_csv_invalidates_cache(tmp_path: Path) -> None:
+    csv_file = write_flight(tmp_path, 100, columns=False)
+    FlightLoader.load(csv_file)
+    with open(csv_file) as file:
+        text = file.read()
+    stat = os.stat(csv_file)
+    with open(csv_file, "w", newline="") as file:
+        file.write(text.replace("CXON", "CXOF"))
+    os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    data = FlightLoader.load(csv_file, [CMD_ECHO])
+
+    assert set(data[CMD_ECHO]) == {"CXOF"}
+
+
+def test_live_store_is_adopted_when_complete(tmp_path: Path) -> None:
+    csv_file = write_flight(tmp_path, 100)
+    cache = FlightCache(csv_file)
+    signature = cache.signature()
+
+    arrays = cache.load([PACKET_COUNT], signature)
+
+    assert arrays[PACKET_COUNT].tolist() == list(range(100))
+    assert ColumnarStore.read_meta(cache.directory)["signature"] == signature
+
+
+def test_unfinished_flight_is_not_cached(tmp_path: Path) -> None:
+    csv_file = write_flight(tmp_path, 10, columns=False)
+    os.makedirs(tmp_path / f"Flight_3171{WriteAheadLog.EXTENSION}")
+
+    FlightLoader.load(csv_file)
+
+    assert not os.path.exists(FlightCache(csv_file).directory)
+
+
+def test_evict_removes_least_recently_used_caches_under_logs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    logs = tmp_path / "logs"
+    oldest = cache_flight(logs / "a")
+    newest = cache_flight(logs / "b")
+    os.utime(os.path.join(oldest, ColumnarStore.META_FILE), (1, 1))
+    (Path(oldest) / "notes.txt").write_text("kept")
+
+    live = write_flight(logs / "c", 10)
+    unfinished = cache_flight(logs / "d")
+    os.makedirs(logs / "d" / f"Flight_3171{WriteAheadLog.EXTENSION}")
+    unrelated = logs / "e" / "results.columns"
+    unrelated.mkdir(parents=True)
+    (unrelated / ColumnarStore.META_FILE).write_text("{}")
+    outside = cache_flight(tmp_path / "elsewhere")
+    os.symlink(os.path.dirname(outside), logs / "f")
+
+    assert FlightCache.evict(str(logs), max_bytes=1) == 2
+
+    assert os.listdir(oldest) == ["notes.txt"]
+    assert not os.path.exists(newest)
+    assert ColumnarStore.read_meta(FlightCache(live).directory) is not None
+    assert ColumnarStore.read_meta(unfinished) is not None
+    assert os.path.exists(unrelated / ColumnarStore.META_FILE)
+    assert ColumnarStore.read_meta(outside) is not None
+    assert os.path.exists(logs / "a" / "Flight_3171.csv")
+
+
+def test_evict_stops_once_under_budget(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    logs = tmp_path / "logs"
+    oldest = cache_flight(logs / "a")
+    newest = cache_flight(logs / "b")
+    os.utime(os.path.join(oldest, ColumnarStore.META_FILE), (1, 1))
+    budget = sum(entry.stat().st_size for entry in os.scandir(newest))
+
+    assert FlightCache.evict(str(logs), max_bytes=budget) == 1
+
+    assert not os.path.exists(oldest)
+    assert ColumnarStore.read_meta(newest) is not None
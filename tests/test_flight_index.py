@@ -0,0 +1,70 @@
+import gzip
+from pathlib import Path
+import pytest
+from package.communications.csv_writer import CsvWriter
+from package.communications.flight_index import FlightIndex
+from package.communications.flight_log import FlightLog, SegmentCompressor
+from tests.flights import HEADER, row
+
+ROWS = 3 * FlightIndex.OFFSET_INTERVAL
+BATCH_ROWS = FlightIndex.OFFSET_INTERVAL // 2
+
+
+def write_indexed_flight(directory: Path, segment_bytes: int | None) -> str:
+    csv_file = str(directory / "Flight_3171.csv")
+    index_file = str(directory / f"Flight_3171{FlightIndex.EXTENSION}")
+    writer = CsvWriter(
+        csv_file,
+        HEADER,
+        flush_rows=BATCH_ROWS,
+        flush_interval=1.0,
+        index=FlightIndex(index_file),
+        segment_bytes=segment_bytes,
+        compressor=SegmentCompressor() if segment_bytes else None,
+    )
+    for start in range(0, ROWS, BATCH_ROWS):
+        writer.restore([row(i) for i in range(start, start + BATCH_ROWS)])
+    writer.close()
+    return index_file
+
+
+def seek(index: FlightIndex, packet_count: int) -> tuple[str, int]:
+    path, offset = index.offset_for_packet(packet_count)
+    opener = (
+        gzip.open if path.endswith(FlightLog.COMPRESSED_EXTENSION) else open
+    )
+    with opener(path, mode="rb") as file:
+        file.seek(offset)
+        for skipped, line in enumerate(file):
+            if int(line.split(b",")[2]) == packet_count:
+                return path, skipped
+    pytest.fail(f"Packet {packet_count} not found after its offset")
+
+
+def test_index_summarises_flight(tmp_path: Path) -> None:
+    index = FlightIndex.load(write_indexed_flight(tmp_path, None))
+
+    assert index.rows == ROWS
+    assert (index.first_packet, index.last_packet) == (0, ROWS - 1)
+    assert [offset[0] for offset in index.offsets] == [0, 1000, 2000]
+
+
+@pytest.mark.parametrize("packet_count", [0, 999, 1000, 1500, ROWS - 1])
+def test_seek_to_packet(tmp_path: Path, packet_count: int) -> None:
+    index = FlightIndex.load(write_indexed_flight(tmp_path, None))
+
+    path, skipped = seek(index, packet_count)
+
+    assert path == str(tmp_path / "Flight_3171.csv")
+    assert skipped == packet_count % FlightIndex.OFFSET_INTERVAL
+
+
+@pytest.mark.parametrize("packet_count", [0, 700, 1234, ROWS - 1])
+def test_seek_into_rotated_segments(tmp_path: Path, packet_count: int) -> None:
+    # Every batch fills a segment, which is then compressed
+    index = FlightIndex.load(write_indexed_flight(tmp_path, 1))
+
+    path, skipped = seek(index, packet_count)
+
+    assert path.endswith(f"{packet_count // BATCH_ROWS + 1:04d}.csv.gz")
+    assert skipped == packet_count % BATCH_ROWS
@@ -0,0 +1,54 @@
+from pathlib import Path
+import pandas as pd
+import pytest
+from package.communications.flight_loader import FlightLoader
+from package.communications.flight_log import FlightLog
+from package.constants import TelemetryFieldsCSVHeadings
+from tests.flights import fail_read_csv, row, write_flight
+
+PACKET_COUNT = TelemetryFieldsCSVHeadings.PACKET_COUNT.value
+MODE = TelemetryFieldsCSVHeadings.MODE.value
+
+
+def test_count_rows_skips_header(tmp_path: Path) -> None:
+    csv_file = write_flight(tmp_path, 250)
+
+    assert FlightLog.count_rows(csv_file) == 250
+
+
+def test_load_reads_columnar_store(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_file = write_flight(tmp_path, 250)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(pd, "read_csv", fail_read_csv)
+        data = FlightLoader.load(csv_file)
+
+    pd.testing.assert_frame_equal(
+        data, FlightLoader.load(csv_file, cached=False)
+    )
+
+
+def test_load_reads_column_subset(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_file = write_flight(tmp_path, 10)
+    monkeypatch.setattr(pd, "read_csv", fail_read_csv)
+
+    data = FlightLoader.load(csv_file, [PACKET_COUNT, MODE])
+
+    assert list(data.columns) == [PACKET_COUNT, MODE]
+    assert data[PACKET_COUNT].tolist() == list(range(10))
+    assert data[MODE].dtype == FlightLoader.COLUMNS[MODE]
+
+
+def test_stale_columnar_store_falls_back_to_csv(tmp_path: Path) -> None:
+    csv_file = write_flight(tmp_path, 250)
+    with open(csv_file, "a", newline="") as file:
+        file.write(",".join(map(str, row(250))) + "\r\n")
+
+    data = FlightLoader.load(csv_file)
+
+    assert len(data) == 251
+    assert data[PACKET_COUNT].iloc[-1] == 250
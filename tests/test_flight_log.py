@@ -0,0 +1,122 @@
+import gzip
+import os
+from pathlib import Path
+from package.communications.csv_writer import CsvWriter
+from package.communications.flight_index import FlightIndex
+from package.communications.flight_log import FlightLog, SegmentCompressor
+from tests.flights import HEADER, row
+
+ROWS = 2000
+BATCH_ROWS = 300
+
+
+def write_segments(directory: Path) -> tuple[str, FlightIndex]:
+    csv_file = str(directory / "Flight_3171.csv")
+    index = FlightIndex(str(directory / f"Flight_3171{FlightIndex.EXTENSION}"))
+    # Every batch fills a segment
+    writer = CsvWriter(
+        csv_file,
+        HEADER,
+        flush_rows=BATCH_ROWS,
+        flush_interval=1.0,
+        index=index,
+        segment_bytes=1,
+        compressor=SegmentCompressor(),
+    )
+    for start in range(0, ROWS, BATCH_ROWS):
+        writer.restore(
+            [row(i) for i in range(start, min(start + BATCH_ROWS, ROWS))]
+        )
+    writer.close()
+    return csv_file, index
+
+
+def test_rotated_segments_are_compressed(tmp_path: Path) -> None:
+    csv_file, index = write_segments(tmp_path)
+
+    segments = FlightLog.closed_segments(csv_file)
+    assert len(segments) == len(index.segments)
+    assert all(
+        path.endswith(FlightLog.COMPRESSED_EXTENSION) for path in segments
+    )
+    assert not list(tmp_path.glob("*.tmp"))
+    assert [int(values[2]) for values in FlightLog.rows(csv_file)] == list(
+        range(ROWS)
+    )
+    assert FlightLog.count_rows(csv_file) == ROWS
+
+
+def test_offsets_point_into_decompressed_segments(tmp_path: Path) -> None:
+    _, index = write_segments(tmp_path)
+
+    for row_number, packet_count, byte_offset in index.offsets:
+        _, _, name = next(
+            segment
+            for segment in index.segments
+            if segment[0] <= row_number < segment[1]
+        )
+        path = FlightLog.resolve(str(tmp_path / name))
+        assert path.endswith(FlightLog.COMPRESSED_EXTENSION)
+        with gzip.open(path, mode="rb") as file:
+            file.seek(byte_offset)
+            line = file.readline()
+        assert int(line.split(b",")[2]) == packet_count
+
+
+def test_compression_keeps_segment_bytes(tmp_path: Path) -> None:
+    segment = tmp_path / "Flight_3171.0001.csv"
+    data = b"".join(f"{i},{i * 2}\r\n".encode() for i in range(10000))
+    segment.write_bytes(data)
+
+    compressor = SegmentCompressor()
+    compressor.compress(str(segment))
+    compressor.close()
+
+    assert not segment.exists()
+    with gzip.open(f"{segment}{FlightLog.COMPRESSED_EXTENSION}") as file:
+        assert file.read() == data
+
+
+def test_close_compresses_pending_segments(tmp_path: Path) -> None:
+    paths = []
+    for number in range(1, 21):
+        path = FlightLog.segment_path(
+            str(tmp_path / "Flight_3171.csv"), number
+        )
+        with open(path, mode="wb") as file:
+            file.write(b"a,b\r\n" + b"1,2\r\n" * 10000)
+        paths.append(path)
+
+    compressor = SegmentCompressor()
+    for path in paths:
+        compressor.compress(path)
+    compressor.close()
+
+    assert compressor.error is None
+    assert sorted(os.listdir(tmp_path)) == [
+        f"{os.path.basename(path)}{FlightLog.COMPRESSED_EXTENSION}"
+        for path in paths
+    ]
+    assert FlightLog.count_rows(str(tmp_path / "Flight_3171.csv")) == (
+        20 * 10000
+    )
+
+
+def test_interrupted_compression_keeps_plain_segment(tmp_path: Path) -> None:
+    csv_file = str(tmp_path / "Flight_3171.csv")
+    segment = FlightLog.segment_path(csv_file, 1)
+    with open(segment, mode="wb") as file:
+        file.write(b"a,b\r\n1,2\r\n")
+    with open(f"{segment}{FlightLog.COMPRESSED_EXTENSION}.tmp", "wb") as file:
+        file.write(b"\x1f\x8b")
+
+    assert FlightLog.closed_segments(csv_file) == [segment]
+    assert FlightLog.count_rows(csv_file) == 1
+
+
+def test_compression_error_is_kept(tmp_path: Path) -> None:
+    compressor = SegmentCompressor()
+    compressor.compress(str(tmp_path / "Flight_3171.0001.csv"))
+    compressor.close()
+
+    assert isinstance(compressor.error, FileNotFoundError)
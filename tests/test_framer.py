@@ -0,0 +1,80 @@
+from benchmarks.decoder_benchmark import FRAME
+from package.communications.binary_frame import BinaryFrame
+from package.communications.decoder import TelemetryDecoder
+from package.communications.framer import Framer
+
+SOURCE = b"\x00\x13\xa2\x00"
+
+
+def test_frame_split_across_reads() -> None:
+    framer = Framer()
+
+    assert framer.feed(SOURCE, b"<" + FRAME[:20]) == []
+    assert framer.feed(SOURCE, FRAME[20:] + b">") == [FRAME]
+    assert framer.stats.partial_frames == 1
+    assert framer.pending_bytes() == 0
+
+
+def test_frames_merged_in_one_read() -> None:
+    framer = Framer()
+
+    frames = framer.feed(SOURCE, b"<a>\r\n<b><c>")
+
+    assert frames == [b"a", b"b", b"c"]
+    assert framer.stats.frames == 3
+    assert framer.stats.merged_frames == 2
+    assert framer.stats.garbage_bytes == 0
+
+
+def test_sources_are_framed_separately() -> None:
+    framer = Framer()
+
+    assert framer.feed(SOURCE, b"<a") == []
+    assert framer.feed(b"other", b"<b>") == [b"b"]
+    assert framer.feed(SOURCE, b">") == [b"a"]
+
+
+def test_garbage_between_frames_is_discarded() -> None:
+    framer = Framer()
+
+    frames = framer.feed(SOURCE, b"noise<a>xx <b>tail")
+
+    assert frames == [b"a", b"b"]
+    assert framer.stats.garbage_bytes == len(b"noisexxtail")
+    assert framer.pending_bytes() == 0
+
+
+def test_unterminated_frame_resyncs_on_next_start() -> None:
+    framer = Framer()
+
+    assert framer.feed(SOURCE, b"<lost") == []
+    assert framer.feed(SOURCE, b"<a>") == [b"a"]
+    assert framer.stats.garbage_bytes == len(b"<lost")
+
+
+def test_oversized_frame_is_dropped() -> None:
+    framer = Framer()
+
+    assert framer.feed(SOURCE, b"<" + b"x" * Framer.MAX_FRAME_SIZE) == []
+
+    assert framer.pending_bytes() == 0
+    assert framer.feed(SOURCE, b"><a>") == [b"a"]
+
+
+def test_binary_frame_between_text_frames() -> None:
+    framer = Framer()
+    binary = BinaryFrame.encode(TelemetryDecoder().decode(FRAME))
+
+    frames = framer.feed(SOURCE, b"<a>" + binary[:10])
+    frames += framer.feed(SOURCE, binary[10:] + b"<b>")
+
+    assert frames == [b"a", binary, b"b"]
+
+
+def test_corrupt_binary_frame_is_skipped() -> None:
+    framer = Framer()
+    binary = bytearray(BinaryFrame.encode(TelemetryDecoder().decode(FRAME)))
+    binary[5] ^= 0xFF
+
+    assert framer.feed(SOURCE, bytes(binary) + b"<a>") == [b"a"]
+    assert framer.stats.garbage_bytes > 0
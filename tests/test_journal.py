@@ -0,0 +1,95 @@
+import os
+from pathlib import Path
+import pytest
+from package.communications import journal
+from package.communications.journal import Journal
+from package.communications.replay import ReplayDevice
+
+SOURCE = b"\x00\x13\xa2\x00\x41\xc0\xff\xee"
+PAYLOADS = [b"<first>\r\n", b"<second>\r\n", b"<third>\r\n"]
+
+
+def write_journal(file_path: str, payloads: list[bytes]) -> None:
+    writer = Journal(file_path)
+    for payload in payloads:
+        writer.append(SOURCE, payload)
+    writer.close()
+
+
+def payloads(file_path: str) -> list[bytes]:
+    return [entry.payload for entry in Journal.read(file_path)]
+
+
+@pytest.fixture
+def file_path(tmp_path: Path) -> str:
+    return str(tmp_path / f"Flight_3171{Journal.EXTENSION}")
+
+
+def test_entries_are_read_in_order(file_path: str) -> None:
+    write_journal(file_path, PAYLOADS)
+
+    entries = list(Journal.read(file_path))
+
+    assert [entry.payload for entry in entries] == PAYLOADS
+    assert all(entry.source == SOURCE for entry in entries)
+    timestamps = [entry.timestamp_ns for entry in entries]
+    assert timestamps == sorted(timestamps)
+
+
+@pytest.mark.parametrize(
+    "torn_tail",
+    [
+        Journal.ENTRY_HEADER.pack(0, SOURCE, 10)[:7],
+        Journal.ENTRY_HEADER.pack(0, SOURCE, 100) + b"<part",
+    ],
+    ids=["header", "payload"],
+)
+def test_torn_tail_is_truncated_on_reopen(
+    file_path: str, torn_tail: bytes
+) -> None:
+    write_journal(file_path, PAYLOADS)
+    valid_size = os.path.getsize(file_path)
+    with open(file_path, mode="ab") as file:
+        file.write(torn_tail)
+
+    assert payloads(file_path) == PAYLOADS
+
+    reopened = Journal(file_path)
+    assert os.path.getsize(file_path) == valid_size
+    reopened.append(SOURCE, b"<fourth>\r\n")
+    reopened.close()
+
+    assert payloads(file_path) == PAYLOADS + [b"<fourth>\r\n"]
+
+
+def test_torn_magic_starts_a_new_journal(file_path: str) -> None:
+    with open(file_path, mode="wb") as file:
+        file.write(Journal.MAGIC[:2])
+
+    write_journal(file_path, PAYLOADS)
+
+    assert payloads(file_path) == PAYLOADS
+
+
+def test_empty_journal(file_path: str) -> None:
+    writer = Journal(file_path)
+    assert writer.is_empty()
+    writer.append(SOURCE, PAYLOADS[0])
+    assert not writer.is_empty()
+    writer.close()
+
+    reopened = Journal(file_path)
+    assert not reopened.is_empty()
+    reopened.close()
+
+
+def test_replay_keeps_order_and_timing(
+    file_path: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    clock = iter([5_000_000_000, 5_500_000_000, 7_000_000_000])
+    monkeypatch.setattr(journal.time, "monotonic_ns", lambda: next(clock))
+    write_journal(file_path, PAYLOADS)
+
+    messages = list(ReplayDevice(file_path, 2.0)._messages())
+
+    assert messages == list(zip([0.0, 0.25, 1.0], PAYLOADS))
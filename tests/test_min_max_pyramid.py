@@ -0,0 +1,94 @@
+import math
+import numpy as np
+import pytest
+from package.ui.telemetry.min_max_pyramid import MinMaxPyramid
+
+COLUMNS = 3
+# Not a multiple of any block size, so every level has a partial block
+SAMPLES = 10_037
+
+
+@pytest.fixture(scope="module")
+def samples() -> np.ndarray:
+    generator = np.random.default_rng(3171)
+    values = generator.normal(0.0, 100.0, (COLUMNS, SAMPLES))
+    values[generator.random(values.shape) < 0.01] = np.nan
+    return values
+
+
+@pytest.fixture(scope="module")
+def pyramid(samples: np.ndarray) -> MinMaxPyramid:
+    pyramid = MinMaxPyramid(COLUMNS)
+    generator = np.random.default_rng(0)
+    start = 0
+    # Uneven blocks, like batches of packets arriving during a flight
+    while start < SAMPLES:
+        end = min(SAMPLES, start + int(generator.integers(1, 700)))
+        pyramid.extend(samples[:, start:end])
+        start = end
+    return pyramid
+
+
+def test_levels_hold_block_extremes(
+    samples: np.ndarray, pyramid: MinMaxPyramid
+) -> None:
+    assert len(pyramid) == SAMPLES
+    for level, count in enumerate(pyramid.counts):
+        size = MinMaxPyramid.FACTOR ** (level + 1)
+        assert count == SAMPLES // size
+
+        blocks = samples[:, : count * size].reshape(COLUMNS, count, size)
+        np.testing.assert_array_equal(
+            pyramid.minima[level][:, :count], np.fmin.reduce(blocks, axis=2)
+        )
+        np.testing.assert_array_equal(
+            pyramid.maxima[level][:, :count], np.fmax.reduce(blocks, axis=2)
+        )
+
+
+def test_short_range_returns_raw_samples(
+    samples: np.ndarray, pyramid: MinMaxPyramid
+) -> None:
+    x, y = pyramid.query(1, 100.5, 140.2, 100)
+
+    np.testing.assert_array_equal(x, np.arange(100, 142))
+    np.testing.assert_array_equal(y, samples[1, 100:142])
+
+
+@pytest.mark.parametrize(
+    "start, end, max_points, size",
+    [
+        # 8,644 samples need blocks of 256 to fit in 200 points
+        (1234.6, 9876.2, 200, 256),
+        # Runs past the last complete block into the raw tail
+        (9000.0, SAMPLES - 1, 50, 64),
+    ],
+)
+def test_zoomed_range_envelope(
+    samples: np.ndarray,
+    pyramid: MinMaxPyramid,
+    start: float,
+    end: float,
+    max_points: int,
+    size: int,
+) -> None:
+    column = 2
+    x, y = pyramid.query(column, start, end, max_points)
+
+    assert x[2] - x[0] == size
+    assert np.all(np.diff(x) > 0)
+    assert len(x) <= max_points + 6
+
+    level = round(math.log(size, MinMaxPyramid.FACTOR)) - 1
+    first = math.floor(start) // size
+    complete = pyramid.counts[level] * size
+    for sample in range(math.floor(start), min(math.ceil(end) + 1, SAMPLES)):
+        value = samples[column, sample]
+        if np.isnan(value):
+            continue
+        if sample < complete:
+            block = sample // size - first
+            low, high = y[2 * block], y[2 * block + 1]
+        else:
+            low, high = y[-2], y[-1]
+        assert low <= value <= high
@@ -0,0 +1,58 @@
+import time
+from benchmarks.decoder_benchmark import FRAME
+from package.communications.pipeline_stats import PipelineStats
+from package.communications.receiver import Receiver
+from package.config import OverflowPolicy
+
+
+class Device:
+    def is_open(self) -> bool:
+        return True
+
+    def add_data_received_callback(self, callback) -> None:
+        pass
+
+
+def frame(packet_count: int) -> bytes:
+    fields = FRAME.split(b",")
+    fields[2] = b" %d" % packet_count
+    return b",".join(fields)
+
+
+def receiver(stats: PipelineStats, packets: range) -> Receiver:
+    receiver = Receiver(Device(), 100, OverflowPolicy.BLOCK, stats=stats)
+    for packet_count in packets:
+        receiver.data_queue.put((time.perf_counter(), frame(packet_count)))
+    return receiver
+
+
+def test_single_batch_is_timed_from_dequeue() -> None:
+    stats = PipelineStats()
+    telemetries = receiver(stats, range(50)).receive_batch()
+    stats.processed(len(telemetries))
+
+    assert stats.packets == 50
+    assert stats.started_at < stats.last_processed_at
+    assert stats.throughput() > 0
+    assert " at 0.0 packets/s" not in stats.report()
+
+
+def test_clock_starts_at_first_dequeue() -> None:
+    stats = PipelineStats()
+    source = receiver(stats, range(50))
+
+    first = source.receive_batch(max_items=10)
+    started_at = stats.started_at
+    stats.processed(len(first))
+    rest = source.receive_batch()
+    stats.processed(len(rest))
+
+    assert stats.started_at == started_at
+    assert stats.packets == 50
+    assert stats.throughput() == 50 / (
+        stats.last_processed_at - stats.started_at
+    )
+
+
+def test_no_packets_has_no_throughput() -> None:
+    assert PipelineStats().throughput() == 0.0
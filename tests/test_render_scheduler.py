@@ -0,0 +1,80 @@
+import pytest
+from PyQt6.QtCore import QCoreApplication
+from package.communications.pipeline_stats import PipelineStats
+from package.ui.telemetry import render_scheduler
+from package.ui.telemetry.render_scheduler import RenderScheduler
+
+FPS = 10
+APP = QCoreApplication.instance() or QCoreApplication([])
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(render_scheduler.time, "perf_counter", clock)
+    return clock
+
+
+@pytest.fixture
+def scheduler() -> RenderScheduler:
+    scheduler = RenderScheduler(FPS, lambda: None, PipelineStats())
+    scheduler.stop()
+    return scheduler
+
+
+def tick(scheduler: RenderScheduler, clock: Clock, seconds: float) -> None:
+    clock.now += seconds
+    scheduler.timer.timeout.emit()
+
+
+def test_submissions_are_coalesced_into_one_frame(
+    scheduler: RenderScheduler, clock: Clock
+) -> None:
+    for _ in range(100):
+        scheduler.submit(1)
+    tick(scheduler, clock, 1 / FPS)
+
+    assert scheduler.frames == 1
+    assert scheduler.pending == 0
+    assert scheduler.stats.stages[PipelineStats.FRAME].packets == 100
+
+
+def test_idle_ticks_do_not_render_or_drop(
+    scheduler: RenderScheduler, clock: Clock
+) -> None:
+    tick(scheduler, clock, 1 / FPS)
+    tick(scheduler, clock, 5.0)
+
+    assert scheduler.frames == 0
+    assert scheduler.dropped_frames == 0
+
+
+def test_late_tick_with_pending_data_counts_dropped_frames(
+    scheduler: RenderScheduler, clock: Clock
+) -> None:
+    tick(scheduler, clock, 1 / FPS)
+    scheduler.submit(1)
+    tick(scheduler, clock, 4 / FPS)
+
+    assert scheduler.frames == 1
+    assert scheduler.dropped_frames == 3
+    assert scheduler.stats.dropped_frames == 3
+
+
+def test_on_time_ticks_drop_nothing(
+    scheduler: RenderScheduler, clock: Clock
+) -> None:
+    for _ in range(5):
+        scheduler.submit(10)
+        tick(scheduler, clock, 1 / FPS)
+
+    assert scheduler.frames == 5
+    assert scheduler.dropped_frames == 0
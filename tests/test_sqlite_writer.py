@@ -0,0 +1,100 @@
+import os
+import shutil
+from pathlib import Path
+from package.communications.flight_loader import FlightLoader
+from package.communications.sqlite_writer import SqliteWriter
+from package.constants import TelemetryFieldsCSVHeadings
+from package.models.telemetry import State
+from tests.flights import row
+
+FLIGHT = "20261018_120000"
+OTHER_FLIGHT = "20251018_120000"
+
+
+def flight_row(packet_count: int) -> list:
+    values = row(packet_count)
+    values[1] = f"12:{packet_count // 60:02}:{packet_count % 60:02}"
+    values[4] = (State.ASCENT if packet_count < 50 else State.DESCENT).value
+    return values
+
+
+def write_flight(
+    database_path: str, flight_id: str, rows: range, close: bool = True
+) -> SqliteWriter:
+    writer = SqliteWriter(database_path, flight_id, 100, 1.0)
+    writer.restore([flight_row(i) for i in rows])
+    if close:
+        writer.close()
+    return writer
+
+
+def all_rows(database_path: str, flight_id: str) -> list[tuple]:
+    return SqliteWriter.time_range(
+        database_path, flight_id, "00:00:00", "23:59:59"
+    )
+
+
+def test_flights_are_listed_once(tmp_path: Path) -> None:
+    database_path = str(tmp_path / "telemetry.sqlite3")
+    write_flight(database_path, FLIGHT, range(10))
+    write_flight(database_path, OTHER_FLIGHT, range(10))
+
+    assert SqliteWriter.flights(database_path) == [OTHER_FLIGHT, FLIGHT]
+
+
+def test_time_range_is_inclusive_and_per_flight(tmp_path: Path) -> None:
+    database_path = str(tmp_path / "telemetry.sqlite3")
+    write_flight(database_path, FLIGHT, range(100))
+    write_flight(database_path, OTHER_FLIGHT, range(100))
+
+    rows = SqliteWriter.time_range(
+        database_path, FLIGHT, "12:00:10", "12:00:19"
+    )
+
+    assert rows == [tuple(flight_row(i)) for i in range(10, 20)]
+
+
+def test_in_state_selects_rows_in_order(tmp_path: Path) -> None:
+    database_path = str(tmp_path / "telemetry.sqlite3")
+    write_flight(database_path, FLIGHT, range(100))
+
+    rows = SqliteWriter.in_state(database_path, FLIGHT, State.DESCENT)
+
+    assert rows == [tuple(flight_row(i)) for i in range(50, 100)]
+    assert SqliteWriter.in_state(database_path, FLIGHT, State.LANDED) == []
+
+
+def test_export_csv_matches_written_rows(tmp_path: Path) -> None:
+    database_path = str(tmp_path / "telemetry.sqlite3")
+    write_flight(database_path, FLIGHT, range(100))
+    csv_file = str(tmp_path / "Flight_3171.csv")
+
+    assert SqliteWriter.export_csv(database_path, FLIGHT, csv_file) == 100
+    data = FlightLoader.load(csv_file, cached=False)
+    assert data[
+        TelemetryFieldsCSVHeadings.PACKET_COUNT.value
+    ].tolist() == list(range(100))
+
+
+def test_restore_after_crash_replaces_partial_flight(tmp_path: Path) -> None:
+    database_path = str(tmp_path / "telemetry.sqlite3")
+    write_flight(database_path, OTHER_FLIGHT, range(10))
+    writer = write_flight(database_path, FLIGHT, range(60), close=False)
+
+    # A crash leaves the database and its uncheckpointed WAL on disk
+    crashed = tmp_path / "crashed"
+    crashed.mkdir()
+    for suffix in ("", "-wal"):
+        shutil.copy(f"{database_path}{suffix}", crashed)
+    writer.close()
+    crashed_path = str(crashed / "telemetry.sqlite3")
+    assert len(all_rows(crashed_path, FLIGHT)) == 60
+
+    write_flight(crashed_path, FLIGHT, range(100))
+
+    assert all_rows(crashed_path, FLIGHT) == [
+        tuple(flight_row(i)) for i in range(100)
+    ]
+    assert len(all_rows(crashed_path, OTHER_FLIGHT)) == 10
+    wal_path = f"{crashed_path}-wal"
+    assert not os.path.exists(wal_path) or os.path.getsize(wal_path) == 0
@@ -0,0 +1,94 @@
+import random
+import numpy as np
+import pytest
+from package.communications.decoder import TelemetryDecoder
+from package.communications.telemetry_buffer import TelemetryBuffer
+from package.constants import TelemetryFieldsCSVHeadings
+from package.models.telemetry import Mode, State, Telemetry
+from tests.flights import row
+
+CAPACITY = 10
+PACKET_COUNT = TelemetryFieldsCSVHeadings.PACKET_COUNT.value
+DECODER = TelemetryDecoder()
+
+
+def telemetries(start: int, end: int) -> list[Telemetry]:
+    return [
+        DECODER.decode(",".join(map(str, row(packet_count))))
+        for packet_count in range(start, end)
+    ]
+
+
+def assert_holds(buffer: TelemetryBuffer, start: int, end: int) -> None:
+    expected = list(range(start, end))
+    assert len(buffer) == end - start
+    for name in (TelemetryBuffer.ROW, PACKET_COUNT):
+        field = buffer.field(name)
+        # A view into the buffer, not a copy stitched together at the wrap
+        assert np.shares_memory(field, buffer.data)
+        assert field.tolist() == expected
+
+
+@pytest.mark.parametrize("batch", [1, 3, CAPACITY - 1, CAPACITY])
+def test_append_across_wrap(batch: int) -> None:
+    buffer = TelemetryBuffer(CAPACITY)
+
+    for start in range(0, 5 * CAPACITY, batch):
+        buffer.append(telemetries(start, start + batch))
+        end = start + batch
+        assert_holds(buffer, max(0, end - CAPACITY), end)
+
+    assert buffer.count == end
+
+
+def test_batch_larger_than_capacity() -> None:
+    buffer = TelemetryBuffer(CAPACITY)
+    buffer.append(telemetries(0, 4))
+
+    buffer.append(telemetries(4, 4 + 3 * CAPACITY))
+
+    end = 4 + 3 * CAPACITY
+    assert_holds(buffer, end - CAPACITY, end)
+    assert buffer.count == end
+    assert buffer.since(end - 3)[TelemetryBuffer.ROW].tolist() == [
+        end - 3,
+        end - 2,
+        end - 1,
+    ]
+    assert len(buffer.since(0)) == CAPACITY
+
+
+def test_random_batches_stay_ordered() -> None:
+    generator = random.Random(3171)
+    buffer = TelemetryBuffer(CAPACITY)
+    end = 0
+
+    for _ in range(200):
+        batch = generator.randint(0, 2 * CAPACITY)
+        buffer.append(telemetries(end, end + batch))
+        end += batch
+        assert_holds(buffer, max(0, end - CAPACITY), end)
+
+
+def test_since_returns_only_new_rows() -> None:
+    buffer = TelemetryBuffer(CAPACITY)
+    buffer.append(telemetries(0, 7))
+    seen = buffer.count
+
+    buffer.append(telemetries(7, 12))
+
+    assert buffer.since(seen)[PACKET_COUNT].tolist() == list(range(7, 12))
+    assert len(buffer.since(buffer.count)) == 0
+
+
+def test_latest_decodes_categories() -> None:
+    buffer = TelemetryBuffer(CAPACITY)
+    assert buffer.latest() is None
+
+    buffer.append(telemetries(0, 2 * CAPACITY + 1))
+
+    latest = buffer.latest()
+    assert latest[TelemetryBuffer.ROW] == 2 * CAPACITY
+    assert latest[PACKET_COUNT] == 2 * CAPACITY
+    assert latest[TelemetryFieldsCSVHeadings.MODE.value] is Mode.FLIGHT
+    assert latest[TelemetryFieldsCSVHeadings.STATE.value] is State.DESCENT
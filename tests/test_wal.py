@@ -0,0 +1,81 @@
+import os
+from pathlib import Path
+from package.communications.wal import WriteAheadLog
+
+RECORDS = [b"first", b"second", b"third"]
+
+
+def test_recover_clean_log(tmp_path: Path) -> None:
+    wal = WriteAheadLog(str(tmp_path))
+    wal.append(RECORDS[:2])
+    wal.append(RECORDS[2:])
+    wal.close()
+
+    assert WriteAheadLog.recover(str(tmp_path)) == RECORDS
+
+
+def test_torn_header_is_truncated(tmp_path: Path) -> None:
+    wal = WriteAheadLog(str(tmp_path))
+    wal.append(RECORDS)
+    wal.close()
+    (segment,) = WriteAheadLog.segments(str(tmp_path))
+    valid_size = os.path.getsize(segment)
+    with open(segment, mode="ab") as file:
+        file.write(WriteAheadLog.RECORD_HEADER.pack(10, 0)[:5])
+
+    assert WriteAheadLog.recover(str(tmp_path)) == RECORDS
+    assert os.path.getsize(segment) == valid_size
+
+
+def test_torn_record_is_truncated(tmp_path: Path) -> None:
+    wal = WriteAheadLog(str(tmp_path))
+    wal.append(RECORDS)
+    wal.close()
+    (segment,) = WriteAheadLog.segments(str(tmp_path))
+    valid_size = os.path.getsize(segment)
+    with open(segment, mode="ab") as file:
+        file.write(WriteAheadLog.RECORD_HEADER.pack(100, 0) + b"partial")
+
+    assert WriteAheadLog.recover(str(tmp_path)) == RECORDS
+    assert os.path.getsize(segment) == valid_size
+    assert WriteAheadLog.recover(str(tmp_path)) == RECORDS
+
+
+def test_corrupt_record_drops_the_rest_of_the_log(tmp_path: Path) -> None:
+    for records in (RECORDS, [b"later"]):
+        wal = WriteAheadLog(str(tmp_path))
+        wal.append(records)
+        wal.close()
+    first, second = WriteAheadLog.segments(str(tmp_path))
+    with open(first, mode="r+b") as file:
+        file.seek(-1, os.SEEK_END)
+        file.write(b"\x00")
+
+    assert WriteAheadLog.recover(str(tmp_path)) == RECORDS[:2]
+    assert WriteAheadLog.segments(str(tmp_path)) == [first]
+
+
+def test_empty_torn_segment_is_removed(tmp_path: Path) -> None:
+    wal = WriteAheadLog(str(tmp_path))
+    wal.append(RECORDS)
+    wal.close()
+    torn = os.path.join(str(tmp_path), "000002.seg")
+    with open(torn, mode="wb") as file:
+        file.write(WriteAheadLog.MAGIC[:2])
+
+    assert WriteAheadLog.recover(str(tmp_path)) == RECORDS
+    assert not os.path.exists(torn)
+
+
+def test_new_log_continues_after_recovered_segments(tmp_path: Path) -> None:
+    wal = WriteAheadLog(str(tmp_path))
+    wal.append(RECORDS[:1])
+    wal.close()
+    WriteAheadLog.recover(str(tmp_path))
+
+    wal = WriteAheadLog(str(tmp_path))
+    wal.append(RECORDS[1:])
+    wal.close()
+
+    assert len(WriteAheadLog.segments(str(tmp_path))) == 2
+    assert WriteAheadLog.recover(str(tmp_path)) == RECORDS
@@ -0,0 +1,60 @@
+import math
+import random
+import pytest
+from package.ui.telemetry.window_extrema import WindowExtrema
+
+
+def brute_force(
+    values: list[float], window: int
+) -> tuple[float | None, float | None]:
+    finite = [value for value in values[-window:] if not math.isnan(value)]
+    if not finite:
+        return None, None
+    return min(finite), max(finite)
+
+
+@pytest.mark.parametrize("window", [1, 2, 7, 100])
+def test_matches_brute_force(window: int) -> None:
+    generator = random.Random(window)
+    extrema = WindowExtrema(window)
+    values: list[float] = []
+
+    for _ in range(2000):
+        value = generator.choice(
+            [
+                generator.uniform(-1000.0, 1000.0),
+                # Repeated values exercise ties when popping the deques
+                float(generator.randint(-3, 3)),
+                math.nan,
+            ]
+        )
+        extrema.push(value)
+        values.append(value)
+
+        assert (extrema.min(), extrema.max()) == brute_force(values, window)
+
+
+def test_extremes_leave_the_window() -> None:
+    extrema = WindowExtrema(3)
+
+    for value in [100.0, 1.0, 2.0]:
+        extrema.push(value)
+    assert (extrema.min(), extrema.max()) == (1.0, 100.0)
+
+    extrema.push(3.0)
+    assert (extrema.min(), extrema.max()) == (1.0, 3.0)
+
+    extrema.push(4.0)
+    extrema.push(5.0)
+    assert (extrema.min(), extrema.max()) == (3.0, 5.0)
+
+
+def test_window_of_only_nan_is_empty() -> None:
+    extrema = WindowExtrema(2)
+    extrema.push(1.0)
+
+    extrema.push(math.nan)
+    assert (extrema.min(), extrema.max()) == (1.0, 1.0)
+
+    extrema.push(math.nan)
+    assert (extrema.min(), extrema.max()) == (None, None)